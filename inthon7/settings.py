@@ -104,6 +104,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 영속 커넥션: 요청/Celery 태스크마다 DB 연결(핸드셰이크)을 새로 맺지 않고 재사용
+        # - CONN_HEALTH_CHECKS로 재사용 전에 끊긴 연결인지 확인
+        # - ASGI 서버에서 pgbouncer 등 외부 풀러를 쓰는 경우 DJANGO_DB_CONN_MAX_AGE=0 권장
+        'CONN_MAX_AGE': int(os.environ.get("DJANGO_DB_CONN_MAX_AGE", "60")),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -155,13 +160,22 @@ REDIS_URL = os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/0")
 
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        # channels_redis.core.RedisChannelLayer + 여러 그룹 전송 파이프라인(group_send_many)
+        "BACKEND": "lecture.channel_layers.PipelinedRedisChannelLayer",
         "CONFIG": {
             "hosts": [REDIS_URL],
         },
     }
 }
 
+# Django 캐시 (Redis) - LLM 응답 캐시 등에 사용
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("CACHE_REDIS_URL", REDIS_URL),
+    }
+}
+
 # Celery 설정 (Redis를 브로커/결과 백엔드로 사용)
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", REDIS_URL)
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", REDIS_URL)
@@ -211,9 +225,19 @@ MEDIA_URL = f"https://storage.googleapis.com/{GS_BUCKET_NAME}/"
 # URL에 서명 쿼리스트링을 붙이지 않도록 설정
 GS_QUERYSTRING_AUTH = False
 
+# 스크린샷 업로드는 요청 스레드에서 바이트를 Redis로 넘기고 Celery가 GCS에 올리므로
+# 기본값(2.5MB)을 넘는 캡처도 /tmp 스풀(디스크 쓰기 + 다시 읽기) 없이 메모리에서 바로 처리
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(
+    os.environ.get("DJANGO_FILE_UPLOAD_MAX_MEMORY_SIZE", str(10 * 1024 * 1024))
+)
+
 # Django REST framework / OpenAPI 설정
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        "lecture.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 SPECTACULAR_SETTINGS = {
@@ -5,17 +5,32 @@ This package contains:
 - llm_client: low-level Gemini client wrapper
 - clean: question cleaning helper
 - answer: question answering helper
+- pipeline: concurrent clean + answer pipeline (process_question)
+- summarize_image / batcher: image summary helper and its async batcher
 - prompt_templates: system/user prompt templates
+
+Async code (e.g. Channels consumers) must await aclean_question /
+aanswer_question instead of calling the sync helpers, which would block
+the event loop for the whole Gemini round trip.
 """
 
-from .clean import clean_question
-from .answer import answer_question
+from .clean import clean_question, aclean_question, clean_questions_batch
+from .answer import answer_question, aanswer_question, answer_question_stream
+from .pipeline import process_question
+from .summarize_image import summarize_image, asummarize_image
 from .llm_client import LLMClient
 
 
 __all__ = [
     'clean_question',
+    'aclean_question',
+    'clean_questions_batch',
     'answer_question',
+    'aanswer_question',
+    'answer_question_stream',
+    'process_question',
+    'summarize_image',
+    'asummarize_image',
     'LLMClient',
 ]
 
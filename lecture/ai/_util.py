@@ -0,0 +1,30 @@
+"""
+AI 모듈 공용 유틸리티
+"""
+
+import re
+from pathlib import Path
+from typing import Optional, Union
+
+
+# 공백이 아닌 문자 (빈 문자열 검사용 - strip() 복사 없이 첫 문자에서 종료)
+_NONWS_RE = re.compile(r"\S")
+
+
+def is_blank(text: Optional[str]) -> bool:
+    """None, 빈 문자열, 공백으로만 이루어진 문자열이면 True"""
+    return not text or _NONWS_RE.search(text) is None
+
+
+def normalize_image_path(image_path: Optional[Union[str, Path]]) -> Optional[str]:
+    """
+    image_path를 LLMClient에 넘길 문자열로 정규화
+
+    Path는 그대로 문자열로, 문자열은 앞뒤 공백을 제거하며
+    None/빈 문자열이면 None을 반환합니다.
+    """
+    if isinstance(image_path, str):
+        return image_path.strip() or None
+    if image_path is None:
+        return None
+    return str(image_path)
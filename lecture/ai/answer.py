@@ -6,10 +6,13 @@ Question Answering Module
 교수님 화면 캡쳐 이미지를 고려하여 답변 생성
 """
 
-from typing import Optional, Union, Any
+from typing import Optional, Union, Any, Dict, Iterator
 from pathlib import Path
 
-from .llm_client import LLMClient, get_default_client
+from asgiref.sync import sync_to_async
+
+from ._util import is_blank, normalize_image_path
+from .llm_client import LLMClient, get_flash_client
 from .prompt_templates import get_answer_question_prompt
 
 
@@ -22,6 +25,8 @@ def answer_question(
     temperature: float = 0.7,
     max_tokens: Optional[int] = 65000,
     subject_name: Optional[str] = None,
+    use_cache: bool = True,
+    subject_info: Optional[str] = None,
 ) -> str:
     """
     학생 질문에 대해 교수님 역할로 답변을 생성합니다. 교수님 화면 캡쳐 이미지를 고려하여 답변할 수 있습니다.
@@ -35,6 +40,8 @@ def answer_question(
         temperature: 모델 온도 (기본값: 0.7)
         max_tokens: 최대 토큰 수 (기본값: 65000)
         subject_name: 과목명 (예: "자료구조", "알고리즘" 등) (선택)
+        use_cache: 동일 입력에 대한 응답 캐시 사용 여부 (기본값: True)
+        subject_info: 이미 조회한 과목 정보 (선택, 있으면 과목 정보 조회 생략)
 
     Returns:
         교수님 역할의 답변 문자열
@@ -43,31 +50,96 @@ def answer_question(
         ValueError: question이 비어있는 경우
         RuntimeError: LLM API 호출 실패 시
     """
-    if not question or not question.strip():
+    llm_client, call_kwargs = _prepare_answer(
+        question, lecture_context, image_path, image, llm_client, max_tokens, subject_name,
+        subject_info,
+    )
+
+    try:
+        answer = llm_client.call(
+            temperature=temperature,
+            cache=use_cache,
+            **call_kwargs,
+        )
+        return answer.strip()
+    except Exception as e:  # pragma: no cover - 외부 API 예외
+        raise RuntimeError(f"질문 답변 생성 중 오류 발생: {str(e)}")
+
+
+def answer_question_stream(
+    question: str,
+    lecture_context: Optional[str] = None,
+    image_path: Optional[Union[str, Path]] = None,
+    image: Optional[Any] = None,
+    llm_client: Optional[LLMClient] = None,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = 65000,
+    subject_name: Optional[str] = None,
+    use_cache: bool = True,
+    subject_info: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    answer_question()의 스트리밍 버전 - 답변을 생성되는 대로 조각 단위로 반환합니다.
+
+    인자는 answer_question()과 동일합니다. 조각을 모두 이어 붙이면
+    answer_question()의 반환값과 같도록 앞뒤 공백은 제거됩니다.
+
+    Yields:
+        답변 텍스트 조각
+
+    Raises:
+        ValueError: question이 비어있는 경우
+        RuntimeError: LLM API 호출 실패 시
+    """
+    llm_client, call_kwargs = _prepare_answer(
+        question, lecture_context, image_path, image, llm_client, max_tokens, subject_name,
+        subject_info,
+    )
+
+    try:
+        started = False
+        pending_ws = ""  # 마지막 조각일 수 있으므로 보류한 뒤쪽 공백
+        for chunk in llm_client.stream(
+            temperature=temperature,
+            cache=use_cache,
+            **call_kwargs,
+        ):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            body = chunk.rstrip()
+            if body:
+                yield pending_ws + body
+                pending_ws = chunk[len(body):]
+            else:
+                pending_ws += chunk
+    except Exception as e:  # pragma: no cover - 외부 API 예외
+        raise RuntimeError(f"질문 답변 생성 중 오류 발생: {str(e)}")
+
+
+def _prepare_answer(
+    question: str,
+    lecture_context: Optional[str],
+    image_path: Optional[Union[str, Path]],
+    image: Optional[Any],
+    llm_client: Optional[LLMClient],
+    max_tokens: Optional[int],
+    subject_name: Optional[str],
+    subject_info: Optional[str] = None,
+) -> tuple[LLMClient, Dict[str, Any]]:
+    """answer_question / answer_question_stream 공통: (클라이언트, LLM 호출 인자) 구성"""
+    if is_blank(question):
         raise ValueError("질문이 비어있습니다.")
 
     if llm_client is None:
         # answer 함수는 flash 모델 사용 (flash-lite 대신)
-        llm_client = LLMClient(model="gemini-2.5-flash")
-
-    # 이미지 경로를 문자열로 변환
-    img_path_str: Optional[str] = None
-    has_image_input = bool(image_path or image)
-
-    # image_path가 빈 문자열이거나 None인 경우 처리
-    if image_path:
-        if isinstance(image_path, str):
-            img_path_str = image_path.strip()
-        else:
-            img_path_str = str(image_path)
-
-        if not img_path_str:  # 빈 문자열인 경우
-            img_path_str = None
-            has_image_input = bool(image)  # image 객체만 확인
-        else:
-            img_path_str = (
-                str(image_path) if isinstance(image_path, Path) else img_path_str
-            )
+        llm_client = get_flash_client()
+
+    # 이미지 경로를 문자열로 변환 (빈 문자열이면 None)
+    img_path_str = normalize_image_path(image_path)
+    has_image_input = bool(img_path_str or image)
 
     # 최대 토큰 설정
     max_output_tokens = max_tokens or 65000
@@ -77,20 +149,27 @@ def answer_question(
         lecture_context,
         has_image=has_image_input,
         subject_name=subject_name,
+        subject_info=subject_info,
     )
 
-    try:
-        answer = llm_client.call(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_output_tokens,
-            image_path=img_path_str,
-            image=image,
-        )
-        return answer.strip()
-    except Exception as e:  # pragma: no cover - 외부 API 예외
-        raise RuntimeError(f"질문 답변 생성 중 오류 발생: {str(e)}")
+    return llm_client, {
+        "prompt": user_prompt,
+        "system_prompt": system_prompt,
+        "max_tokens": max_output_tokens,
+        "image_path": img_path_str,
+        "image": image,
+    }
+
+
+async def aanswer_question(*args: Any, **kwargs: Any) -> str:
+    """
+    answer_question()의 비동기 버전 (Channels consumer 등 async 코드에서 사용)
+
+    async 코드에서 answer_question()을 직접 호출하면 Gemini 응답을 기다리는 동안
+    이벤트 루프 전체가 멈추므로 반드시 이 함수를 await 하세요.
+    인자와 반환값은 answer_question()과 동일합니다.
+    """
+    return await sync_to_async(answer_question, thread_sensitive=False)(*args, **kwargs)
 
 
 # if __name__ == "__main__":  # pragma: no cover - 로컬 테스트 전용
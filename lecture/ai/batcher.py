@@ -0,0 +1,177 @@
+"""
+Image Summary Batcher Module
+
+짧은 시간 안에 몰린 이미지 요약 요청을 모아 한 번의 Gemini 호출로 처리하는 배처
+여러 이미지를 [1]..[N] 번호와 함께 한 프롬프트에 넣고, 응답을 번호별로 나눠 돌려줌
+(N번의 호출 -> 배치 크기 b 기준 N/b번)
+"""
+
+import asyncio
+import logging
+import re
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+
+from .llm_client import LLMClient, get_flash_client
+from .prompt_templates import get_summarize_image_prompt, get_summarize_images_batch_prompt
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 8
+DEFAULT_WINDOW = 0.03  # 30ms
+
+# 1줄 요약에는 고해상도가 필요 없으므로 업로드 전 긴 변을 이 크기로 축소 (이미지 토큰/전송량 절감)
+SUMMARY_MAX_IMAGE_DIM = 1024
+
+# 배치 응답의 "[번호] 요약" 줄
+_NUMBERED_LINE_RE = re.compile(r"^\s*\[(\d+)\]\s*(.+?)\s*$", re.M)
+
+
+@dataclass(frozen=True)
+class ImageJob:
+    """이미지 요약 요청 1건"""
+
+    image_path: str
+    subject_name: Optional[str] = None
+
+
+class ImageSummaryBatcher:
+    """
+    이미지 요약 요청을 window 초 동안(또는 max_batch건이 찰 때까지) 모아 한 번에 요청하는 배처
+
+    같은 이벤트 루프 안에서만 사용해야 합니다. (get_image_batcher()가 루프별 인스턴스를 반환)
+    """
+
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        window: float = DEFAULT_WINDOW,
+        temperature: float = 0.3,
+    ):
+        """
+        ImageSummaryBatcher 초기화
+
+        Args:
+            llm_client: LLM 클라이언트 (없으면 gemini-2.5-flash 공유 인스턴스)
+            max_batch: 한 번의 호출에 넣을 최대 이미지 수
+            window: 첫 요청 이후 다른 요청을 기다리는 시간 (초)
+            temperature: 모델 온도
+        """
+        self.llm_client = llm_client
+        self.max_batch = max_batch
+        self.window = window
+        self.temperature = temperature
+        self._pending: list[tuple[ImageJob, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, job: ImageJob) -> str:
+        """
+        요약 요청을 큐에 넣고 결과를 기다림
+
+        Returns:
+            1줄 요약 문자열
+
+        Raises:
+            RuntimeError: LLM API 호출 실패 시
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((job, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+
+        # system_prompt(과목 정보)가 같은 요청끼리 묶어서 호출
+        groups: dict[Optional[str], list[tuple[ImageJob, asyncio.Future]]] = {}
+        for job, future in pending:
+            groups.setdefault(job.subject_name, []).append((job, future))
+
+        for subject_name, items in groups.items():
+            for start in range(0, len(items), self.max_batch):
+                asyncio.ensure_future(
+                    self._run_batch(subject_name, items[start:start + self.max_batch])
+                )
+
+    async def _run_batch(
+        self,
+        subject_name: Optional[str],
+        items: list[tuple[ImageJob, asyncio.Future]],
+    ) -> None:
+        llm_client = self.llm_client or get_flash_client()
+        summaries: dict[int, str] = {}
+
+        if len(items) > 1:
+            try:
+                system_prompt, user_prompt = await sync_to_async(
+                    get_summarize_images_batch_prompt
+                )(len(items), subject_name)
+                response = await llm_client.call_async(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    temperature=self.temperature,
+                    image_path=[job.image_path for job, _ in items],
+                    max_image_dim=SUMMARY_MAX_IMAGE_DIM,
+                )
+                summaries = {
+                    int(num): text for num, text in _NUMBERED_LINE_RE.findall(response)
+                }
+            except Exception as e:
+                logger.warning("batched image summary failed, falling back: %s", e)
+
+        for index, (job, future) in enumerate(items, start=1):
+            if future.done():
+                continue
+            summary = summaries.get(index)
+            if summary:
+                future.set_result(summary)
+                continue
+            # 배치 응답에서 빠진 항목(또는 단건)은 개별 호출로 처리
+            try:
+                future.set_result(await self._summarize_one(llm_client, job))
+            except Exception as e:
+                future.set_exception(RuntimeError(f"이미지 요약 중 오류 발생: {str(e)}"))
+
+    async def _summarize_one(self, llm_client: LLMClient, job: ImageJob) -> str:
+        system_prompt, user_prompt = await sync_to_async(get_summarize_image_prompt)(
+            subject_name=job.subject_name,
+        )
+        summary = await llm_client.call_async(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=self.temperature,
+            image_path=job.image_path,
+            max_image_dim=SUMMARY_MAX_IMAGE_DIM,
+        )
+        return summary.strip()
+
+
+# 이벤트 루프별 배처 인스턴스
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ImageSummaryBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_image_batcher() -> ImageSummaryBatcher:
+    """현재 이벤트 루프의 ImageSummaryBatcher 반환"""
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        batcher = ImageSummaryBatcher()
+        _batchers[loop] = batcher
+    return batcher
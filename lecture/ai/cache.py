@@ -0,0 +1,104 @@
+"""
+LLM Response Cache Module
+
+동일한 입력에 대한 Gemini 응답을 Redis(Django cache)에 저장해
+반복 호출 시 API 왕복을 생략하기 위한 캐시
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# 기본 TTL (초) - 환경변수 LECTURE_AI_CACHE_TTL로 조정 가능
+DEFAULT_TTL = int(os.getenv("LECTURE_AI_CACHE_TTL", str(60 * 60 * 24)))
+
+
+class LLMCache:
+    """Django cache 백엔드(Redis)를 사용하는 LLM 응답 캐시"""
+
+    key_prefix = "llm:"
+
+    def __init__(self, alias: str = "default", default_ttl: int = DEFAULT_TTL):
+        """
+        LLMCache 초기화
+
+        Args:
+            alias: 사용할 Django CACHES alias (기본값: default)
+            default_ttl: set 호출 시 ttl이 없을 때 사용할 TTL (초)
+        """
+        self.alias = alias
+        self.default_ttl = default_ttl
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        캐시 키 생성 (입력값 전체에 대한 SHA-256)
+
+        Args:
+            **parts: 응답을 결정하는 입력값 (model, system_prompt, prompt 등)
+
+        Returns:
+            16진수 해시 문자열
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _backend(self):
+        # Django 설정이 로드되지 않은 환경(로컬 스크립트 등)에서도 import 가능하도록 지연 로드
+        from django.core.cache import caches
+
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        캐시 백엔드 오류는 LLM 호출을 막지 않도록 None(miss)으로 처리합니다.
+        """
+        try:
+            return self._backend().get(self.key_prefix + key)
+        except Exception as e:
+            logger.warning("LLM cache get failed: %s", e)
+            return None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        응답 저장
+
+        Args:
+            key: make_key로 생성한 캐시 키
+            value: LLM 응답 텍스트
+            ttl: 만료 시간 (초, 없으면 default_ttl)
+        """
+        try:
+            self._backend().set(
+                self.key_prefix + key,
+                value,
+                timeout=ttl if ttl is not None else self.default_ttl,
+            )
+        except Exception as e:
+            logger.warning("LLM cache set failed: %s", e)
+
+    async def aget(self, key: str) -> Optional[str]:
+        """get()의 비동기 버전"""
+        try:
+            return await self._backend().aget(self.key_prefix + key)
+        except Exception as e:
+            logger.warning("LLM cache get failed: %s", e)
+            return None
+
+    async def aset(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """set()의 비동기 버전"""
+        try:
+            await self._backend().aset(
+                self.key_prefix + key,
+                value,
+                timeout=ttl if ttl is not None else self.default_ttl,
+            )
+        except Exception as e:
+            logger.warning("LLM cache set failed: %s", e)
@@ -6,11 +6,16 @@ Question Cleaning Module
 교수님 화면 캡쳐 이미지를 고려하여 정제
 """
 
+import asyncio
 from typing import Optional, Union, Any
 from pathlib import Path
 
-from .llm_client import LLMClient, get_default_client
-from .prompt_templates import get_clean_question_prompt
+from asgiref.sync import sync_to_async
+
+from ._util import is_blank, normalize_image_path
+from .llm_client import LLMClient, get_flash_lite_client
+from .prompt_templates import get_clean_question_prompt, get_subject_info
+from .semantic_cache import get_semantic_cache
 
 
 def clean_question(
@@ -20,6 +25,8 @@ def clean_question(
     llm_client: Optional[LLMClient] = None,
     temperature: float = 0.3,
     subject_name: Optional[str] = None,
+    use_cache: bool = True,
+    subject_info: Optional[str] = None,
 ) -> str:
     """
     학생 질문을 정제합니다. 교수님 화면 캡쳐 이미지를 고려하여 정제할 수 있습니다.
@@ -31,6 +38,8 @@ def clean_question(
         llm_client: LLM 클라이언트 인스턴스 (없으면 기본 인스턴스 사용)
         temperature: 모델 온도 (낮을수록 일관성 있음)
         subject_name: 과목명 (예: "자료구조", "알고리즘" 등) (선택)
+        use_cache: 동일 입력에 대한 응답 캐시 사용 여부 (기본값: True)
+        subject_info: 이미 조회한 과목 정보 (선택, 있으면 과목 정보 조회 생략)
 
     Returns:
         정제된 질문 문자열
@@ -39,35 +48,30 @@ def clean_question(
         ValueError: question이 비어있는 경우
         RuntimeError: LLM API 호출 실패 시
     """
-    if not question or not question.strip():
+    if is_blank(question):
         raise ValueError("질문이 비어있습니다.")
 
     if llm_client is None:
-        llm_client = get_default_client()
-
-    # 이미지 경로를 문자열로 변환
-    img_path_str: Optional[str] = None
-    has_image_input = bool(image_path or image)
-
-    # image_path가 빈 문자열이거나 None인 경우 처리
-    if image_path:
-        if isinstance(image_path, str):
-            img_path_str = image_path.strip()
-        else:
-            img_path_str = str(image_path)
-
-        if not img_path_str:  # 빈 문자열인 경우
-            img_path_str = None
-            has_image_input = bool(image)  # image 객체만 확인
-        else:
-            img_path_str = (
-                str(image_path) if isinstance(image_path, Path) else img_path_str
-            )
+        llm_client = get_flash_lite_client()
+
+    # 이미지 경로를 문자열로 변환 (빈 문자열이면 None)
+    img_path_str = normalize_image_path(image_path)
+    has_image_input = bool(img_path_str or image)
+
+    # 이미지가 없는 질문은 의미가 같은 이전 질문의 정제 결과를 재사용 (semantic cache)
+    semantic_cache = get_semantic_cache() if use_cache and not has_image_input else None
+    embedding = None
+    if semantic_cache is not None:
+        embedding = semantic_cache.encode(question)
+        cached = semantic_cache.search(embedding, subject_name=subject_name)
+        if cached is not None:
+            return cached
 
     system_prompt, user_prompt = get_clean_question_prompt(
         question,
         has_image=has_image_input,
         subject_name=subject_name,
+        subject_info=subject_info,
     )
 
     # 이미지가 포함된 경우 더 많은 토큰 필요
@@ -81,12 +85,103 @@ def clean_question(
             max_tokens=max_output_tokens,
             image_path=img_path_str,
             image=image,
+            cache=use_cache,
         )
-        return cleaned.strip()
+        cleaned = cleaned.strip()
+        if semantic_cache is not None:
+            semantic_cache.add(embedding, cleaned, subject_name=subject_name)
+        return cleaned
     except Exception as e:  # pragma: no cover - 외부 API 예외
         raise RuntimeError(f"질문 정제 중 오류 발생: {str(e)}")
 
 
+async def aclean_question(*args: Any, **kwargs: Any) -> str:
+    """
+    clean_question()의 비동기 버전 (Channels consumer 등 async 코드에서 사용)
+
+    async 코드에서 clean_question()을 직접 호출하면 Gemini 응답을 기다리는 동안
+    이벤트 루프 전체가 멈추므로 반드시 이 함수를 await 하세요.
+    인자와 반환값은 clean_question()과 동일합니다.
+    """
+    return await sync_to_async(clean_question, thread_sensitive=False)(*args, **kwargs)
+
+
+async def clean_questions_batch(
+    questions: list[str],
+    image_path: Optional[Union[str, Path]] = None,
+    image: Optional[Any] = None,
+    llm_client: Optional[LLMClient] = None,
+    temperature: float = 0.3,
+    subject_name: Optional[str] = None,
+    use_cache: bool = True,
+    max_concurrency: int = 8,
+) -> list[Union[str, BaseException]]:
+    """
+    여러 학생 질문을 동시에 정제합니다. (Gemini 비동기 호출을 asyncio.gather로 병렬 실행)
+
+    Args:
+        questions: 정제할 원본 질문 리스트
+        image_path: 모든 질문에 공통으로 사용할 화면 캡쳐 이미지 경로 또는 URL (선택)
+        image: PIL Image 객체 또는 이미지 데이터 (선택)
+        llm_client: LLM 클라이언트 인스턴스 (없으면 기본 인스턴스 사용)
+        temperature: 모델 온도
+        subject_name: 과목명 (선택)
+        use_cache: 동일 입력에 대한 응답 캐시 사용 여부
+        max_concurrency: 동시에 진행할 최대 API 호출 수
+
+    Returns:
+        입력 순서와 같은 순서의 결과 리스트
+        (성공 시 정제된 질문, 실패 시 ValueError/RuntimeError 예외 객체)
+    """
+    if llm_client is None:
+        llm_client = get_flash_lite_client()
+
+    img_path_str = normalize_image_path(image_path)
+    has_image_input = bool(img_path_str or image)
+
+    def _build_prompts() -> list[Optional[tuple[str, str]]]:
+        # 과목 정보 조회(DB)가 포함되므로 동기 컨텍스트에서 한 번에 생성
+        subject_info = get_subject_info(subject_name)
+        return [
+            get_clean_question_prompt(
+                q,
+                has_image=has_image_input,
+                subject_info=subject_info,
+            )
+            if not is_blank(q)
+            else None
+            for q in questions
+        ]
+
+    prompts = await sync_to_async(_build_prompts)()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _clean_one(prompt_pair: Optional[tuple[str, str]]) -> str:
+        if prompt_pair is None:
+            raise ValueError("질문이 비어있습니다.")
+
+        system_prompt, user_prompt = prompt_pair
+        async with semaphore:
+            try:
+                cleaned = await llm_client.call_async(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=10000,
+                    image_path=img_path_str,
+                    image=image,
+                    cache=use_cache,
+                )
+            except Exception as e:  # pragma: no cover - 외부 API 예외
+                raise RuntimeError(f"질문 정제 중 오류 발생: {str(e)}")
+        return cleaned.strip()
+
+    return await asyncio.gather(
+        *(_clean_one(p) for p in prompts),
+        return_exceptions=True,
+    )
+
+
 # if __name__ == "__main__":  # pragma: no cover - 로컬 테스트 전용
 #     # 로컬 테스트
 #     test_question = "파이썬에서 리스트와 튜플의 차이점이 뭐에요? 그리고 언제 사용해야 하는지 궁금해요"
@@ -5,9 +5,258 @@ Google Gemini API 호출을 위한 공용 클라이언트
 """
 
 import os
+import re
+import functools
 import json
+import asyncio
+import hashlib
+import threading
+import time
+import logging
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterator, Mapping, Union
+
+from .cache import LLMCache
+
+# 이미지 처리용 선택 의존성 (이미지를 사용하는 호출에서만 필요)
+try:
+    from PIL import Image  # type: ignore
+    _HAS_PIL = True
+except ImportError:
+    Image = None
+    _HAS_PIL = False
+
+try:
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+    _HAS_REQUESTS = True
+except ImportError:
+    requests = None
+    HTTPAdapter = None
+    Retry = None
+    _HAS_REQUESTS = False
+
+logger = logging.getLogger(__name__)
+
+# system_instruction별 GenerativeModel 캐시 최대 크기
+_MODEL_CACHE_MAX = 32
+
+# Gemini 서버측 컨텍스트 캐시(CachedContent) 설정
+# - 이 길이 이상의 system_prompt만 캐시 (짧은 프롬프트는 API 최소 토큰 조건에 걸림)
+_CONTEXT_CACHE_MIN_CHARS = int(os.getenv("LECTURE_AI_CONTEXT_CACHE_MIN_CHARS", "1024"))
+_CONTEXT_CACHE_TTL = 60 * 60  # 1시간
+_CONTEXT_CACHE_REFRESH_MARGIN = 10 * 60  # 만료 10분 전부터 TTL 연장
+
+# (model_name, system_prompt 해시) -> (CachedContent, 만료 시각(epoch))
+_CACHED_CONTENTS: Dict[tuple[str, str], tuple[Any, float]] = {}
+# 생성이 거부된 (model_name, system_prompt 해시) - 매 호출마다 재시도하지 않음
+_CACHED_CONTENT_REJECTED: set[tuple[str, str]] = set()
+_cached_contents_lock = threading.Lock()
+
+# finish_reason (1=STOP, 2=MAX_TOKENS, 3=SAFETY, 4=RECITATION, 5=OTHER) -> 에러 메시지
+# - 응답 텍스트와 관계없이 차단으로 처리하는 사유
+_BLOCKED_FINISH_REASONS: Dict[int, str] = {
+    3: "응답이 안전 필터링으로 차단되었습니다. 프롬프트를 수정해주세요.",
+    4: "응답이 인용 필터링으로 차단되었습니다. 프롬프트를 수정해주세요.",
+}
+# - 응답 텍스트가 비어 있을 때 사용하는 사유별 메시지
+_EMPTY_FINISH_REASONS: Dict[int, str] = {
+    2: "응답이 최대 토큰 수를 초과하여 잘렸습니다. max_tokens를 늘려주세요.",
+}
+
+# call_with_json: 응답 앞뒤의 마크다운 코드 펜스(```json ... ```) 제거용
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.S)
+_JSON_DECODER = json.JSONDecoder()
+
+@functools.lru_cache(maxsize=32)
+def _gen_config(temperature: float, max_tokens: Optional[int]) -> Mapping[str, Any]:
+    """(temperature, max_tokens)별 generation_config (읽기 전용 매핑으로 공유)"""
+    config: Dict[str, Any] = {"temperature": temperature}
+    if max_tokens:
+        config["max_output_tokens"] = max_tokens
+    return MappingProxyType(config)
+
+
+# 사용할 수 없는 모델명 -> 대체 모델명 (프로세스당 한 번만 list_models 조회)
+_RESOLVED_FALLBACKS: Dict[str, str] = {}
+
+_JSON_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _truncate_to_complete_json(text: str) -> Optional[str]:
+    """
+    잘린 JSON을 마지막으로 완성된 최상위 항목까지 자르고 닫는 괄호를 붙여 반환
+
+    문자열/이스케이프를 고려해 한 번만 스캔하며, 최상위 컨테이너 바로 안의
+    마지막 쉼표(= 그 앞 항목은 완성됨) 위치에서 자릅니다.
+    예: '{"a": 1, "b": {"c": 2}, "d": "tru' -> '{"a": 1, "b": {"c": 2}}'
+
+    Returns:
+        복구한 JSON 문자열 (복구할 수 없으면 None)
+    """
+    stack: list[str] = []
+    in_string = False
+    escaped = False
+    last_cut: Optional[int] = None
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in _JSON_CLOSERS:
+            stack.append(ch)
+        elif ch in "}]":
+            if not stack:
+                return None
+            stack.pop()
+            if not stack:
+                # 최상위 값이 이미 완성됨 (raw_decode에서 처리되는 경우)
+                return text[: i + 1]
+        elif ch == "," and len(stack) == 1:
+            last_cut = i
+
+    if not stack or last_cut is None:
+        return None
+    return text[:last_cut] + _JSON_CLOSERS[stack[0]]
+
+
+# 디코딩된 이미지 LRU 캐시
+# - 파일: (경로, mtime_ns, 크기) -> PIL Image 또는 축소된 JPEG blob
+# - URL: ("url", URL) -> (ETag, 위와 동일)  (If-None-Match로 재검증)
+_IMG_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+_IMG_CACHE_MAX = 64
+_img_cache_lock = threading.Lock()
+
+# 업로드 전 이미지 최대 변 길이 (px, 0이면 축소하지 않음)
+_MAX_IMAGE_DIM = int(os.getenv("LECTURE_AI_MAX_IMAGE_DIM", "1536"))
+_DOWNSCALED_JPEG_QUALITY = 85
+
+
+def _img_cache_get(key: tuple) -> Optional[Any]:
+    with _img_cache_lock:
+        value = _IMG_CACHE.get(key)
+        if value is not None:
+            _IMG_CACHE.move_to_end(key)
+        return value
+
+
+def _img_cache_put(key: tuple, value: Any) -> None:
+    with _img_cache_lock:
+        _IMG_CACHE[key] = value
+        _IMG_CACHE.move_to_end(key)
+        while len(_IMG_CACHE) > _IMG_CACHE_MAX:
+            _IMG_CACHE.popitem(last=False)
+
+
+def _downscale_image(img: Any, max_dim: Optional[int] = None) -> Any:
+    """
+    긴 변이 max_dim(없으면 _MAX_IMAGE_DIM)을 넘는 이미지를 축소해 JPEG blob으로 변환
+
+    SDK는 파일에서 연 이미지를 원본 파일 바이트 그대로, 그 외 이미지는 매번
+    무손실 WebP로 인코딩해 업로드하므로 축소한 결과를 한 번만 JPEG로 인코딩해 둡니다.
+    작은 이미지는 그대로 반환합니다.
+    """
+    max_dim = max_dim or _MAX_IMAGE_DIM
+    if not max_dim or max(img.size) <= max_dim:
+        return img
+
+    resized = img.copy()
+    resized.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+    if resized.mode != "RGB":
+        resized = resized.convert("RGB")
+
+    buf = BytesIO()
+    resized.save(buf, format="JPEG", quality=_DOWNSCALED_JPEG_QUALITY)
+    return {"mime_type": "image/jpeg", "data": buf.getvalue()}
+
+
+def _load_image_cached(img_path: Path, max_dim: Optional[int] = None) -> Any:
+    """
+    파일 경로의 이미지를 디코딩(필요 시 축소)해 반환 (같은 파일은 결과 재사용)
+
+    같은 캡처 이미지가 clean/answer 등 여러 호출에 쓰이므로 (경로, 수정 시각, 크기)가
+    같으면 다시 열지 않습니다.
+    """
+    stat = img_path.stat()
+    key = (str(img_path), stat.st_mtime_ns, stat.st_size, max_dim)
+    img = _img_cache_get(key)
+    if img is None:
+        img = Image.open(img_path)
+        img.load()  # 지연 디코딩 강제 (파일 핸들 해제)
+        img = _downscale_image(img, max_dim)
+        _img_cache_put(key, img)
+    return img
+
+
+# URL 이미지 다운로드용 공유 세션 (keep-alive 커넥션 풀 재사용)
+_http_session: Optional[Any] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> Any:
+    """URL 이미지 다운로드에 사용할 requests.Session 싱글톤 반환"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=2, backoff_factor=0.2),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
+def _load_url_image_cached(
+    url: str,
+    headers: Dict[str, str],
+    max_dim: Optional[int] = None,
+) -> Any:
+    """
+    URL 이미지를 다운로드/디코딩(필요 시 축소)해 반환
+
+    이전에 받은 이미지가 있으면 ETag로 조건부 요청(If-None-Match)을 보내
+    304 응답이면 본문 다운로드와 디코딩을 생략합니다.
+    """
+    key = ("url", url, max_dim)
+    cached = _img_cache_get(key)
+    request_headers = dict(headers)
+    if cached is not None:
+        request_headers["If-None-Match"] = cached[0]
+
+    with _get_http_session().get(
+        url, headers=request_headers, timeout=10, stream=True
+    ) as response:
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+
+        # 응답 스트림에서 바로 디코딩 (gzip 등 Content-Encoding은 해제)
+        # - 스트림이 seek 불가능하면 PIL이 내부적으로 버퍼링
+        response.raw.decode_content = True
+        img = Image.open(response.raw)
+        img.load()
+        img = _downscale_image(img, max_dim)
+        etag = response.headers.get("ETag")
+
+    if etag:
+        _img_cache_put(key, (etag, img))
+    return img
+
 
 try:
     import google.generativeai as genai  # type: ignore
@@ -40,6 +289,37 @@ else:
     load_dotenv()
 
 
+def _image_digest(image_path: Optional[Union[str, list[str]]] = None, image: Optional[Any] = None) -> Optional[str]:
+    """
+    캐시 키에 포함할 이미지 식별값 계산
+
+    - 파일 경로: 경로 + 수정 시각 + 크기 (파일 내용을 읽지 않음)
+    - URL: URL 문자열 (업로드 경로가 매번 고유하므로 충분)
+    - PIL Image / bytes: 픽셀 데이터의 blake2b 해시
+    - 경로 리스트: 각 경로 식별값을 순서대로 연결
+    """
+    if image is not None:
+        data = image.tobytes() if hasattr(image, "tobytes") else image
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+        return None
+
+    if isinstance(image_path, (list, tuple)):
+        digests = [_image_digest(p) for p in image_path]
+        return None if None in digests else "|".join(digests)
+
+    if image_path and str(image_path).strip():
+        path_str = str(image_path)
+        if path_str.startswith(("http://", "https://")):
+            return path_str
+        if os.path.isfile(path_str):
+            stat = os.stat(path_str)
+            return f"{path_str}:{stat.st_mtime}:{stat.st_size}"
+        return path_str
+
+    return ""
+
+
 class LLMClient:
     """Google Gemini API 클라이언트"""
 
@@ -62,16 +342,23 @@ class LLMClient:
         # Gemini API
         genai.configure(api_key=self.api_key)
         self.model_name = model
+        self.response_cache = LLMCache()
 
         # models/ 접두사 제거 
         if self.model_name.startswith("models/"):
             self.model_name = self.model_name.replace("models/", "")
 
+        # 이전에 대체 모델로 확정된 경우 list_models 조회 없이 바로 사용
+        requested_model = self.model_name
+        self.model_name = _RESOLVED_FALLBACKS.get(requested_model, requested_model)
+
         try:
             self.model = genai.GenerativeModel(model_name=self.model_name)
         except Exception as e:
             # 모델 이름이 상이할 경우 사용 가능한 모델 자동 감지
-            print(f"경고: 모델 {model}을 사용할 수 없습니다. 사용 가능한 모델을 찾는 중... (오류: {e})")
+            logger.warning(
+                "model %s unavailable, looking up available models: %s", model, e
+            )
             try:
                 available_models = [
                     m.name
@@ -95,22 +382,333 @@ class LLMClient:
                     if not fallback_model:
                         fallback_model = available_models[0].replace("models/", "")
 
-                    print(f"사용 가능한 모델로 변경: {fallback_model}")
+                    logger.warning(
+                        "model %s unavailable, falling back to %s", model, fallback_model
+                    )
                     self.model_name = fallback_model
                     self.model = genai.GenerativeModel(model_name=self.model_name)
+                    _RESOLVED_FALLBACKS[requested_model] = fallback_model
                 else:
                     raise ValueError("사용 가능한 모델을 찾을 수 없습니다.")
             except Exception as e2:
                 raise ValueError(f"모델 초기화 실패: {e2}")
 
+        # (model_name, system_prompt) -> GenerativeModel (LRU)
+        self._model_cache: "OrderedDict[tuple[str, Optional[str]], Any]" = OrderedDict(
+            {(self.model_name, None): self.model}
+        )
+        self._model_cache_lock = threading.Lock()
+
+    def get_or_create_cached_content(
+        self,
+        system_prompt: str,
+        subject_name: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        system_prompt를 Gemini 서버측 컨텍스트 캐시(CachedContent)로 등록하고 반환
+
+        같은 system_prompt는 프로세스 내 dict와 Django cache(Redis)를 통해
+        여러 워커가 하나의 CachedContent를 공유합니다. 만료가 가까우면 TTL을 연장합니다.
+
+        Args:
+            system_prompt: 캐시할 시스템 프롬프트
+            subject_name: 과목명 (CachedContent display_name 용도, 선택)
+
+        Returns:
+            CachedContent 객체 (모델 미지원/API 거부 등으로 실패하면 None)
+        """
+        prompt_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+        key = (self.model_name, prompt_hash)
+        now = time.time()
+
+        with _cached_contents_lock:
+            if key in _CACHED_CONTENT_REJECTED:
+                return None
+            entry = _CACHED_CONTENTS.get(key)
+
+        cached_content = None
+        if entry is not None:
+            cached_content, expires_at = entry
+            if expires_at - now > _CONTEXT_CACHE_REFRESH_MARGIN:
+                return cached_content
+            try:
+                cached_content.update(ttl=_CONTEXT_CACHE_TTL)
+            except Exception:
+                # 이미 만료된 경우 새로 생성
+                cached_content = None
+
+        try:
+            if cached_content is None:
+                cached_content = self._load_shared_cached_content(prompt_hash)
+                if cached_content is None:
+                    display_name = f"lecture-{subject_name or 'common'}-{prompt_hash[:8]}"
+                    cached_content = genai.caching.CachedContent.create(
+                        model=f"models/{self.model_name}",
+                        display_name=display_name[:128],
+                        system_instruction=system_prompt,
+                        ttl=_CONTEXT_CACHE_TTL,
+                    )
+                    self._store_shared_cached_content(prompt_hash, cached_content.name)
+        except Exception as e:
+            logger.warning(
+                "Gemini context cache unavailable for model %s, using system_instruction: %s",
+                self.model_name,
+                e,
+            )
+            with _cached_contents_lock:
+                _CACHED_CONTENTS.pop(key, None)
+                _CACHED_CONTENT_REJECTED.add(key)
+            return None
+
+        with _cached_contents_lock:
+            _CACHED_CONTENTS[key] = (cached_content, now + _CONTEXT_CACHE_TTL)
+        return cached_content
+
+    def _shared_cache_key(self, prompt_hash: str) -> str:
+        return f"gemini-cached-content:{self.model_name}:{prompt_hash}"
+
+    def _load_shared_cached_content(self, prompt_hash: str) -> Optional[Any]:
+        """다른 워커가 만든 CachedContent 이름을 Django cache에서 찾아 로드"""
+        try:
+            from django.core.cache import cache
+
+            name = cache.get(self._shared_cache_key(prompt_hash))
+        except Exception:
+            return None
+        if not name:
+            return None
+        try:
+            cached_content = genai.caching.CachedContent.get(name)
+            cached_content.update(ttl=_CONTEXT_CACHE_TTL)
+            return cached_content
+        except Exception:
+            # 이미 만료/삭제된 캐시
+            return None
+
+    def _store_shared_cached_content(self, prompt_hash: str, name: str) -> None:
+        try:
+            from django.core.cache import cache
+
+            cache.set(
+                self._shared_cache_key(prompt_hash),
+                name,
+                timeout=_CONTEXT_CACHE_TTL - _CONTEXT_CACHE_REFRESH_MARGIN,
+            )
+        except Exception:
+            pass
+
+    def _get_model(self, system_prompt: Optional[str] = None) -> Any:
+        """
+        system_instruction에 해당하는 GenerativeModel 반환
+
+        프롬프트 템플릿별 system_prompt는 종류가 적으므로 매 호출마다 모델을
+        새로 만들지 않고 LRU로 재사용합니다.
+        """
+        # 긴 system_prompt는 서버측 컨텍스트 캐시 사용 (prefill 비용/입력 토큰 절감)
+        if system_prompt and len(system_prompt) >= _CONTEXT_CACHE_MIN_CHARS:
+            cached_content = self.get_or_create_cached_content(system_prompt)
+            if cached_content is not None:
+                return genai.GenerativeModel.from_cached_content(cached_content)
+
+        key = (self.model_name, system_prompt or None)
+        with self._model_cache_lock:
+            model = self._model_cache.get(key)
+            if model is not None:
+                self._model_cache.move_to_end(key)
+                return model
+
+            model = genai.GenerativeModel(
+                model_name=self.model_name, system_instruction=system_prompt
+            )
+            self._model_cache[key] = model
+            if len(self._model_cache) > _MODEL_CACHE_MAX:
+                self._model_cache.popitem(last=False)
+            return model
+
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: Optional[int],
+        image_path: Optional[Union[str, list[str]]],
+        image: Optional[Any],
+        cache: Optional[bool],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        응답 캐시 키 계산 (캐시를 사용하지 않는 호출이면 None)
+
+        temperature > 0이면 명시적으로 cache=True일 때만 캐시를 사용합니다.
+        """
+        use_cache = cache if cache is not None else temperature <= 0.0
+        if not use_cache:
+            return None
+
+        image_digest = _image_digest(image_path, image)
+        if image_digest is None:
+            return None
+
+        return LLMCache.make_key(
+            model=self.model_name,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            kwargs=kwargs,
+            image=image_digest,
+        )
+
+    def _prepare_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: Optional[int],
+        image_path: Optional[Union[str, list[str]]],
+        image: Optional[Any],
+        kwargs: Dict[str, Any],
+        max_image_dim: Optional[int] = None,
+    ) -> tuple[Any, Union[str, list[Any]], Mapping[str, Any]]:
+        """
+        generate_content 호출에 필요한 (model, contents, generation_config) 구성
+
+        이미지가 없으면 contents는 prompt 문자열 그대로이고,
+        이미지가 있으면 [prompt, 이미지] 리스트입니다.
+        이미지 파일/URL 로드가 포함되므로 블로킹 I/O가 발생할 수 있습니다.
+        """
+        # 시스템 프롬프트가 있으면 모델에 전달 (system_prompt별로 재사용)
+        model = self._get_model(system_prompt)
+
+        # 생성 설정 
+        generation_config: Mapping[str, Any]
+        if kwargs:
+            config: Dict[str, Any] = {
+                "temperature": temperature,
+                **kwargs,
+            }
+            if max_tokens:
+                config["max_output_tokens"] = max_tokens
+            generation_config = config
+        else:
+            # 추가 파라미터가 없으면 (temperature, max_tokens)별로 공유되는 불변 설정 사용
+            generation_config = _gen_config(temperature, max_tokens)
+
+        # 텍스트 전용 fast path: 이미지 처리 없이 prompt 문자열을 그대로 전달
+        if not self._wants_image(image_path, image):
+            return model, prompt, generation_config
+
+        content_parts: list[Union[str, Any]] = [prompt]
+
+        # image_path가 빈 문자열이거나 None이 아닌 경우만 처리 (리스트면 순서대로 모두 첨부)
+        image_paths = image_path if isinstance(image_path, (list, tuple)) else [image_path]
+        for path in image_paths:
+            if path and str(path).strip():
+                content_parts.append(self._load_image_part(path, max_image_dim))
+
+        return model, content_parts, generation_config
+
+    @staticmethod
+    def _load_image_part(image_path: Union[str, Path], max_dim: Optional[int] = None) -> Any:
+        """이미지 파일 경로 또는 URL을 generate_content에 넣을 수 있는 이미지로 로드 (긴 변 max_dim 이하로 축소)"""
+        if not _HAS_PIL:
+            raise ImportError(
+                "PIL (Pillow) 패키지가 설치되지 않았습니다. "
+                "이미지 처리를 위해 다음 명령어로 설치하세요: pip install Pillow"
+            )
+        try:
+            # URL인 경우 requests로 다운로드 시도
+            if str(image_path).startswith(("http://", "https://")):
+                if not _HAS_REQUESTS:
+                    raise ValueError(
+                        "URL 이미지를 사용하려면 requests 패키지가 필요합니다: pip install requests"
+                    )
+                try:
+                    headers = {
+                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+                    }
+                    return _load_url_image_cached(str(image_path), headers, max_dim)
+                except Exception as e:
+                    raise ValueError(f"URL에서 이미지를 다운로드하는데 실패했습니다: {e}")
+            else:
+                # 파일 경로에서 이미지 로드
+                img_path = Path(image_path)
+                if not img_path.exists():
+                    raise ValueError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+                return _load_image_cached(img_path, max_dim)
+        except Exception as e:
+            raise ValueError(f"이미지 파일 로드 실패 ({image_path}): {e}")
+
+    @staticmethod
+    def _wants_image(image_path: Optional[Union[str, list[str]]], image: Optional[Any]) -> bool:
+        """이미지 입력이 있는 호출인지 여부"""
+        if isinstance(image_path, (list, tuple)):
+            return any(p and str(p).strip() for p in image_path) or image is not None
+        return bool(image_path and str(image_path).strip()) or image is not None
+
+    @staticmethod
+    def _extract_text(response: Any) -> tuple[Optional[str], Optional[int], Optional[Exception]]:
+        """
+        generate_content 응답에서 (텍스트, finish_reason, response.text 접근 오류) 추출
+
+        candidates는 한 번만 조회하고, response.text 접근이 실패하면
+        첫 candidate의 parts를 한 번 순회해 텍스트를 합칩니다.
+        """
+        cands = getattr(response, "candidates", None) or []
+        candidate = cands[0] if cands else None
+        finish_reason = candidate.finish_reason if candidate is not None else None
+
+        blocked = _BLOCKED_FINISH_REASONS.get(finish_reason)
+        if blocked:
+            raise RuntimeError(blocked)
+
+        try:
+            return response.text, finish_reason, None
+        except (ValueError, AttributeError) as e:
+            content = getattr(candidate, "content", None) if candidate is not None else None
+            parts = content.parts if content else None
+            if parts:
+                text = "".join([part.text for part in parts if getattr(part, "text", None)])
+                if text:
+                    return text, finish_reason, None
+            return None, finish_reason, e
+
+    @staticmethod
+    def _parse_response(response: Any) -> str:
+        """
+        generate_content 응답에서 텍스트 추출 (finish_reason 검사 포함)
+        """
+        response_text, finish_reason, error = LLMClient._extract_text(response)
+
+        if not response_text or not response_text.strip():
+            message = _EMPTY_FINISH_REASONS.get(finish_reason)
+            if message:
+                raise RuntimeError(message)
+            if error is not None:
+                if finish_reason:
+                    raise RuntimeError(
+                        "Gemini API가 유효한 응답을 반환하지 못했습니다. "
+                        f"(finish_reason: {finish_reason})"
+                    )
+                raise RuntimeError(f"Gemini API 응답 처리 실패: {str(error)}")
+            if finish_reason:
+                raise RuntimeError(
+                    f"Gemini API가 빈 응답을 반환했습니다. (finish_reason: {finish_reason})"
+                )
+            raise RuntimeError("Gemini API가 빈 응답을 반환했습니다.")
+
+        return response_text.strip()
+
     def call(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
-        image_path: Optional[str] = None,
+        image_path: Optional[Union[str, list[str]]] = None,
         image: Optional[Any] = None,
+        cache: Optional[bool] = None,
+        max_image_dim: Optional[int] = None,
         **kwargs,
     ) -> str:
         """
@@ -121,160 +719,169 @@ class LLMClient:
             system_prompt: 시스템 프롬프트 (선택) - Gemini는 system_instruction로 전달
             temperature: 모델 온도 (0.0-2.0)
             max_tokens: 최대 토큰 수 (max_output_tokens로 변환)
-            image_path: 이미지 파일 경로 또는 URL (선택)
+            image_path: 이미지 파일 경로 또는 URL (선택, 리스트면 여러 장을 순서대로 첨부)
             image: PIL Image 객체 또는 이미지 데이터 (선택)
+            cache: 응답 캐시 사용 여부
+                   (None이면 temperature가 0일 때만 사용, True/False로 강제 지정)
+            max_image_dim: 업로드 전 이미지 긴 변의 최대 픽셀 수
+                           (없으면 LECTURE_AI_MAX_IMAGE_DIM 설정값 사용)
             **kwargs: 기타 API 파라미터
 
         Returns:
             LLM 응답 텍스트
         """
-        # -----------------------------
-        # 디버그용 프롬프트 출력 TODO: 나중에 제거
-        # -----------------------------
-        # try:
-        #     print("\n[AI DEBUG] ===== LLM CALL START =====")
-        #     print(f"[AI DEBUG] model_name: {self.model_name}")
-        #     print(f"[AI DEBUG] temperature: {temperature}, max_tokens: {max_tokens}")
-        #     if system_prompt:
-        #         print("[AI DEBUG] --- system_prompt ---")
-        #         print(system_prompt)
-        #         print("[AI DEBUG] --- end system_prompt ---")
-        #     print("[AI DEBUG] --- user_prompt ---")
-        #     print(prompt)
-        #     print("[AI DEBUG] --- end user_prompt ---")
-        #     print(f"[AI DEBUG] image_path: {image_path}, has_image: {bool(image_path or image)}")
-        #     print("[AI DEBUG] =====  LLM CALL END (prompt dump) =====\n")
-        # except Exception:
-        #     # 디버그 출력 자체가 실패하더라도 LLM 호출은 계속 진행
-        #     pass
-
-        # 시스템 프롬프트가 있으면 모델에 전달
-        if system_prompt:
-            model = genai.GenerativeModel(
-                model_name=self.model_name, system_instruction=system_prompt
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "llm_call model=%s temperature=%s max_tokens=%s has_image=%s image_path=%s",
+                self.model_name,
+                temperature,
+                max_tokens,
+                bool(image_path or image),
+                image_path,
             )
-        else:
-            model = self.model
-
-        # 생성 설정 
-        generation_config: Dict[str, Any] = {
-            "temperature": temperature,
-            **kwargs,
-        }
+            logger.debug("llm_call system_prompt=%.200s", system_prompt)
+            logger.debug("llm_call prompt=%.200s", prompt)
 
-        if max_tokens:
-            generation_config["max_output_tokens"] = max_tokens
+        # 동일 입력에 대한 캐시 조회
+        cache_key = self._cache_key(
+            prompt, system_prompt, temperature, max_tokens, image_path, image, cache, kwargs
+        )
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        model, content_parts, generation_config = self._prepare_request(
+            prompt, system_prompt, temperature, max_tokens, image_path, image, kwargs,
+            max_image_dim,
+        )
 
-        # 이미지 처리
         try:
-            from PIL import Image  # type: ignore
-        except ImportError:
-            raise ImportError(
-                "PIL (Pillow) 패키지가 설치되지 않았습니다. "
-                "이미지 처리를 위해 다음 명령어로 설치하세요: pip install Pillow"
+            response = model.generate_content(
+                content_parts,
+                generation_config=generation_config,
             )
+            response_text = self._parse_response(response)
+        except Exception as e:  # pragma: no cover - 외부 API 예외
+            raise RuntimeError(f"Gemini API 호출 중 오류 발생: {str(e)}")
 
-        content_parts: list[Union[str, Any]] = [prompt]
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response_text)
+        return response_text
 
-        # image_path가 빈 문자열이거나 None이 아닌 경우만 처리
-        if image_path and str(image_path).strip():
-            try:
-                # URL인 경우 requests로 다운로드 시도
-                if str(image_path).startswith(("http://", "https://")):
-                    try:
-                        import requests
-                        from io import BytesIO
-
-                        headers = {
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-                        }
-                        response = requests.get(image_path, headers=headers, timeout=10)
-                        response.raise_for_status()
-                        img = Image.open(BytesIO(response.content))
-                        content_parts.append(img)
-                    except ImportError:
-                        raise ValueError(
-                            "URL 이미지를 사용하려면 requests 패키지가 필요합니다: pip install requests"
-                        )
-                    except Exception as e:
-                        raise ValueError(f"URL에서 이미지를 다운로드하는데 실패했습니다: {e}")
-                else:
-                    # 파일 경로에서 이미지 로드
-                    img_path = Path(image_path)
-                    if not img_path.exists():
-                        raise ValueError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-                    img = Image.open(img_path)
-                    content_parts.append(img)
-            except Exception as e:
-                raise ValueError(f"이미지 파일 로드 실패 ({image_path}): {e}")
+    async def call_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        image_path: Optional[Union[str, list[str]]] = None,
+        image: Optional[Any] = None,
+        cache: Optional[bool] = None,
+        max_image_dim: Optional[int] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Gemini API 비동기 호출 (generate_content_async 사용)
+
+        인자와 반환값은 call()과 동일합니다. 여러 호출을 asyncio.gather로
+        동시에 보내면 왕복 시간이 겹쳐 전체 대기 시간이 줄어듭니다.
+        """
+        cache_key = self._cache_key(
+            prompt, system_prompt, temperature, max_tokens, image_path, image, cache, kwargs
+        )
+        if cache_key is not None:
+            cached = await self.response_cache.aget(cache_key)
+            if cached is not None:
+                return cached
+
+        prepare_args = (
+            prompt, system_prompt, temperature, max_tokens, image_path, image, kwargs,
+            max_image_dim,
+        )
+        if self._wants_image(image_path, image) or (
+            system_prompt and len(system_prompt) >= _CONTEXT_CACHE_MIN_CHARS
+        ):
+            # 이미지 다운로드/디코딩, 컨텍스트 캐시 생성은 블로킹 I/O이므로 이벤트 루프 밖에서 수행
+            model, content_parts, generation_config = await asyncio.to_thread(
+                self._prepare_request, *prepare_args
+            )
+        else:
+            # 텍스트 전용 + 짧은 system_prompt는 블로킹 작업이 없으므로 스레드 전환 생략
+            model, content_parts, generation_config = self._prepare_request(*prepare_args)
 
         try:
-            response = model.generate_content(
+            response = await model.generate_content_async(
                 content_parts,
                 generation_config=generation_config,
             )
+            response_text = self._parse_response(response)
+        except Exception as e:  # pragma: no cover - 외부 API 예외
+            raise RuntimeError(f"Gemini API 호출 중 오류 발생: {str(e)}")
 
-            # finish_reason 확인 (1=STOP, 2=MAX_TOKENS, 3=SAFETY, 4=RECITATION, 5=OTHER)
-            finish_reason = None
-            if getattr(response, "candidates", None) and len(response.candidates) > 0:
-                finish_reason = response.candidates[0].finish_reason
+        if cache_key is not None:
+            await self.response_cache.aset(cache_key, response_text)
+        return response_text
 
-                if finish_reason == 3:
-                    raise RuntimeError(
-                        "응답이 안전 필터링으로 차단되었습니다. 프롬프트를 수정해주세요."
-                    )
-                elif finish_reason == 4:
-                    raise RuntimeError(
-                        "응답이 인용 필터링으로 차단되었습니다. 프롬프트를 수정해주세요."
-                    )
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        image_path: Optional[Union[str, list[str]]] = None,
+        image: Optional[Any] = None,
+        cache: Optional[bool] = None,
+        max_image_dim: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Gemini API 스트리밍 호출 (generate_content(stream=True))
 
-            # 응답 텍스트 추출 시도
-            response_text: Optional[str] = None
-            try:
-                response_text = response.text  # type: ignore[assignment]
-            except (ValueError, AttributeError) as e:
-                # response.text 접근 실패 시 candidates에서 직접 추출 시도
-                if getattr(response, "candidates", None) and len(response.candidates) > 0:
-                    candidate = response.candidates[0]
-                    if getattr(candidate, "content", None) and candidate.content.parts:
-                        # parts에서 텍스트 추출
-                        text_parts: list[str] = []
-                        for part in candidate.content.parts:
-                            if hasattr(part, "text") and part.text:
-                                text_parts.append(part.text)
-                        if text_parts:
-                            response_text = "".join(text_parts)
-
-                if not response_text:
-                    # finish_reason에 따른 에러 메시지
-                    if finish_reason == 2:
-                        raise RuntimeError(
-                            "응답이 최대 토큰 수를 초과하여 잘렸습니다. max_tokens를 늘려주세요."
-                        )
-                    elif finish_reason:
-                        raise RuntimeError(
-                            "Gemini API가 유효한 응답을 반환하지 못했습니다. "
-                            f"(finish_reason: {finish_reason})"
-                        )
-                    else:
-                        raise RuntimeError(f"Gemini API 응답 처리 실패: {str(e)}")
-
-            if not response_text or not response_text.strip():
-                if finish_reason == 2:
-                    raise RuntimeError(
-                        "응답이 최대 토큰 수를 초과하여 잘렸습니다. max_tokens를 늘려주세요."
-                    )
-                elif finish_reason:
-                    raise RuntimeError(
-                        f"Gemini API가 빈 응답을 반환했습니다. (finish_reason: {finish_reason})"
-                    )
-                else:
-                    raise RuntimeError("Gemini API가 빈 응답을 반환했습니다.")
+        인자는 call()과 동일하며, 응답 텍스트를 생성되는 대로 조각(chunk) 단위로 yield 합니다.
+        캐시 hit이면 캐시된 전체 응답을 한 번에 yield 하고,
+        스트림이 끝까지 완료되면 전체 응답을 캐시에 저장합니다.
+        """
+        cache_key = self._cache_key(
+            prompt, system_prompt, temperature, max_tokens, image_path, image, cache, kwargs
+        )
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        model, content_parts, generation_config = self._prepare_request(
+            prompt, system_prompt, temperature, max_tokens, image_path, image, kwargs,
+            max_image_dim,
+        )
 
-            return response_text.strip()
+        chunks: list[str] = []
+        finish_reason = None
+        try:
+            response = model.generate_content(
+                content_parts,
+                generation_config=generation_config,
+                stream=True,
+            )
+            for chunk in response:
+                text, chunk_finish_reason, _ = self._extract_text(chunk)
+                if chunk_finish_reason:
+                    finish_reason = chunk_finish_reason
+                if text:
+                    chunks.append(text)
+                    yield text
         except Exception as e:  # pragma: no cover - 외부 API 예외
             raise RuntimeError(f"Gemini API 호출 중 오류 발생: {str(e)}")
 
+        response_text = "".join(chunks).strip()
+        if not response_text:
+            message = _EMPTY_FINISH_REASONS.get(finish_reason)
+            raise RuntimeError(message or "Gemini API가 빈 응답을 반환했습니다.")
+
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response_text)
+
     def call_with_json(
         self,
         prompt: str,
@@ -307,44 +914,23 @@ class LLMClient:
             **kwargs,
         )
 
-        # JSON 파싱 시도
-        try:
-            # 응답에서 JSON 부분만 추출 (마크다운 코드 블록 제거)
-            text = response_text.strip()
-            if text.startswith("```json"):
-                text = text[7:]  # ```json 제거
-            elif text.startswith("```"):
-                text = text[3:]  # ``` 제거
-
-            if text.endswith("```"):
-                text = text[:-3]  # ``` 제거
-
-            text = text.strip()
+        # 응답에서 JSON 부분만 추출 (마크다운 코드 블록 제거)
+        text = _FENCE_RE.sub("", response_text).strip()
 
-            # JSON이 중간에 잘린 경우 마지막 불완전한 키-값 쌍 제거
-            try:
-                return json.loads(text)
-            except json.JSONDecodeError as e:
-                # JSON이 불완전한 경우 재시도
-                if e.pos is not None:
-                    # 불완전한 부분 제거 후 재시도
-                    partial_text = text[: e.pos]
-                    # 마지막 불완전한 키-값 쌍 찾기
-                    last_comma = partial_text.rfind(",")
-                    last_brace = partial_text.rfind("}")
-                    if last_brace > last_comma:
-                        # 마지막 불완전한 키-값 쌍 제거
-                        partial_text = partial_text[: last_brace + 1]
-                        try:
-                            return json.loads(partial_text)
-                        except Exception:
-                            pass
-
-                # 모든 시도 실패 시 원본 오류 발생
-                raise ValueError(
-                    f"JSON 파싱 실패: {str(e)}\n응답 (처음 500자): {response_text[:500]}"
-                )
+        # JSON 뒤에 설명 등이 덧붙은 경우에도 첫 JSON 값만 파싱
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text)
+            return obj
         except json.JSONDecodeError as e:
+            # JSON이 중간에 잘린 경우 마지막 완전한 최상위 항목까지만 남기고 재시도
+            partial_text = _truncate_to_complete_json(text)
+            if partial_text is not None:
+                try:
+                    obj, _ = _JSON_DECODER.raw_decode(partial_text)
+                    return obj
+                except json.JSONDecodeError:
+                    pass
+
             raise ValueError(
                 f"JSON 파싱 실패: {str(e)}\n응답 (처음 500자): {response_text[:500]}"
             )
@@ -353,6 +939,10 @@ class LLMClient:
 # 싱글톤 인스턴스 (선택적 사용)
 _default_client: Optional[LLMClient] = None
 
+# 고정 모델 역할별 싱글톤 (model_name -> LLMClient)
+_clients: Dict[str, LLMClient] = {}
+_clients_lock = threading.Lock()
+
 
 def get_default_client() -> LLMClient:
     """기본 LLM 클라이언트 인스턴스 반환"""
@@ -362,3 +952,23 @@ def get_default_client() -> LLMClient:
     return _default_client
 
 
+def get_client(model: str) -> LLMClient:
+    """모델별 LLM 클라이언트 싱글톤 반환 (genai.configure / 모델 조회를 한 번만 수행)"""
+    client = _clients.get(model)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(model)
+            if client is None:
+                client = LLMClient(model=model)
+                _clients[model] = client
+    return client
+
+
+def get_flash_lite_client() -> LLMClient:
+    """gemini-2.5-flash-lite 클라이언트 (질문 정제 등 빠른 응답용)"""
+    return get_client("gemini-2.5-flash-lite")
+
+
+def get_flash_client() -> LLMClient:
+    """gemini-2.5-flash 클라이언트 (답변/요약 등 정확도가 중요한 작업용)"""
+    return get_client("gemini-2.5-flash")
@@ -0,0 +1,80 @@
+"""
+Question Pipeline Module
+
+질문 정제(clean)와 답변 생성(answer)을 동시에 실행하는 비동기 파이프라인
+정제 결과는 화면 표시용이므로 답변은 원본 질문으로 바로 생성을 시작해
+두 번의 Gemini 왕복을 겹쳐서 기다림
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from asgiref.sync import sync_to_async
+
+from .answer import aanswer_question
+from .clean import aclean_question
+from .prompt_templates import get_subject_info
+
+
+async def process_question(
+    question: str,
+    image_path: Optional[Union[str, Path]] = None,
+    image: Optional[Any] = None,
+    lecture_context: Optional[str] = None,
+    subject_name: Optional[str] = None,
+    on_cleaned: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> tuple[str, str]:
+    """
+    질문 정제와 답변 생성을 동시에 수행합니다.
+
+    Args:
+        question: 학생의 원본 질문
+        image_path: 교수님 화면 캡쳐 이미지 파일 경로 또는 URL (선택)
+        image: PIL Image 객체 또는 이미지 데이터 (선택)
+        lecture_context: 강의 맥락/컨텍스트 (선택)
+        subject_name: 과목명 (선택)
+        on_cleaned: 정제 결과가 먼저 나오면 호출할 async 콜백 (예: WebSocket 전송)
+
+    Returns:
+        (정제된 질문, 답변) 튜플
+
+    Raises:
+        ValueError: question이 비어있는 경우
+        RuntimeError: LLM API 호출 실패 시
+    """
+    # 과목 정보는 정제/답변 양쪽에서 쓰이므로 한 번만 조회해서 전달
+    subject_info = await sync_to_async(get_subject_info)(subject_name)
+
+    clean_task = asyncio.create_task(
+        aclean_question(
+            question,
+            image_path=image_path,
+            image=image,
+            subject_name=subject_name,
+            subject_info=subject_info,
+        )
+    )
+    answer_task = asyncio.create_task(
+        aanswer_question(
+            question,
+            lecture_context=lecture_context,
+            image_path=image_path,
+            image=image,
+            subject_name=subject_name,
+            subject_info=subject_info,
+        )
+    )
+
+    try:
+        if on_cleaned is not None:
+            # 정제 결과는 답변을 기다리지 않고 바로 전달
+            await on_cleaned(await clean_task)
+        cleaned, answer = await asyncio.gather(clean_task, answer_task)
+    except BaseException:
+        # 한쪽이 실패하면 나머지 작업도 취소
+        clean_task.cancel()
+        answer_task.cancel()
+        raise
+
+    return cleaned, answer
@@ -4,12 +4,26 @@ Prompt Templates Module
 LLM에 사용할 프롬프트 템플릿 정의
 """
 
+import functools
+import logging
+import string
+import time
 from typing import Optional
 from django.db.models import Q
 
+logger = logging.getLogger(__name__)
+
+# 과목 정보 캐시
+# - 프로세스 내 LRU: _SUBJECT_INFO_LOCAL_TTL 초 단위 구간마다 자연 만료 (다른 프로세스의 변경 반영)
+# - Redis(Django cache): 워커 간 공유, 변경 시 세대(generation) 값을 올려 무효화
+_SUBJECT_INFO_LOCAL_TTL = 300
+_SUBJECT_INFO_CACHE_TTL = 600
+_SUBJECT_INFO_GEN_KEY = "subjinfo:gen"
+
+
 def get_subject_info(subject_name: Optional[str] = None) -> str:
     """
-    과목명/코드에 해당하는 과목 정보를 DB에서 조회해 반환합니다.
+    과목명/코드에 해당하는 과목 정보를 DB에서 조회해 반환합니다. (결과는 캐시)
 
     Args:
         subject_name: 과목 코드 또는 이름 (예: "COSE213", "자료구조" 등)
@@ -21,14 +35,46 @@ def get_subject_info(subject_name: Optional[str] = None) -> str:
     if not subject_name or not subject_name.strip():
         return ""
 
-    subject_name = subject_name.strip()
+    return _get_subject_info_cached(
+        subject_name.strip().lower(),
+        int(time.monotonic() // _SUBJECT_INFO_LOCAL_TTL),
+    )
+
 
+def _resolve_subject_info(subject_name: Optional[str], subject_info: Optional[str]) -> str:
+    """이미 조회한 과목 정보(subject_info)가 있으면 그대로, 없으면 subject_name으로 조회"""
+    if subject_info is not None:
+        return subject_info
+    return get_subject_info(subject_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_subject_info_cached(normalized_name: str, _bucket: int) -> str:
+    """get_subject_info의 캐시 계층 (_bucket은 프로세스 내 캐시 만료용 시간 구간)"""
+    from django.core.cache import cache
+
+    try:
+        generation = cache.get_or_set(_SUBJECT_INFO_GEN_KEY, 1, timeout=None)
+        return cache.get_or_set(
+            f"subjinfo:{generation}:{normalized_name}",
+            lambda: _load_subject_info(normalized_name),
+            _SUBJECT_INFO_CACHE_TTL,
+        )
+    except Exception as e:
+        logger.warning("subject info cache unavailable: %s", e)
+        return _load_subject_info(normalized_name)
+
+
+def _load_subject_info(subject_name: str) -> str:
+    """과목 정보를 DB에서 조회"""
     from ..models import SubjectInfo
 
     try:
+        # 모델 인스턴스 생성 없이 필요한 컬럼만 조회
         subject = (
             SubjectInfo.objects.filter(is_active=True)
             .filter(Q(code__iexact=subject_name) | Q(name__iexact=subject_name))
+            .values("name", "description")
             .first()
         )
     except Exception:
@@ -37,16 +83,94 @@ def get_subject_info(subject_name: Optional[str] = None) -> str:
     if not subject:
         return ""
     
-    # 과목명(subject.name)과 설명을 함께 반환
+    # 과목명(name)과 설명을 함께 반환
     result_parts = []
-    if subject.name:
-        result_parts.append(f"과목명: {subject.name}")
-    if subject.description:
-        result_parts.append(subject.description)
+    if subject["name"]:
+        result_parts.append(f"과목명: {subject['name']}")
+    if subject["description"]:
+        result_parts.append(subject["description"])
     
     return "\n".join(result_parts) if result_parts else "" # "name:description"꼴로 반환
 
 
+def invalidate_subject_info_cache() -> None:
+    """
+    과목 정보 캐시 무효화 (SubjectInfo 변경 시 signals에서 호출)
+
+    현재 프로세스의 캐시는 즉시 비우고, 다른 워커는 Redis 세대 값 변경으로
+    프로세스 내 캐시 구간이 끝나는 대로 새 값을 읽습니다.
+    """
+    _get_subject_info_cached.cache_clear()
+
+    from django.core.cache import cache
+
+    try:
+        cache.incr(_SUBJECT_INFO_GEN_KEY)
+    except ValueError:
+        # 세대 키가 아직 없으면 새로 생성 (기존 항목과 겹치지 않도록 2부터)
+        cache.set(_SUBJECT_INFO_GEN_KEY, 2, timeout=None)
+    except Exception as e:
+        logger.warning("subject info cache invalidation failed: %s", e)
+
+
+class _CompiledTemplate:
+    """
+    str.format 형식 템플릿을 (리터럴 조각, 슬롯 이름) 목록으로 미리 파싱해 둔 렌더러
+
+    render()는 조각과 값을 순서대로 "".join 하므로 호출마다 템플릿을 다시 파싱하지 않습니다.
+    fixed로 준 슬롯은 컴파일 시점에 리터럴로 합쳐지므로 render()에는 나머지 슬롯만 넘기면 됩니다.
+    단순 {name} 슬롯만 지원합니다. (형식 지정자/변환 불가)
+    """
+
+    __slots__ = ("template", "_parts")
+
+    def __init__(self, template: str, **fixed: str):
+        self.template = template
+        parts: list[tuple[str, Optional[str]]] = []
+        literal_buf = ""
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+            literal_buf += literal
+            if field_name is None:
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                raise ValueError(f"지원하지 않는 템플릿 슬롯입니다: {{{field_name}}}")
+            if field_name in fixed:
+                literal_buf += fixed[field_name]
+            else:
+                parts.append((literal_buf, field_name))
+                literal_buf = ""
+        if literal_buf:
+            parts.append((literal_buf, None))
+        self._parts = tuple(parts)
+
+    def render(self, **values: object) -> str:
+        out: list[str] = []
+        append = out.append
+        for literal, field_name in self._parts:
+            append(literal)
+            if field_name is not None:
+                append(str(values[field_name]))
+        return "".join(out)
+
+
+def _compile_subject_variants(
+    template: str, subject_header: str
+) -> dict[bool, _CompiledTemplate]:
+    """
+    {subject_section} 슬롯이 있는 system 템플릿을 과목 정보 유무별로 미리 컴파일
+
+    과목 정보가 있으면 "{subject_header}{subject_info}\n\n"이 들어가는 버전,
+    없으면 섹션이 빠진 버전을 만들어 {True: ..., False: ...}로 반환합니다.
+    (렌더링 시 섹션 문자열을 따로 만들지 않고 subject_info를 바로 이어 붙임)
+    """
+    return {
+        True: _CompiledTemplate(
+            template.replace("{subject_section}", subject_header + "{subject_info}\n\n")
+        ),
+        False: _CompiledTemplate(template, subject_section=""),
+    }
+
+
 # 질문 알잘딱 프롬프트 템플릿
 CLEAN_QUESTION_SYSTEM_PROMPT_TEMPLATE = """당신은 학생 질문을 정제하는 전문가입니다. 어떠한 감정도 배제한 채로
 학생이 작성한 질문에서 오타, 문법 오류, 불필요한 표현, 저속한 표현을 수정하고 명확하게 만들어야 합니다.
@@ -131,6 +255,16 @@ SUMMARIZE_IMAGE_USER_TEMPLATE = """제공된 교수님 화면 캡쳐 이미지
 이미지에 표시된 강의 내용, 코드, 수식, 화면 내용 등을 정확하게 파악하여 핵심 내용만 간결하게 1줄로 요약하세요.
 중요한 내용을 제목 형식으로 간결하게 요약하세요."""
 
+SUMMARIZE_IMAGES_BATCH_USER_TEMPLATE = """제공된 교수님 화면 캡쳐 이미지 {count}장을 각각 1줄로 요약해주세요.
+
+이미지는 제공된 순서대로 [1]부터 [{count}]까지 번호가 매겨져 있습니다.
+각 이미지에 표시된 강의 내용, 코드, 수식, 화면 내용 등을 정확하게 파악하여 핵심 내용만 간결하게 1줄로 요약하세요.
+다른 설명 없이 아래 형식으로 이미지마다 한 줄씩 출력하세요.
+
+[1] 첫 번째 이미지 요약
+[2] 두 번째 이미지 요약
+..."""
+
 #교수 빙의 프롬프트 템플릿
 ANSWER_QUESTION_SYSTEM_PROMPT_TEMPLATE = """당신은 경험이 풍부하고 친절한 대학교수입니다.
 {subject_section}당신은 이 과목의 전문가이며, 학생들의 질문에 대해 명확하고 교육적으로 답변해야 합니다.
@@ -192,10 +326,54 @@ ANSWER_QUESTION_WITH_CONTEXT_AND_IMAGE_TEMPLATE = """학생이 다음과 같은
 답변은 최대한 딱딱하고 객관적으로 작성하세요. 불필요한 수식어나 감정 표현 없이 핵심 내용만 간결하고 명확하게 전달하세요. 강의 맥락과 이미지 내용을 모두 고려하여 답변하되, 필요시 예시를 포함하되 격려나 친근한 표현은 최소화하고 사실과 정보에 집중하세요."""
 
 
+# 모듈 로드 시 한 번만 파싱해 두는 템플릿 (렌더링 시 str.format 재파싱 없음)
+# - DETECT_QUESTION_USER_TEMPLATE은 JSON 예시의 중괄호가 포함되어 있어 제외
+_CLEAN_QUESTION_SYSTEM_PROMPTS = _compile_subject_variants(
+    CLEAN_QUESTION_SYSTEM_PROMPT_TEMPLATE, "강의 과목 정보:\n"
+)
+_CLEAN_QUESTION_USER = _CompiledTemplate(CLEAN_QUESTION_USER_TEMPLATE, image_instruction="")
+_CLEAN_QUESTION_WITH_IMAGE = _CompiledTemplate(CLEAN_QUESTION_WITH_IMAGE_TEMPLATE)
+_SUMMARIZE_LECTURE_USER = _CompiledTemplate(SUMMARIZE_LECTURE_USER_TEMPLATE)
+_SUMMARIZE_IMAGE_SYSTEM_PROMPTS = _compile_subject_variants(
+    SUMMARIZE_IMAGE_SYSTEM_PROMPT_TEMPLATE, "강의 과목 정보:\n"
+)
+_SUMMARIZE_IMAGES_BATCH_USER = _CompiledTemplate(SUMMARIZE_IMAGES_BATCH_USER_TEMPLATE)
+_ANSWER_QUESTION_SYSTEM_PROMPTS = _compile_subject_variants(
+    ANSWER_QUESTION_SYSTEM_PROMPT_TEMPLATE, "당신이 가르치는 과목은 다음과 같습니다:\n\n과목: "
+)
+_ANSWER_QUESTION_USER = _CompiledTemplate(
+    ANSWER_QUESTION_USER_TEMPLATE, context_section="", image_instruction=""
+)
+_ANSWER_QUESTION_WITH_CONTEXT = _CompiledTemplate(
+    ANSWER_QUESTION_WITH_CONTEXT_TEMPLATE, image_instruction=""
+)
+_ANSWER_QUESTION_WITH_IMAGE = _CompiledTemplate(
+    ANSWER_QUESTION_WITH_IMAGE_TEMPLATE, context_section=""
+)
+_ANSWER_QUESTION_WITH_CONTEXT_AND_IMAGE = _CompiledTemplate(
+    ANSWER_QUESTION_WITH_CONTEXT_AND_IMAGE_TEMPLATE
+)
+
+# has_image -> 질문 정제 user 템플릿
+_CLEAN_USER_TEMPLATES = {
+    False: _CLEAN_QUESTION_USER,
+    True: _CLEAN_QUESTION_WITH_IMAGE,
+}
+
+# (has_image, has_context) -> 질문 답변 user 템플릿
+_ANSWER_USER_TEMPLATES = {
+    (False, False): _ANSWER_QUESTION_USER,
+    (False, True): _ANSWER_QUESTION_WITH_CONTEXT,
+    (True, False): _ANSWER_QUESTION_WITH_IMAGE,
+    (True, True): _ANSWER_QUESTION_WITH_CONTEXT_AND_IMAGE,
+}
+
+
 def get_clean_question_prompt(
     question: str,
     has_image: bool = False,
     subject_name: Optional[str] = None,
+    subject_info: Optional[str] = None,
 ) -> tuple[str, str]:
     """
     질문 정제 프롬프트 생성
@@ -204,33 +382,26 @@ def get_clean_question_prompt(
         question: 정제할 학생 질문
         has_image: 이미지가 제공되는지 여부
         subject_name: 과목명 (예: "자료구조", "알고리즘" 등) (선택)
+        subject_info: 이미 조회한 get_subject_info() 결과 (있으면 DB/캐시 조회 생략)
 
     Returns:
         (system_prompt, user_prompt) 튜플
     """
-    # 과목 정보 섹션 생성
-    subject_info = get_subject_info(subject_name)
-    if subject_info:
-        subject_section = f"강의 과목 정보:\n{subject_info}\n\n"
-    else:
-        subject_section = ""
-
-    system_prompt = CLEAN_QUESTION_SYSTEM_PROMPT_TEMPLATE.format(
-        subject_section=subject_section
+    return (
+        _get_clean_system(_resolve_subject_info(subject_name, subject_info)),
+        _get_clean_user(question, has_image),
     )
 
-    if has_image:
-        user_prompt = CLEAN_QUESTION_WITH_IMAGE_TEMPLATE.format(question=question)
-    else:
-        user_prompt = CLEAN_QUESTION_USER_TEMPLATE.format(
-            question=question,
-            image_instruction="",
-        )
 
-    return (
-        system_prompt,
-        user_prompt,
-    )
+@functools.lru_cache(maxsize=64)
+def _get_clean_system(subject_info: str) -> str:
+    """질문 정제 system_prompt (과목 정보 문자열별로 캐시)"""
+    return _CLEAN_QUESTION_SYSTEM_PROMPTS[bool(subject_info)].render(subject_info=subject_info)
+
+
+def _get_clean_user(question: str, has_image: bool) -> str:
+    """질문 정제 user_prompt"""
+    return _CLEAN_USER_TEMPLATES[bool(has_image)].render(question=question)
 
 
 def get_detect_question_prompt(text: str) -> tuple[str, str]:
@@ -261,44 +432,64 @@ def get_summarize_lecture_prompt(lecture_content: str) -> tuple[str, str]:
     """
     return (
         SUMMARIZE_LECTURE_SYSTEM_PROMPT,
-        SUMMARIZE_LECTURE_USER_TEMPLATE.format(lecture_content=lecture_content),
+        _SUMMARIZE_LECTURE_USER.render(lecture_content=lecture_content),
     )
 
 
-def get_summarize_image_prompt(subject_name: Optional[str] = None) -> tuple[str, str]:
+def get_summarize_image_prompt(
+    subject_name: Optional[str] = None,
+    subject_info: Optional[str] = None,
+) -> tuple[str, str]:
     """
     이미지 요약 프롬프트 생성
 
     Args:
         subject_name: 과목명 (예: "자료구조", "알고리즘" 등) (선택)
+        subject_info: 이미 조회한 get_subject_info() 결과 (있으면 DB/캐시 조회 생략)
 
     Returns:
         (system_prompt, user_prompt) 튜플
     """
-    # 과목 정보 섹션 생성
-    subject_info = get_subject_info(subject_name)
-    if subject_info:
-        subject_section = f"강의 과목 정보:\n{subject_info}\n\n"
-    else:
-        subject_section = ""
-
-    system_prompt = SUMMARIZE_IMAGE_SYSTEM_PROMPT_TEMPLATE.format(
-        subject_section=subject_section
+    return (
+        _get_summarize_image_system(_resolve_subject_info(subject_name, subject_info)),
+        SUMMARIZE_IMAGE_USER_TEMPLATE,
     )
 
-    user_prompt = SUMMARIZE_IMAGE_USER_TEMPLATE
 
+def get_summarize_images_batch_prompt(
+    count: int,
+    subject_name: Optional[str] = None,
+    subject_info: Optional[str] = None,
+) -> tuple[str, str]:
+    """
+    여러 이미지를 한 번에 요약하는 배치 프롬프트 생성
+
+    Args:
+        count: 이미지 수 (응답은 [1]..[count] 번호로 구분)
+        subject_name: 과목명 (선택)
+        subject_info: 이미 조회한 get_subject_info() 결과 (선택)
+
+    Returns:
+        (system_prompt, user_prompt) 튜플
+    """
     return (
-        system_prompt,
-        user_prompt,
+        _get_summarize_image_system(_resolve_subject_info(subject_name, subject_info)),
+        _SUMMARIZE_IMAGES_BATCH_USER.render(count=count),
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _get_summarize_image_system(subject_info: str) -> str:
+    """이미지 요약 system_prompt (과목 정보 문자열별로 캐시)"""
+    return _SUMMARIZE_IMAGE_SYSTEM_PROMPTS[bool(subject_info)].render(subject_info=subject_info)
+
+
 def get_answer_question_prompt(
     question: str,
     lecture_context: Optional[str] = None,
     has_image: bool = False,
     subject_name: Optional[str] = None,
+    subject_info: Optional[str] = None,
 ) -> tuple[str, str]:
     """
     질문 답변 프롬프트 생성 (교수님 역할)
@@ -308,52 +499,32 @@ def get_answer_question_prompt(
         lecture_context: 강의 맥락/컨텍스트 (선택)
         has_image: 이미지가 제공되는지 여부
         subject_name: 과목명 (예: "자료구조", "알고리즘" 등) (선택)
+        subject_info: 이미 조회한 get_subject_info() 결과 (있으면 DB/캐시 조회 생략)
 
     Returns:
         (system_prompt, user_prompt) 튜플
     """
-    # 과목 정보 섹션 생성
-    subject_info = get_subject_info(subject_name)
-    if subject_info:
-        subject_section = (
-            f"당신이 가르치는 과목은 다음과 같습니다:\n\n과목: {subject_info}\n\n"
-        )
-    else:
-        subject_section = ""
-
-    system_prompt = ANSWER_QUESTION_SYSTEM_PROMPT_TEMPLATE.format(
-        subject_section=subject_section
-    )
-
-    if has_image:
-        if lecture_context:
-            user_prompt = ANSWER_QUESTION_WITH_CONTEXT_AND_IMAGE_TEMPLATE.format(
-                question=question,
-                lecture_context=lecture_context,
-            )
-        else:
-            user_prompt = ANSWER_QUESTION_WITH_IMAGE_TEMPLATE.format(
-                question=question,
-                context_section="",
-            )
-    else:
-        if lecture_context:
-            user_prompt = ANSWER_QUESTION_WITH_CONTEXT_TEMPLATE.format(
-                question=question,
-                lecture_context=lecture_context,
-                image_instruction="",
-            )
-        else:
-            user_prompt = ANSWER_QUESTION_USER_TEMPLATE.format(
-                question=question,
-                context_section="",
-                image_instruction="",
-            )
-
     return (
-        system_prompt,
-        user_prompt,
+        _get_answer_system(_resolve_subject_info(subject_name, subject_info)),
+        _get_answer_user(question, lecture_context, has_image),
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _get_answer_system(subject_info: str) -> str:
+    """질문 답변 system_prompt (과목 정보 문자열별로 캐시)"""
+    return _ANSWER_QUESTION_SYSTEM_PROMPTS[bool(subject_info)].render(subject_info=subject_info)
 
+
+def _get_answer_user(
+    question: str,
+    lecture_context: Optional[str],
+    has_image: bool,
+) -> str:
+    """질문 답변 user_prompt"""
+    if lecture_context:
+        return _ANSWER_USER_TEMPLATES[(bool(has_image), True)].render(
+            question=question,
+            lecture_context=lecture_context,
+        )
+    return _ANSWER_USER_TEMPLATES[(bool(has_image), False)].render(question=question)
@@ -0,0 +1,197 @@
+"""
+Semantic Cache Module
+
+질문 정제(clean_question) 결과를 문장 임베딩 기준으로 재사용하기 위한 캐시
+표현만 다른 같은 의미의 질문("리스트와 튜플 차이?" / "리스트랑 튜플 다른점")에 대해
+Gemini 호출 없이 이전 정제 결과를 반환
+
+선택 의존성: sentence-transformers, faiss-cpu
+환경변수 LECTURE_AI_SEMANTIC_CACHE=true 일 때만 활성화
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import numpy as np  # type: ignore
+    import faiss  # type: ignore
+    from sentence_transformers import SentenceTransformer  # type: ignore
+except ImportError:
+    np = None
+    faiss = None
+    SentenceTransformer = None
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".semantic_cache"
+
+
+class SemanticCache:
+    """FAISS 내적(정규화 벡터 → 코사인 유사도) 인덱스 기반 의미 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        model_name: str = DEFAULT_MODEL_NAME,
+        threshold: float = DEFAULT_THRESHOLD,
+        persist_every: int = 20,
+    ):
+        """
+        SemanticCache 초기화
+
+        Args:
+            cache_dir: 인덱스/메타데이터를 저장할 디렉토리
+            model_name: sentence-transformers 임베딩 모델명
+            threshold: 캐시 hit로 판단할 최소 코사인 유사도
+            persist_every: 몇 건 추가될 때마다 디스크에 저장할지
+        """
+        if SentenceTransformer is None:
+            raise ImportError(
+                "semantic cache를 사용하려면 다음 패키지가 필요합니다: "
+                "pip install sentence-transformers faiss-cpu"
+            )
+
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.threshold = threshold
+        self.persist_every = persist_every
+
+        self._lock = threading.Lock()
+        self._model = SentenceTransformer(model_name)
+        self._dim = self._model.get_sentence_embedding_dimension()
+        self._pending = 0
+
+        # (cleaned_text, subject_name, has_image) - 인덱스 순서와 동일
+        self._entries: list[tuple[str, Optional[str], bool]] = []
+        self._index = faiss.IndexFlatIP(self._dim)
+        self._load()
+
+    @property
+    def _index_path(self) -> Path:
+        return self.cache_dir / "index.faiss"
+
+    @property
+    def _entries_path(self) -> Path:
+        return self.cache_dir / "entries.json"
+
+    def _load(self) -> None:
+        if not (self._index_path.exists() and self._entries_path.exists()):
+            return
+        try:
+            index = faiss.read_index(str(self._index_path))
+            entries = json.loads(self._entries_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning("semantic cache load failed, starting empty: %s", e)
+            return
+        if index.d != self._dim or index.ntotal != len(entries):
+            logger.warning("semantic cache on disk does not match model, ignoring")
+            return
+        self._index = index
+        self._entries = [tuple(e) for e in entries]
+
+    def _persist(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        faiss.write_index(self._index, str(self._index_path))
+        self._entries_path.write_text(
+            json.dumps(self._entries, ensure_ascii=False), encoding="utf-8"
+        )
+        self._pending = 0
+
+    def flush(self) -> None:
+        """추가된 항목이 있으면 디스크에 저장"""
+        with self._lock:
+            if self._pending:
+                try:
+                    self._persist()
+                except Exception as e:
+                    logger.warning("semantic cache persist failed: %s", e)
+
+    def encode(self, text: str) -> Any:
+        """질문 임베딩 (L2 정규화된 float32 벡터)"""
+        emb = self._model.encode(text, normalize_embeddings=True)
+        return np.asarray(emb, dtype="float32")
+
+    def search(
+        self,
+        embedding: Any,
+        subject_name: Optional[str] = None,
+        has_image: bool = False,
+        k: int = 4,
+    ) -> Optional[str]:
+        """
+        유사한 질문의 정제 결과 조회
+
+        Args:
+            embedding: encode()로 얻은 임베딩
+            subject_name: 과목명 (같은 과목의 항목만 hit 처리)
+            has_image: 이미지 포함 여부 (같은 값의 항목만 hit 처리)
+            k: 조회할 최근접 후보 수
+
+        Returns:
+            캐시된 정제 결과 (없으면 None)
+        """
+        with self._lock:
+            if self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(embedding[None, :], min(k, self._index.ntotal))
+
+            for score, idx in zip(scores[0], ids[0]):
+                if idx < 0 or score <= self.threshold:
+                    break
+                cleaned, entry_subject, entry_has_image = self._entries[idx]
+                if entry_subject == subject_name and entry_has_image == has_image:
+                    return cleaned
+        return None
+
+    def add(
+        self,
+        embedding: Any,
+        cleaned_text: str,
+        subject_name: Optional[str] = None,
+        has_image: bool = False,
+    ) -> None:
+        """정제 결과를 캐시에 추가"""
+        with self._lock:
+            self._index.add(embedding[None, :])
+            self._entries.append((cleaned_text, subject_name, has_image))
+            self._pending += 1
+            if self._pending >= self.persist_every:
+                try:
+                    self._persist()
+                except Exception as e:
+                    logger.warning("semantic cache persist failed: %s", e)
+
+
+# 싱글톤 인스턴스 (비활성/의존성 없음이면 None)
+_semantic_cache: Optional[SemanticCache] = None
+_semantic_cache_checked = False
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """환경변수로 활성화된 경우에만 SemanticCache 인스턴스 반환"""
+    global _semantic_cache, _semantic_cache_checked
+    if _semantic_cache_checked:
+        return _semantic_cache
+
+    _semantic_cache_checked = True
+    if os.getenv("LECTURE_AI_SEMANTIC_CACHE", "false").lower() != "true":
+        return None
+
+    try:
+        _semantic_cache = SemanticCache(
+            cache_dir=os.getenv("LECTURE_AI_SEMANTIC_CACHE_DIR") or None,
+            threshold=float(os.getenv("LECTURE_AI_SEMANTIC_CACHE_THRESHOLD", DEFAULT_THRESHOLD)),
+        )
+    except Exception as e:
+        logger.warning("semantic cache disabled: %s", e)
+        _semantic_cache = None
+    else:
+        atexit.register(_semantic_cache.flush)
+    return _semantic_cache
@@ -9,7 +9,9 @@ from typing import Optional, Union, Any
 from pathlib import Path
 import logging
 
-from .llm_client import LLMClient, get_default_client
+from ._util import normalize_image_path
+from .batcher import SUMMARY_MAX_IMAGE_DIM, ImageJob, get_image_batcher
+from .llm_client import LLMClient, get_flash_client
 from .prompt_templates import get_summarize_image_prompt
 
 
@@ -22,6 +24,7 @@ def summarize_image(
     llm_client: Optional[LLMClient] = None,
     temperature: float = 0.3,
     subject_name: Optional[str] = None,
+    subject_info: Optional[str] = None,
 ) -> str:
     """
     교수님이 중요하다고 마크한 화면 이미지를 LLM에 넣어 1줄로 요약합니다.
@@ -32,6 +35,7 @@ def summarize_image(
         llm_client: LLM 클라이언트 인스턴스 (없으면 기본 인스턴스 사용)
         temperature: 모델 온도 (기본값: 0.3, 낮을수록 일관성 있음)
         subject_name: 과목명 (예: "자료구조", "알고리즘" 등) (선택)
+        subject_info: 이미 조회한 과목 정보 (선택, 있으면 과목 정보 조회 생략)
 
     Returns:
         1줄 요약 문자열
@@ -56,32 +60,18 @@ def summarize_image(
     if llm_client is None:
         # summarize 함수는 flash 모델 사용 (정확도가 중요하므로)
         logger.info(
-            "[AI DEBUG] summarize_image: creating default LLMClient (gemini-2.5-flash)"
-        )
-        llm_client = LLMClient(model="gemini-2.5-flash")
-
-    # 이미지 경로를 문자열로 변환
-    img_path_str: Optional[str] = None
-
-    # image_path가 빈 문자열이거나 None인 경우 처리
-    if image_path:
-        if isinstance(image_path, str):
-            img_path_str = image_path.strip()
-        else:
-            img_path_str = str(image_path)
-
-        if not img_path_str:  # 빈 문자열인 경우
-            img_path_str = None
-            if not image:
-                raise ValueError("image_path 또는 image 중 하나는 필수입니다.")
-
-    if img_path_str:
-        img_path_str = (
-            str(image_path) if isinstance(image_path, Path) else img_path_str
+            "[AI DEBUG] summarize_image: using shared LLMClient (gemini-2.5-flash)"
         )
+        llm_client = get_flash_client()
+
+    # 이미지 경로를 문자열로 변환 (빈 문자열이면 None)
+    img_path_str = normalize_image_path(image_path)
+    if not img_path_str and not image:
+        raise ValueError("image_path 또는 image 중 하나는 필수입니다.")
 
     system_prompt, user_prompt = get_summarize_image_prompt(
         subject_name=subject_name,
+        subject_info=subject_info,
     )
 
     # 이미지 요약을 위한 충분한 토큰 수 설정
@@ -99,6 +89,7 @@ def summarize_image(
             #max_tokens=max_output_tokens,
             image_path=img_path_str,
             image=image,
+            max_image_dim=SUMMARY_MAX_IMAGE_DIM,
         )
         summary = summary.strip()
         logger.info(
@@ -111,6 +102,34 @@ def summarize_image(
         raise RuntimeError(f"이미지 요약 중 오류 발생: {str(e)}")
 
 
+async def asummarize_image(
+    image_path: Union[str, Path],
+    subject_name: Optional[str] = None,
+) -> str:
+    """
+    summarize_image()의 비동기 버전 - 동시에 들어온 요청은 모아서 한 번에 요약합니다.
+
+    짧은 시간(기본 30ms) 안에 들어온 요청들을 하나의 Gemini 호출로 묶고
+    응답을 이미지별로 나눠 반환합니다. (ImageSummaryBatcher 참고)
+
+    Args:
+        image_path: 교수님 화면 캡쳐 이미지 파일 경로 또는 URL
+        subject_name: 과목명 (선택)
+
+    Returns:
+        1줄 요약 문자열
+
+    Raises:
+        ValueError: image_path가 없는 경우
+        RuntimeError: LLM API 호출 실패 시
+    """
+    img_path_str = normalize_image_path(image_path)
+    if not img_path_str:
+        raise ValueError("image_path는 필수입니다.")
+
+    return await get_image_batcher().submit(ImageJob(img_path_str, subject_name))
+
+
 # if __name__ == "__main__":  # pragma: no cover - 로컬 테스트 전용
 #     # 로컬 테스트
 #     test_image_path = "path/to/test/image.png"
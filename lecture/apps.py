@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class LectureConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'lecture'
+
+    def ready(self):
+        # 모델 signal 핸들러 등록
+        from . import signals  # noqa: F401
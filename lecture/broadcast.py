@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional
+
+from channels.layers import get_channel_layer
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
+
+logger = logging.getLogger(__name__)
+
+# 피드백 프레임을 모아서 보내는 구간 (초)
+FEEDBACK_COALESCE_WINDOW = 0.1
+
+
+def _dumps(data: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class Broadcaster:
+    """
+    HTTP 요청 스레드에서 WebSocket 그룹 메시지를 보내는 백그라운드 sender.
+
+    - 전용 이벤트 루프를 데몬 스레드에서 하나 돌리고, send()는 코루틴을 넘기기만 하고 바로 반환
+      (요청마다 async_to_sync로 루프를 전환하고 Redis 왕복을 기다리지 않음)
+    - 같은 send()로 넘긴 여러 그룹 메시지는 한 번에 전송
+      (PipelinedRedisChannelLayer.group_send_many, 그 외 레이어는 asyncio.gather)
+    - 전송 실패는 응답에 영향을 주지 않고 로그만 남김
+    - 피드백처럼 몰려서 들어오는 이벤트는 send_feedback()으로 그룹별 짧은 구간 단위로 묶어서 전송
+    """
+
+    def __init__(self, feedback_window: float = FEEDBACK_COALESCE_WINDOW):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.feedback_window = feedback_window
+        self._feedback_pending: dict[str, list[dict]] = {}
+        self._feedback_lock = threading.Lock()
+
+    def send(self, messages: list[tuple[str, dict]]) -> Future:
+        """(group, message) 목록을 비동기로 전송 (완료를 기다리지 않음)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self._send_all(messages), self._get_loop()
+        )
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def send_feedback(self, group: str, item: dict) -> None:
+        """
+        피드백 이벤트(item: feedback_type, created_at)를 그룹별로 feedback_window 동안 모아서 전송.
+
+        - 구간 안에 1건이면 기존과 같은 "feedback" 프레임
+        - 여러 건이면 "feedback_batch" 프레임 하나 ({"event": "feedback_batch", "events": [...]})
+        (프로세스별로 모으므로 uvicorn 워커 수만큼의 프레임으로 줄어듦)
+        """
+        with self._feedback_lock:
+            pending = self._feedback_pending.get(group)
+            if pending is not None:
+                pending.append(item)
+                return
+            self._feedback_pending[group] = [item]
+
+        # 그룹의 첫 이벤트일 때만 flush 예약
+        loop = self._get_loop()
+        loop.call_soon_threadsafe(
+            loop.call_later, self.feedback_window, self._flush_feedback, group
+        )
+
+    def _flush_feedback(self, group: str) -> None:
+        with self._feedback_lock:
+            items = self._feedback_pending.pop(group, [])
+        if not items:
+            return
+
+        if len(items) == 1:
+            frame = _dumps({"event": "feedback", **items[0]})
+        else:
+            frame = _dumps({"event": "feedback_batch", "events": items})
+
+        task = asyncio.ensure_future(
+            self._send_all([(group, {"type": "feedback_message", "frame": frame})])
+        )
+        task.add_done_callback(self._log_failure)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                # uvicorn과 같이 uvloop이 있으면 전용 루프도 uvloop으로
+                loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="ws-broadcaster", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    async def _send_all(messages: list[tuple[str, dict]]) -> None:
+        channel_layer = get_channel_layer()
+        # PipelinedRedisChannelLayer면 여러 그룹을 Redis 파이프라인 한 번에 전송
+        if hasattr(channel_layer, "group_send_many"):
+            await channel_layer.group_send_many(messages)
+            return
+        await asyncio.gather(
+            *(channel_layer.group_send(group, message) for group, message in messages)
+        )
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("websocket broadcast failed: %s", exc)
+
+
+_broadcaster: Optional[Broadcaster] = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster() -> Broadcaster:
+    """프로세스 공유 Broadcaster 반환"""
+    global _broadcaster
+    if _broadcaster is None:
+        with _broadcaster_lock:
+            if _broadcaster is None:
+                _broadcaster = Broadcaster()
+    return _broadcaster
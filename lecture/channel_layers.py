@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+
+from channels_redis.core import RedisChannelLayer
+
+
+logger = logging.getLogger(__name__)
+
+# channels_redis.core.RedisChannelLayer.group_send와 같은 스크립트
+# (채널별 용량 확인 후 ZADD + EXPIRE, 용량 초과 채널 수 반환)
+_GROUP_SEND_LUA = """
+    local over_capacity = 0
+    local current_time = ARGV[#ARGV - 1]
+    local expiry = ARGV[#ARGV]
+    for i=1,#KEYS do
+        if redis.call('ZCOUNT', KEYS[i], '-inf', '+inf') < tonumber(ARGV[i + #KEYS]) then
+            redis.call('ZADD', KEYS[i], current_time, ARGV[i])
+            redis.call('EXPIRE', KEYS[i], expiry)
+        else
+            over_capacity = over_capacity + 1
+        end
+    end
+    return over_capacity
+"""
+
+
+class PipelinedRedisChannelLayer(RedisChannelLayer):
+    """
+    여러 그룹에 보내는 메시지를 Redis 파이프라인으로 묶는 RedisChannelLayer.
+
+    기본 group_send는 그룹 하나당 Redis 왕복이 4번
+    (만료 멤버 정리, 멤버 조회, 메시지 만료 정리, 전송 스크립트)이라
+    teacher/student 그룹에 같은 이벤트를 보내면 8번이 된다.
+    group_send_many는 Redis 연결별로
+      1) 모든 그룹의 만료 멤버 정리 + 멤버 조회를 파이프라인 1번
+      2) 모든 채널의 메시지 만료 정리 + 그룹별 전송 스크립트를 파이프라인 1번
+    으로 처리해서 그룹 수와 관계없이 왕복 2번으로 끝낸다.
+
+    channels_redis 내부 메서드(_group_key, _map_channel_keys_to_connection 등)를 사용하므로
+    requirements.txt에 고정된 channels_redis 4.3 기준.
+    """
+
+    async def group_send_many(self, messages: list[tuple[str, dict]]) -> None:
+        """(group, message) 목록을 파이프라인으로 한 번에 전송"""
+        if not messages:
+            return
+        for group, _ in messages:
+            assert self.require_valid_group_name(group), "Group name not valid"
+
+        channel_names_by_group = await self._group_channel_names(
+            [group for group, _ in messages]
+        )
+
+        # 연결 index -> [(그룹, 채널 key 목록, key->직렬화 메시지, key->용량)]
+        sends = collections.defaultdict(list)
+        for group, message in messages:
+            channel_names = channel_names_by_group[group]
+            (
+                connection_to_channel_keys,
+                channel_keys_to_message,
+                channel_keys_to_capacity,
+            ) = self._map_channel_keys_to_connection(channel_names, message)
+            for index, channel_keys in connection_to_channel_keys.items():
+                sends[index].append(
+                    (group, channel_keys, channel_keys_to_message, channel_keys_to_capacity)
+                )
+
+        await asyncio.gather(
+            *(self._send_on_connection(index, items) for index, items in sends.items())
+        )
+
+    async def _group_channel_names(self, groups: list[str]) -> dict[str, list[str]]:
+        """그룹별 현재 채널 이름 목록 (만료된 멤버는 정리)"""
+        by_connection = collections.defaultdict(list)
+        for group in dict.fromkeys(groups):
+            by_connection[self.consistent_hash(group)].append(group)
+
+        async def fetch(index: int, index_groups: list[str]) -> dict[str, list[str]]:
+            pipe = self.connection(index).pipeline(transaction=False)
+            min_score = int(time.time()) - self.group_expiry
+            for group in index_groups:
+                key = self._group_key(group)
+                pipe.zremrangebyscore(key, min=0, max=min_score)
+                pipe.zrange(key, 0, -1)
+            results = await pipe.execute()
+            # 결과는 [zremrangebyscore, zrange, zremrangebyscore, zrange, ...] 순서
+            return {
+                group: [name.decode("utf8") for name in results[i * 2 + 1]]
+                for i, group in enumerate(index_groups)
+            }
+
+        channel_names: dict[str, list[str]] = {}
+        for result in await asyncio.gather(
+            *(fetch(index, index_groups) for index, index_groups in by_connection.items())
+        ):
+            channel_names.update(result)
+        return channel_names
+
+    async def _send_on_connection(self, index: int, items: list[tuple]) -> None:
+        pipe = self.connection(index).pipeline(transaction=False)
+        now = time.time()
+
+        cleaned = set()
+        for _, channel_keys, _, _ in items:
+            for key in channel_keys:
+                if key not in cleaned:
+                    cleaned.add(key)
+                    pipe.zremrangebyscore(key, min=0, max=int(now) - int(self.expiry))
+
+        for _, channel_keys, keys_to_message, keys_to_capacity in items:
+            args = [keys_to_message[key] for key in channel_keys]
+            args += [keys_to_capacity[key] for key in channel_keys]
+            args += [now, self.expiry]
+            pipe.eval(_GROUP_SEND_LUA, len(channel_keys), *channel_keys, *args)
+
+        results = await pipe.execute()
+
+        for (group, channel_keys, _, _), over_capacity in zip(items, results[len(cleaned):]):
+            if over_capacity > 0:
+                logger.info(
+                    "%s of %s channels over capacity in group %s",
+                    over_capacity,
+                    len(channel_keys),
+                    group,
+                )
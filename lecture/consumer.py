@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, Optional
+from uuid import UUID
 
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
@@ -15,6 +19,123 @@ try:
 except Exception:
     redis = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+# 모든 consumer가 공유하는 Redis 클라이언트 (내부 커넥션 풀로 다중화)
+# consumer마다 클라이언트를 만들면 연결 수만큼 커넥션 풀이 생기므로 프로세스당 하나만 사용
+_REDIS_CLIENT = None
+_REDIS_MAX_CONNECTIONS = 64
+
+# 교수 connection 집합 키의 TTL (정상 종료되지 않은 connection이 영원히 남지 않도록)
+_TEACHER_PRESENCE_TTL = 3600
+
+# 교수 connection 집합 갱신(SADD/SREM)과 SCARD를 원자적으로 한 번에 처리하는 Lua 스크립트
+# 두 교수가 동시에 접속/해제해도 각자 갱신 직후의 정확한 수를 받음
+_TEACHER_PRESENCE_LUA = """
+if ARGV[1] == 'add' then
+    redis.call('SADD', KEYS[1], ARGV[2])
+else
+    redis.call('SREM', KEYS[1], ARGV[2])
+end
+local count = redis.call('SCARD', KEYS[1])
+if count > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+redis.call('PUBLISH', ARGV[4], count > 0 and '1' or '0')
+return count
+"""
+_teacher_presence_script = None
+
+# 교수 접속 여부 변경 알림 채널 (presence:<session_id>, 메시지 "1"/"0")
+_PRESENCE_CHANNEL_PREFIX = "presence:"
+
+# 프로세스 로컬 교수 접속 여부 캐시 {session_id: is_online}
+# pubsub 리스너가 살아 있는 동안에만 채워지며, 학생 접속 시 Redis 왕복 없이 조회
+_presence_cache: Dict[str, bool] = {}
+_presence_listener: Optional[asyncio.Task] = None
+_presence_subscribed = False
+
+
+def _get_redis():
+    """교수 접속 여부 저장용 공유 Redis 클라이언트 (redis 패키지가 없으면 None)"""
+    global _REDIS_CLIENT
+    if redis is None:
+        return None
+    if _REDIS_CLIENT is None:
+        url = getattr(settings, "REDIS_URL", "redis://127.0.0.1:6379/0")
+        _REDIS_CLIENT = redis.from_url(url, max_connections=_REDIS_MAX_CONNECTIONS)
+    return _REDIS_CLIENT
+
+
+def _get_teacher_presence_script():
+    """공유 Redis 클라이언트에 등록된 교수 접속 갱신 스크립트 (EVALSHA로 호출됨)"""
+    global _teacher_presence_script
+    client = _get_redis()
+    if client is None:
+        return None
+    if _teacher_presence_script is None:
+        _teacher_presence_script = client.register_script(_TEACHER_PRESENCE_LUA)
+    return _teacher_presence_script
+
+
+def _ensure_presence_listener() -> bool:
+    """
+    presence:* 채널을 구독해 _presence_cache를 갱신하는 백그라운드 태스크를 (필요하면) 시작
+
+    Returns:
+        리스너가 동작 중이라 _presence_cache를 신뢰할 수 있으면 True
+    """
+    global _presence_listener
+    if _get_redis() is None:
+        return False
+    if _presence_listener is None or _presence_listener.done():
+        _presence_cache.clear()
+        _presence_listener = asyncio.ensure_future(_listen_presence())
+    return _presence_subscribed
+
+
+async def _listen_presence() -> None:
+    global _presence_subscribed
+    pubsub = _get_redis().pubsub()
+    try:
+        await pubsub.psubscribe(f"{_PRESENCE_CHANNEL_PREFIX}*")
+        _presence_subscribed = True
+        async for message in pubsub.listen():
+            if message.get("type") != "pmessage":
+                continue
+            session_id = message["channel"].decode()[len(_PRESENCE_CHANNEL_PREFIX):]
+            _presence_cache[session_id] = message["data"] == b"1"
+    except Exception as e:
+        # 구독이 끊기면 놓친 변경이 있을 수 있으므로 캐시를 비우고, 다음 접속 때 다시 시작
+        logger.warning("teacher presence listener stopped: %s", e)
+    finally:
+        _presence_subscribed = False
+        _presence_cache.clear()
+        await pubsub.aclose()
+
+
+# orjson이 없을 때의 대체 직렬화: 한글을 \uXXXX로 이스케이프하지 않고 공백 없이 출력
+# (orjson 기본 출력과 동일한 형태)
+_json_dumps = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """WebSocket 텍스트 프레임용 JSON 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return _json_dumps(data)
+
+
+# 내용이 고정된 프레임은 모듈 로드 시 한 번만 직렬화
+_PONG_FRAME = _dumps({"event": "pong"})
+_SESSION_ENDED_FRAME = _dumps({"event": "session_ended"})
+
 
 class SessionConsumer(AsyncWebsocketConsumer):
     """
@@ -35,7 +156,11 @@ class SessionConsumer(AsyncWebsocketConsumer):
     """
 
     async def connect(self) -> None:
-        self.session_id: str = self.scope["url_route"]["kwargs"]["session_id"]
+        # path()의 uuid 컨버터가 UUID 객체로 넘겨줌
+        # - DB 조회에는 UUID 그대로 사용 (문자열 -> uuid 캐스팅 없이 PK 인덱스 조회)
+        # - 그룹/캐시 키에는 문자열 사용
+        self.session_uuid: UUID = self.scope["url_route"]["kwargs"]["session_id"]
+        self.session_id: str = str(self.session_uuid)
         self.role: str = self.scope["url_route"]["kwargs"]["role"]  # "teacher" or "student"
 
         # 역할별 그룹 이름
@@ -46,16 +171,16 @@ class SessionConsumer(AsyncWebsocketConsumer):
 
         # 교수 접속 여부를 Redis에 기록 (멀티 프로세스/서버에서도 일관되게 확인 가능)
         if self.role == "teacher":
-            await self._mark_teacher_connected()
+            teacher_count = await self._mark_teacher_connected()
             # 교수가 접속하면, 비활성 세션이라도 다시 활성화
             await self._activate_session_if_needed()
             # 옵션: 학생 그룹에 "교수 온라인" 상태 브로드캐스트 가능
-            await self._broadcast_teacher_presence()
+            await self._broadcast_teacher_presence(teacher_count)
 
         # 학생이 처음 접속할 때, 현재 교수 온라인 여부를 함께 내려줌
         teacher_online = False
         if self.role == "student":
-            teacher_online = await self._is_teacher_online()
+            teacher_online = await self._get_cached_teacher_online()
 
         is_active = await self._get_session_is_active()
 
@@ -72,8 +197,8 @@ class SessionConsumer(AsyncWebsocketConsumer):
     async def disconnect(self, close_code: int) -> None:
         # 교수인 경우, 접속 해제 시 Redis 상태 업데이트
         if getattr(self, "role", None) == "teacher":
-            await self._mark_teacher_disconnected()
-            await self._broadcast_teacher_presence()
+            teacher_count = await self._mark_teacher_disconnected()
+            await self._broadcast_teacher_presence(teacher_count)
 
         await self.channel_layer.group_discard(self.group_name, self.channel_name)
 
@@ -87,14 +212,16 @@ class SessionConsumer(AsyncWebsocketConsumer):
             return
 
         try:
-            data: Dict[str, Any] = json.loads(text_data)
-        except json.JSONDecodeError:
+            data: Dict[str, Any] = (
+                orjson.loads(text_data) if orjson is not None else json.loads(text_data)
+            )
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError 모두 ValueError
             return
 
         msg_type: str | None = data.get("type")
 
         if msg_type == "ping":
-            await self.send_json({"event": "pong"})
+            await self.send(text_data=_PONG_FRAME)
 
     # ------------------------------------------------------------------
     # 아래 메서드들은 REST 뷰에서 group_send(...)로 호출
@@ -104,14 +231,21 @@ class SessionConsumer(AsyncWebsocketConsumer):
         """
         학생의 '이해했어요 / 어려워요' 반응을 교수에게 알림.
         teacher 그룹에 보내기
-        """
-        await self.send_json(
-            {
-                "event": "feedback",
-                "feedback_type": event.get("feedback_type"),
-                "created_at": event.get("created_at"),
-            }
-        )
+
+        view에서 클라이언트 프레임을 미리 직렬화해 "frame"으로 넘기므로
+        교수 연결마다 다시 직렬화하지 않고 그대로 전송
+        (짧은 구간에 여러 건이 몰리면 {"event": "feedback_batch", "events": [...]} 프레임 하나로 옴)
+        """
+        frame = event.get("frame")
+        if frame is None:
+            frame = _dumps(
+                {
+                    "event": "feedback",
+                    "feedback_type": event.get("feedback_type"),
+                    "created_at": event.get("created_at"),
+                }
+            )
+        await self.send(text_data=frame)
 
     async def question_intent(self, event):
         """
@@ -168,6 +302,19 @@ class SessionConsumer(AsyncWebsocketConsumer):
             }
         )
 
+    async def question_processed(self, event: Dict[str, Any]) -> None:
+        """
+        Prefer: respond-async로 요청한 질문 정제/AI 답변 완료 알림.
+        student 그룹에 보내기 (내용은 GET /questions/<id>/로 조회)
+        """
+        await self.send_json(
+            {
+                "event": "question_processed",
+                "question_id": event.get("question_id"),
+                "stage": event.get("stage"),
+            }
+        )
+
     async def important_message(self, event: Dict[str, Any]) -> None:
         """
         교수의 '중요해요' 표시 → 학생에게만 브로드캐스트.
@@ -200,7 +347,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
         교수가 세션을 종료했을 때.
         모든 클라이언트(교수/학생)에게 브로드캐스트.
         """
-        await self.send_json({"event": "session_ended"})
+        await self.send(text_data=_SESSION_ENDED_FRAME)
         await self.close()
 
     # ------------------------------------------------------------------
@@ -208,7 +355,8 @@ class SessionConsumer(AsyncWebsocketConsumer):
     # ------------------------------------------------------------------
 
     async def send_json(self, data: Dict[str, Any]) -> None:
-        await self.send(text_data=json.dumps(data))
+        # 클라이언트가 텍스트 프레임을 기대하므로 bytes -> str 로 변환해 전송
+        await self.send(text_data=_dumps(data))
 
     # ------------------------------------------------------------------
     # 세션 활성화
@@ -220,7 +368,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
         다시 활성(is_active=True) 상태로 변경.
         """
         try:
-            session = Session.objects.get(id=self.session_id)
+            session = Session.objects.get(id=self.session_uuid)
             if not session.is_active:
                 session.is_active = True
                 session.save(update_fields=["is_active"])
@@ -233,7 +381,7 @@ class SessionConsumer(AsyncWebsocketConsumer):
     def _get_session_is_active(self) -> bool:
         """세션의 현재 활성화 상태를 DB에서 조회"""
         try:
-            return Session.objects.get(pk=self.session_id).is_active
+            return Session.objects.get(pk=self.session_uuid).is_active
         except Session.DoesNotExist:
             return False
 
@@ -245,51 +393,82 @@ class SessionConsumer(AsyncWebsocketConsumer):
     def _redis(self):
         """
         RedisChannelLayer와 동일한 Redis 인스턴스를 사용해
-        '교수 접속 여부'를 저장/조회하기 위한 클라이언트.
+        '교수 접속 여부'를 저장/조회하기 위한 클라이언트. (모듈 공유 인스턴스)
         """
-        if redis is None:
-            return None
-        if not hasattr(self, "__redis_client"):
-            url = getattr(settings, "REDIS_URL", "redis://127.0.0.1:6379/0")
-            setattr(self, "__redis_client", redis.from_url(url))
-        return getattr(self, "__redis_client")
+        return _get_redis()
 
-    async def _mark_teacher_connected(self) -> None:
+    async def _mark_teacher_connected(self) -> Optional[int]:
         """
         현재 세션에 교수(teacher)가 접속했음을 Redis에 기록.
         여러 프로세스 / 서버에서 동시에 접근해도 일관되게 관리 가능.
+
+        Returns:
+            기록 후 접속 중인 교수 connection 수 (Redis를 쓸 수 없으면 None)
         """
-        if self._redis is None:
-            return
-        key = f"session:{self.session_id}:teachers"
-        await self._redis.sadd(key, self.channel_name)
+        return await self._update_teacher_presence("add")
 
-    async def _mark_teacher_disconnected(self) -> None:
+    async def _mark_teacher_disconnected(self) -> Optional[int]:
         """
         현재 세션에서 해당 교수 connection을 제거.
+
+        Returns:
+            제거 후 접속 중인 교수 connection 수 (Redis를 쓸 수 없으면 None)
         """
-        if self._redis is None:
-            return
+        return await self._update_teacher_presence("remove")
+
+    async def _update_teacher_presence(self, op: str) -> Optional[int]:
+        """교수 connection 집합에 추가/제거하고 갱신 후 크기를 반환 (Lua 스크립트 1회 호출)"""
+        script = _get_teacher_presence_script()
+        if script is None:
+            return None
         key = f"session:{self.session_id}:teachers"
-        await self._redis.srem(key, self.channel_name)
+        return await script(
+            keys=[key],
+            args=[
+                op,
+                self.channel_name,
+                _TEACHER_PRESENCE_TTL,
+                f"{_PRESENCE_CHANNEL_PREFIX}{self.session_id}",
+            ],
+        )
+
+    async def _get_cached_teacher_online(self) -> bool:
+        """
+        교수 접속 여부를 프로세스 로컬 캐시에서 조회 (pubsub으로 갱신됨)
+        캐시에 없거나 리스너가 아직 준비되지 않았으면 Redis에서 조회한 뒤 캐시에 저장.
+        """
+        listening = _ensure_presence_listener()
+        if listening and self.session_id in _presence_cache:
+            return _presence_cache[self.session_id]
+        is_online = await self._is_teacher_online()
+        if listening:
+            _presence_cache.setdefault(self.session_id, is_online)
+        return is_online
 
     async def _is_teacher_online(self) -> bool:
         """
         현재 세션에 교수(teacher)가 하나 이상 접속해 있는지 여부.
         - WebSocket 핸들러나 REST API(별도 view에서 동일 키를 사용)에서 재활용 가능.
         """
-        if self._redis is None:
+        client = self._redis
+        if client is None:
             return False
         key = f"session:{self.session_id}:teachers"
-        count = await self._redis.scard(key)
+        count = await client.scard(key)
         return bool(count and count > 0)
 
-    async def _broadcast_teacher_presence(self) -> None:
+    async def _broadcast_teacher_presence(self, teacher_count: Optional[int] = None) -> None:
         """
         교수 접속 여부가 변할 때마다 학생 그룹에 브로드캐스트하고 싶을 경우 사용하는 유틸.
         프론트에서 받아서 '교수 온라인/오프라인' 표시 가능.
+
+        Args:
+            teacher_count: 방금 갱신한 교수 connection 수 (없으면 Redis에서 다시 조회)
         """
-        is_online = await self._is_teacher_online()
+        if teacher_count is None:
+            is_online = await self._is_teacher_online()
+        else:
+            is_online = teacher_count > 0
         # 학생 그룹 이름은 session_<session_id>_student
         student_group = f"session_{self.session_id}_student"
         await self.channel_layer.group_send(
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from django.db import close_old_connections
+
+from .models import FeedbackEvent
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 0.1  # 100ms
+DEFAULT_MAX_BATCH = 500
+
+
+class FeedbackWriter:
+    """
+    FeedbackEvent INSERT를 모아서 bulk_create로 한 번에 쓰는 백그라운드 writer.
+
+    - HARD 구간처럼 학생들이 동시에 누르는 순간에 요청마다 INSERT 하지 않고,
+      첫 이벤트 이후 window 초 동안(또는 max_batch건까지) 모아 multi-row INSERT 1번으로 처리.
+    - 아직 DB에 쓰이지 않은 이벤트는 pending_created_at()으로 조회 가능 (연타 방지용).
+    - 프로세스 종료 시 남은 이벤트는 atexit에서 flush.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[FeedbackEvent]" = queue.Queue()
+        self._pending: dict[tuple[str, str], datetime] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, event: FeedbackEvent) -> None:
+        """
+        이벤트를 쓰기 대기열에 추가 (created_at은 제출 시점 값이 그대로 저장됨)
+        """
+        with self._lock:
+            self._pending[self._key(event)] = event.created_at
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="feedback-writer", daemon=True
+                )
+                self._thread.start()
+        self._queue.put(event)
+
+    def pending_created_at(self, session_id, device_hash: str) -> Optional[datetime]:
+        """해당 디바이스의 아직 DB에 쓰이지 않은 마지막 이벤트 시각 (없으면 None)"""
+        with self._lock:
+            return self._pending.get((str(session_id), device_hash))
+
+    def flush(self) -> None:
+        """대기 중인 이벤트를 즉시 모두 기록"""
+        batch: list[FeedbackEvent] = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write(batch)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch: list[FeedbackEvent]) -> None:
+        written = [(self._key(event), event.created_at) for event in batch]
+        try:
+            FeedbackEvent.objects.bulk_create(batch, batch_size=self.max_batch)
+        except Exception:
+            logger.exception("failed to write %d feedback events", len(batch))
+        finally:
+            with self._lock:
+                for key, created_at in written:
+                    # 그 사이 같은 디바이스의 새 이벤트가 들어왔으면 유지
+                    if self._pending.get(key) == created_at:
+                        del self._pending[key]
+            # 요청 스레드가 아니므로 CONN_MAX_AGE 기준 정리를 직접 수행
+            close_old_connections()
+
+    @staticmethod
+    def _key(event: FeedbackEvent) -> tuple[str, str]:
+        return (str(event.session_id), event.device_hash)
+
+
+_writer: Optional[FeedbackWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_feedback_writer() -> FeedbackWriter:
+    """프로세스 공유 FeedbackWriter 반환"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = FeedbackWriter()
+                atexit.register(_writer.flush)
+    return _writer
@@ -3,8 +3,10 @@ import os
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from lecture.models import Course
+from lecture.views import invalidate_course_list_cache
 
 
 class Command(BaseCommand):
@@ -25,30 +27,52 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(f"File not found: {path}"))
             return
 
-        created_count = 0
-        updated_count = 0
+        # code 기준으로 모음 (CSV 안에 같은 code가 여러 번 있으면 마지막 행 사용)
+        courses = {}
 
         # 한글 헤더/내용 고려해서 utf-8-sig 사용
+        # DictReader는 행마다 dict를 만들므로 csv.reader + 헤더 인덱스로 읽음
         with open(path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                code = row["code"].strip()
-                name = row["name"].strip()
-                professor = row["professor"].strip()
-                time = row["time"].strip()
+            reader = csv.reader(f)
+            header = [h.strip() for h in next(reader, [])]
+            try:
+                code_i, name_i, professor_i, time_i = (
+                    header.index(col) for col in ("code", "name", "professor", "time")
+                )
+            except ValueError:
+                self.stderr.write(
+                    self.style.ERROR(f"Missing required columns in header: {header}")
+                )
+                return
 
-                obj, created = Course.objects.update_or_create(
+            for row in reader:
+                if not row:
+                    continue
+                code = row[code_i].strip()
+                courses[code] = Course(
                     code=code,
-                    defaults={
-                        "name": name,
-                        "professor": professor,
-                        "time": time,
-                    },
+                    name=row[name_i].strip(),
+                    professor=row[professor_i].strip(),
+                    time=row[time_i].strip(),
                 )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
+
+        # 행마다 update_or_create(SELECT + INSERT/UPDATE)를 하는 대신
+        # 기존 code 목록만 한 번 조회한 뒤 upsert로 한꺼번에 반영
+        with transaction.atomic():
+            existing = set(Course.objects.values_list("code", flat=True)) & courses.keys()
+            Course.objects.bulk_create(
+                courses.values(),
+                update_conflicts=True,
+                unique_fields=["code"],
+                update_fields=["name", "professor", "time"],
+                batch_size=1000,
+            )
+
+        # bulk_create는 post_save 시그널을 보내지 않으므로 직접 캐시 무효화
+        invalidate_course_list_cache()
+
+        updated_count = len(existing)
+        created_count = len(courses) - updated_count
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 04:02
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0009_remove_question_professor_answer'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subjectinfo',
+            index=models.Index(django.db.models.functions.text.Upper('code'), name='subjinfo_code_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subjectinfo',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='subjinfo_name_upper_idx'),
+        ),
+    ]
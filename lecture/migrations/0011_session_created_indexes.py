@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-15 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0010_subjectinfo_upper_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='feedbackevent',
+            index=models.Index(fields=['session', 'created_at'], name='feedback_session_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedbackevent',
+            index=models.Index(fields=['session', 'feedback_type'], name='feedback_session_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importantmoment',
+            index=models.Index(fields=['session', 'created_at'], name='moment_session_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['session', 'created_at'], name='question_session_created_idx'),
+        ),
+    ]
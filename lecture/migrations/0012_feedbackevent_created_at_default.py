@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 04:11
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0011_session_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='feedbackevent',
+            name='created_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,52 @@
+from django.db import migrations, models
+
+
+STATUS_CODES = {
+    "INTENT": 0,
+    "TEXT_SUBMITTED": 1,
+    "AI_ANSWERED": 2,
+    "FORWARDED": 3,
+    "PROFESSOR_ANSWERED": 4,
+}
+
+
+def status_to_code(apps, schema_editor):
+    Question = apps.get_model("lecture", "Question")
+    for name, code in STATUS_CODES.items():
+        Question.objects.filter(status=name).update(status_code=code)
+
+
+def code_to_status(apps, schema_editor):
+    Question = apps.get_model("lecture", "Question")
+    for name, code in STATUS_CODES.items():
+        Question.objects.filter(status_code=code).update(status=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0012_feedbackevent_created_at_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(status_to_code, code_to_status),
+        migrations.RemoveField(
+            model_name='question',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='question',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='question',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Intent created'), (1, 'Text submitted & cleaned'), (2, 'AI answered'), (3, 'Forwarded to professor'), (4, 'Professor answered')], default=0),
+        ),
+    ]
@@ -0,0 +1,74 @@
+from django.db import migrations, models
+
+import lecture.models
+
+
+# (테이블, FK 컬럼, 참조 테이블)
+CASCADE_FOREIGN_KEYS = [
+    ("lecture_feedbackevent", "session_id", "lecture_session"),
+    ("lecture_question", "session_id", "lecture_session"),
+    ("lecture_importantmoment", "session_id", "lecture_session"),
+    ("lecture_questionlike", "question_id", "lecture_question"),
+]
+
+
+def _recreate_foreign_keys(schema_editor, on_delete_sql):
+    """PostgreSQL에서만 FK 제약을 ON DELETE 옵션을 바꿔 다시 생성"""
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    quote = schema_editor.quote_name
+    with connection.cursor() as cursor:
+        for table, column, ref_table in CASCADE_FOREIGN_KEYS:
+            constraints = connection.introspection.get_constraints(cursor, table)
+            for name, info in constraints.items():
+                if info["foreign_key"] != (ref_table, "id") or info["columns"] != [column]:
+                    continue
+                schema_editor.execute(
+                    f"ALTER TABLE {quote(table)} DROP CONSTRAINT {quote(name)}"
+                )
+                schema_editor.execute(
+                    f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} "
+                    f"FOREIGN KEY ({quote(column)}) REFERENCES {quote(ref_table)} ({quote('id')})"
+                    f"{on_delete_sql} DEFERRABLE INITIALLY DEFERRED"
+                )
+
+
+def add_db_cascade(apps, schema_editor):
+    _recreate_foreign_keys(schema_editor, " ON DELETE CASCADE")
+
+
+def remove_db_cascade(apps, schema_editor):
+    _recreate_foreign_keys(schema_editor, "")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0013_question_status_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='feedbackevent',
+            name='session',
+            field=models.ForeignKey(on_delete=lecture.models.DB_CASCADE, to='lecture.session'),
+        ),
+        migrations.AlterField(
+            model_name='importantmoment',
+            name='session',
+            field=models.ForeignKey(on_delete=lecture.models.DB_CASCADE, to='lecture.session'),
+        ),
+        migrations.AlterField(
+            model_name='question',
+            name='session',
+            field=models.ForeignKey(on_delete=lecture.models.DB_CASCADE, to='lecture.session'),
+        ),
+        migrations.AlterField(
+            model_name='questionlike',
+            name='question',
+            field=models.ForeignKey(on_delete=lecture.models.DB_CASCADE, related_name='likes', to='lecture.question'),
+        ),
+        migrations.RunPython(add_db_cascade, remove_db_cascade),
+    ]
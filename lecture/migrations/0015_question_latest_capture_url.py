@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-15 04:20
+
+import logging
+
+from django.db import migrations, models
+
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_latest_capture_url(apps, schema_editor):
+    """기존 질문에 마지막 QUESTION 캡처 URL을 채움 (스토리지 URL 생성 실패 시 건너뜀)"""
+    Question = apps.get_model("lecture", "Question")
+    ImportantMoment = apps.get_model("lecture", "ImportantMoment")
+
+    moments = (
+        ImportantMoment.objects.filter(trigger="QUESTION", question__isnull=False)
+        .exclude(screenshot_image="")
+        .exclude(screenshot_image__isnull=True)
+        .order_by("question_id", "-created_at")
+        .only("question_id", "screenshot_image")
+    )
+    seen = set()
+    try:
+        for moment in moments.iterator():
+            if moment.question_id in seen:
+                continue
+            seen.add(moment.question_id)
+            Question.objects.filter(id=moment.question_id).update(
+                latest_capture_url=moment.screenshot_image.url
+            )
+    except Exception as e:
+        logger.warning("latest_capture_url backfill stopped: %s", e)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0014_db_level_cascade'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='latest_capture_url',
+            field=models.URLField(blank=True, default='', max_length=500),
+        ),
+        migrations.RunPython(backfill_latest_capture_url, migrations.RunPython.noop),
+    ]
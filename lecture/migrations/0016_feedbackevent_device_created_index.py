@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-15 04:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0015_question_latest_capture_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='feedbackevent',
+            index=models.Index(fields=['session', 'device_hash', '-created_at'], name='feedback_sess_dev_created_idx'),
+        ),
+    ]
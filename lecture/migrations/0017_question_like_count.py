@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-15 04:29
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_like_count(apps, schema_editor):
+    """기존 질문의 like_count를 QuestionLike 수로 채움 (UPDATE 한 번)"""
+    Question = apps.get_model("lecture", "Question")
+    QuestionLike = apps.get_model("lecture", "QuestionLike")
+
+    likes = (
+        QuestionLike.objects.filter(question=OuterRef("pk"))
+        .order_by()
+        .values("question")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    Question.objects.update(like_count=Coalesce(Subquery(likes), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0016_feedbackevent_device_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_like_count, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,9 @@
-from django.db import models
+from django.db import connections, models
+from django.utils import timezone
+from django.db.models.functions import Upper
 import uuid
 import os
+import secrets
 
 
 def important_moment_screenshot_upload_path(instance, filename: str) -> str:
@@ -8,7 +11,7 @@ def important_moment_screenshot_upload_path(instance, filename: str) -> str:
     ImportantMoment 스크린샷 업로드 경로.
 
     - Session별로 하위 폴더를 나누어 관리하고
-    - 파일명은 UUID 기반의 짧고 안전한 이름으로 통일.
+    - 파일명은 랜덤 hex 기반의 짧고 안전한 이름으로 통일.
     """
 
     _, ext = os.path.splitext(filename)
@@ -24,7 +27,27 @@ def important_moment_screenshot_upload_path(instance, filename: str) -> str:
     else:
         session_str = "unknown-session"
 
-    return f"screenshots/{session_str}/{uuid.uuid4().hex}.{ext}"
+    # 공개 버킷 URL이므로 추측 불가능하도록 기존 uuid4().hex와 같은 128비트 유지
+    # (UUID 객체 생성 없이 바로 hex 문자열)
+    return f"screenshots/{session_str}/{secrets.token_hex(16)}.{ext}"
+
+
+def DB_CASCADE(collector, field, sub_objs, using):
+    """
+    on_delete 핸들러: PostgreSQL에서는 FK의 ON DELETE CASCADE(마이그레이션 0014)에 맡기고,
+    그 외 DB(로컬 SQLite 등)에서는 기존 CASCADE와 동일하게 동작.
+
+    PostgreSQL에서는 하위 행을 Python으로 조회/수집하지 않으므로
+    세션 삭제가 DELETE 한 번으로 끝남.
+    (Python 쪽 post_delete 시그널은 하위 행에 대해 발생하지 않음)
+    """
+    if connections[using].vendor == "postgresql":
+        return
+    models.CASCADE(collector, field, sub_objs, using)
+
+
+# sub_objs 쿼리셋을 평가하지 않고 바로 호출되도록 (PostgreSQL에서 하위 행 조회 생략)
+DB_CASCADE.lazy_sub_objs = True
 
 
 class Course(models.Model):
@@ -49,6 +72,11 @@ class SubjectInfo(models.Model):
     class Meta:
         verbose_name = "Subject info"
         verbose_name_plural = "Subject infos"
+        indexes = [
+            # 프롬프트용 과목 조회(code/name __iexact)가 UPPER(...) 비교로 인덱스를 타도록
+            models.Index(Upper("code"), name="subjinfo_code_upper_idx"),
+            models.Index(Upper("name"), name="subjinfo_name_upper_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - admin 표시용
         return f"{self.code} - {self.name}"
@@ -76,20 +104,34 @@ class Session(models.Model):
 class FeedbackEvent(models.Model):
     FEEDBACK_TYPE = (('OK', 'OK'), ('HARD', 'HARD'))
 
-    session = models.ForeignKey(Session, on_delete=models.CASCADE)
+    session = models.ForeignKey(Session, on_delete=DB_CASCADE)
     device_hash = models.CharField(max_length=64)  # 익명 디바이스 식별자
     feedback_type = models.CharField(max_length=10, choices=FEEDBACK_TYPE)
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # auto_now_add 대신 default: bulk_create로 늦게 INSERT 해도 제출 시각이 유지되도록
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        indexes = [
+            # 세션별 시간순 조회 / 세션별 OK·HARD 집계
+            models.Index(fields=["session", "created_at"], name="feedback_session_created_idx"),
+            models.Index(fields=["session", "feedback_type"], name="feedback_session_type_idx"),
+            # 연타 방지 fallback 조회 (session, device_hash의 마지막 created_at) 용
+            models.Index(
+                fields=["session", "device_hash", "-created_at"],
+                name="feedback_sess_dev_created_idx",
+            ),
+        ]
 
 class Question(models.Model):
-    class Status(models.TextChoices):
-        INTENT = "INTENT", "Intent created"
-        TEXT_SUBMITTED = "TEXT_SUBMITTED", "Text submitted & cleaned"
-        AI_ANSWERED = "AI_ANSWERED", "AI answered"
-        FORWARDED = "FORWARDED", "Forwarded to professor"
-        PROFESSOR_ANSWERED = "PROFESSOR_ANSWERED", "Professor answered"
-
-    session = models.ForeignKey(Session, on_delete=models.CASCADE)
+    # DB에는 smallint로 저장 (API 응답에는 status_name의 문자열 이름을 사용)
+    class Status(models.IntegerChoices):
+        INTENT = 0, "Intent created"
+        TEXT_SUBMITTED = 1, "Text submitted & cleaned"
+        AI_ANSWERED = 2, "AI answered"
+        FORWARDED = 3, "Forwarded to professor"
+        PROFESSOR_ANSWERED = 4, "Professor answered"
+
+    session = models.ForeignKey(Session, on_delete=DB_CASCADE)
     device_hash = models.CharField(max_length=64)
     original_text = models.TextField()
     cleaned_text = models.TextField(blank=True)
@@ -98,8 +140,13 @@ class Question(models.Model):
 
     forwarded_to_professor = models.BooleanField(default=False)  # 교수에게 넘겼는지
 
-    status = models.CharField(
-        max_length=20,
+    # '나도 궁금해요' 수 (QuestionLike 생성 시 F() UPDATE로 증가, 조회 시 COUNT 없이 사용)
+    like_count = models.PositiveIntegerField(default=0)
+
+    # 마지막으로 업로드된 질문 캡처 URL (upload_question_capture에서 저장, 없으면 빈 문자열)
+    latest_capture_url = models.URLField(max_length=500, blank=True, default="")
+
+    status = models.PositiveSmallIntegerField(
         choices=Status.choices,
         default=Status.INTENT,
     )
@@ -107,9 +154,19 @@ class Question(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["session", "created_at"], name="question_session_created_idx"),
+        ]
+
+    @property
+    def status_name(self) -> str:
+        """API/웹소켓에 내보내는 상태 문자열 (예: "FORWARDED")"""
+        return self.Status(self.status).name
+
 
 class QuestionLike(models.Model):
-    question = models.ForeignKey(Question, related_name="likes", on_delete=models.CASCADE)
+    question = models.ForeignKey(Question, related_name="likes", on_delete=DB_CASCADE)
     device_hash = models.CharField(max_length=64)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
@@ -124,7 +181,7 @@ class ImportantMoment(models.Model):
         ('HARD', 'Hard threshold capture'),
     )
 
-    session = models.ForeignKey(Session, on_delete=models.CASCADE)
+    session = models.ForeignKey(Session, on_delete=DB_CASCADE)
     trigger = models.CharField(max_length=20, choices=TRIGGER_CHOICES)
     question = models.ForeignKey(Question, null=True, blank=True, on_delete=models.SET_NULL)
     note = models.CharField(max_length=200, blank=True)
@@ -133,3 +190,8 @@ class ImportantMoment(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     is_hardest = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["session", "created_at"], name="moment_session_created_idx"),
+        ]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러.
+
+    - UUID / date / datetime 등은 orjson이 직접 직렬화하고,
+      그 외 타입(lazy 번역 문자열, Decimal 등)은 DRF 기본 인코더로 변환.
+    - orjson이 없거나 indent가 요청된 경우(브라우저 확인용 등)는 DRF 기본 JSONRenderer로 동작.
+    """
+
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=self._default)
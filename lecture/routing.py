@@ -1,10 +1,25 @@
-from django.urls import re_path
+from django.urls import path, register_converter
 from . import consumer
 
+
+class RoleConverter:
+    """WebSocket 역할 (teacher/student)"""
+
+    regex = "teacher|student"
+
+    def to_python(self, value: str) -> str:
+        return value
+
+    def to_url(self, value: str) -> str:
+        return value
+
+
+register_converter(RoleConverter, "ws_role")
+
 websocket_urlpatterns = [
     # UUID 기반 session_id + 역할(role: teacher/student)
-    re_path(
-        r"ws/session/(?P<session_id>[0-9a-fA-F\-]+)/(?P<role>teacher|student)/$",
+    path(
+        "ws/session/<uuid:session_id>/<ws_role:role>/",
         consumer.SessionConsumer.as_asgi(),
     ),
-]
\ No newline at end of file
+]
@@ -27,7 +27,14 @@ class SessionSerializer(serializers.ModelSerializer):
 
 
 class QuestionSerializer(serializers.ModelSerializer):
-    like_count = serializers.SerializerMethodField()
+    # Question.like_count 비정규화 컬럼 (like_question에서만 증가)
+    like_count = serializers.IntegerField(read_only=True)
+    # DB는 정수 코드, 응답은 기존과 같은 문자열 이름
+    status = serializers.ChoiceField(
+        choices=[s.name for s in Question.Status],
+        source="status_name",
+        read_only=True,
+    )
     created_at = KSTDateTimeField(read_only=True)
     updated_at = KSTDateTimeField(read_only=True)
 
@@ -55,10 +62,6 @@ class QuestionSerializer(serializers.ModelSerializer):
             "like_count",
         ]
 
-    def get_like_count(self, obj: Question) -> int:
-        # 'likes'는 QuestionLike 모델의 related_name
-        return obj.likes.count()
-
 
 class ImportantMomentSerializer(serializers.ModelSerializer):
     created_at = KSTDateTimeField(read_only=True)
@@ -110,6 +113,8 @@ class QuestionCaptureUploadSerializer(serializers.Serializer):
     """
 
     screenshot = UploadImageField(required=False)
+    # screenshot 대신 서명 URL로 직접 업로드한 객체 이름
+    screenshot_key = serializers.CharField(required=False)
 
 
 class QuestionTextSubmitSerializer(serializers.Serializer):
@@ -149,6 +154,8 @@ class MarkImportantUploadSerializer(serializers.Serializer):
 
     note = serializers.CharField(required=False, allow_blank=True)
     screenshot = UploadImageField(required=False)
+    # screenshot 대신 서명 URL로 직접 업로드한 객체 이름
+    screenshot_key = serializers.CharField(required=False)
 
 
 class HardThresholdCaptureResponseSerializer(serializers.Serializer):
@@ -162,6 +169,19 @@ class HardThresholdCaptureUploadSerializer(serializers.Serializer):
     """
 
     screenshot = UploadImageField(required=False)
+    # screenshot 대신 서명 URL로 직접 업로드한 객체 이름
+    screenshot_key = serializers.CharField(required=False)
+
+
+class ScreenshotUploadUrlRequestSerializer(serializers.Serializer):
+    content_type = serializers.CharField(required=False, default="image/png")
+
+
+class ScreenshotUploadUrlResponseSerializer(serializers.Serializer):
+    screenshot_key = serializers.CharField()
+    upload_url = serializers.CharField()
+    content_type = serializers.CharField()
+    expires_in = serializers.IntegerField()
 
 
 class SessionSummaryMomentSerializer(serializers.Serializer):
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Course, Session, SubjectInfo
+
+
+@receiver(post_save, sender=SubjectInfo)
+@receiver(post_delete, sender=SubjectInfo)
+def subject_info_changed(sender, **kwargs) -> None:
+    """
+    과목 정보가 추가/수정/삭제되면 프롬프트용 과목 정보 캐시를 무효화한다.
+    """
+    # app ready() 시점에 lecture.ai / views(DRF 등)를 끌어오지 않도록 지연 import
+    from .ai.prompt_templates import invalidate_subject_info_cache
+
+    invalidate_subject_info_cache()
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def course_changed(sender, **kwargs) -> None:
+    """
+    과목이 추가/수정/삭제되면 과목 리스트 캐시를 무효화한다.
+    """
+    from django.utils import timezone
+
+    from .views import invalidate_course_list_cache, invalidate_today_session_cache
+
+    invalidate_course_list_cache()
+    # 오늘 세션 응답에 과목 정보가 포함되므로 함께 삭제
+    invalidate_today_session_cache(kwargs["instance"].code, timezone.localdate())
+
+
+# 오늘 세션 응답(SessionSerializer)에 영향을 주는 필드
+_TODAY_SESSION_FIELDS = {"course", "date", "is_active"}
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def session_changed(sender, instance, update_fields=None, created=False, **kwargs) -> None:
+    """
+    세션이 종료/재활성화/삭제되면 오늘 세션 캐시와 summary 캐시를 무효화한다.
+    (새로 생성된 경우, hardest_moments_calculated 처럼 응답에 없는 필드만 저장한 경우는 제외)
+    """
+    if created:
+        return
+    if update_fields is not None and not (set(update_fields) & _TODAY_SESSION_FIELDS):
+        return
+
+    from .tasks import invalidate_session_summary_cache
+    from .views import invalidate_today_session_cache
+
+    # 종료된 세션에만 캐시되므로 재활성화/삭제 시 summary 캐시도 삭제
+    invalidate_session_summary_cache(instance.pk)
+
+    if Session.course.is_cached(instance):
+        code = instance.course.code
+    else:
+        code = Course.objects.filter(pk=instance.course_id).values_list("code", flat=True).first()
+    if code is not None:
+        invalidate_today_session_cache(code, instance.date)
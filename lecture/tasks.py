@@ -1,20 +1,164 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional
+import uuid
+from typing import Any, Optional
 
+from asgiref.sync import async_to_sync
 from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
 from django.db import close_old_connections
 
-from .ai.summarize_image import summarize_image as summarize_important_image
-from .models import ImportantMoment
+from .broadcast import get_broadcaster
+from .models import ImportantMoment, Question
+
+try:
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - redis 패키지가 없는 환경
+    redis = None
 
 logger = logging.getLogger(__name__)
 
+# 동일 작업 중복 enqueue 방지 락 TTL (초)
+TASK_DEDUP_TTL = 60
+
+# 같은 moment 요약 작업 동시 실행 방지 락 TTL (초, LLM 호출 최대 시간보다 넉넉히)
+SUMMARY_LOCK_TTL = 5 * 60
+
+# 워커가 스토리지에 올리기 전까지 업로드 이미지 바이트를 Redis에 보관하는 시간 (초)
+SCREENSHOT_UPLOAD_TTL = 10 * 60
+
+# 작업에서 WebSocket 브로드캐스트 완료를 기다리는 최대 시간 (초)
+BROADCAST_TIMEOUT = 10
+
+# '중요해요' 요약 요청을 모으는 구간 (초, 캐시 TTL 단위가 초라 1초)과 세션별 대기 목록 TTL
+SUMMARY_BATCH_WINDOW = 1
+SUMMARY_BATCH_LIST_TTL = 10 * 60
+
+# 질문 text/ai-answer LLM 처리 중 같은 질문의 중복 요청을 막는 락 TTL (초, LLM 최대 대기 시간보다 길게)
+QUESTION_LLM_LOCK_TTL = 120
+
+
+def invalidate_session_summary_cache(session_id) -> None:
+    """
+    종료된 세션의 summary 응답 캐시 삭제 (views.session_summary에서 저장)
+    """
+    try:
+        cache.delete(f"session-summary:{session_id}")
+    except Exception as e:
+        logger.warning("session summary cache invalidation failed: %s", e)
+
+
+def enqueue_once(
+    task, ttl: int = TASK_DEDUP_TTL, countdown: Optional[float] = None, **kwargs: Any
+) -> Optional[str]:
+    """
+    같은 인자의 작업이 진행 중이면 다시 enqueue 하지 않는 Celery enqueue 헬퍼.
+
+    - task_id를 (작업 이름 + 인자)의 SHA-256으로 고정
+    - Redis에 task_id 키를 SETNX(cache.add)로 잡아 ttl 동안 중복 enqueue를 건너뜀
+    - 캐시 백엔드 오류 시에는 중복 방지 없이 그대로 enqueue
+
+    Returns:
+        enqueue 했으면 task_id, 중복이라 건너뛰었으면 None
+    """
+    payload = json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str)
+    task_id = hashlib.sha256(f"{task.name}|{payload}".encode("utf-8")).hexdigest()
+
+    try:
+        acquired = cache.add(f"celery-dedup:{task_id}", 1, timeout=ttl)
+    except Exception as e:
+        logger.warning("task dedup lock failed, enqueueing anyway: %s", e)
+        acquired = True
+
+    if not acquired:
+        logger.info("skip duplicate task %s (task_id=%s)", task.name, task_id)
+        return None
+
+    task.apply_async(kwargs=kwargs, task_id=task_id, countdown=countdown)
+    return task_id
+
+
+_redis_client = None
+
+
+def _get_redis():
+    """요약 배치 대기 목록용 Redis 클라이언트 (redis 패키지가 없으면 None)"""
+    global _redis_client
+    if redis is None:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def enqueue_important_summary(moment_id: int, session_id, raw_note: str) -> None:
+    """
+    '중요해요' 이미지 요약 요청.
+
+    세션별 Redis 목록에 쌓고 SUMMARY_BATCH_WINDOW 뒤에 실행되는 배치 작업 하나로 모아서 처리
+    (교수가 연달아 누르면 이미지 여러 장을 한 번의 Gemini 호출로 요약).
+    Redis를 쓸 수 없으면 기존처럼 moment별 작업으로 enqueue.
+    """
+    session_id_str = str(session_id)
+    client = _get_redis()
+    if client is not None:
+        try:
+            key = f"summary-batch:{session_id_str}"
+            pipe = client.pipeline()
+            pipe.rpush(key, json.dumps({"moment_id": moment_id, "raw_note": raw_note}))
+            pipe.expire(key, SUMMARY_BATCH_LIST_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("summary batch push failed, enqueueing single task: %s", e)
+        else:
+            # 구간당 작업 하나만 (dedup TTL이 지나면 다음 요청이 새 배치 작업을 예약)
+            enqueue_once(
+                generate_important_summaries_task,
+                ttl=SUMMARY_BATCH_WINDOW,
+                countdown=SUMMARY_BATCH_WINDOW,
+                session_id_str=session_id_str,
+            )
+            return
+
+    enqueue_once(
+        generate_important_summary_task,
+        moment_id=moment_id,
+        session_id_str=session_id_str,
+        raw_note=raw_note,
+    )
+
+
+def acquire_question_llm_lock(question_id: int) -> Optional[bool]:
+    """
+    질문별 LLM 처리 락 (Redis SET NX).
+    True: 획득, False: 이미 처리 중, None: 캐시 장애 (락 없이 진행)
+    """
+    try:
+        return cache.add(
+            f"question-llm-lock:{question_id}", 1, timeout=QUESTION_LLM_LOCK_TTL
+        )
+    except Exception as e:
+        logger.warning("question lock failed, running without lock: %s", e)
+        return None
+
+
+def release_question_llm_lock(question_id: int) -> None:
+    try:
+        cache.delete(f"question-llm-lock:{question_id}")
+    except Exception as e:
+        logger.warning("question lock release failed: %s", e)
+
 
 def _ai_summarize_important_image_for_task(
     image_path: str | None = None,
     subject_name: str | None = None,
+    subject_info: str | None = None,
 ) -> Optional[str]:
     """
     Celery 전용: views에 의존하지 않고 이미지 요약을 수행하는 헬퍼.
@@ -25,6 +169,9 @@ def _ai_summarize_important_image_for_task(
         )
         return None
 
+    # lecture.ai는 Gemini 클라이언트/PIL까지 import 하므로 워커 기동 시점이 아니라 첫 사용 시 로드
+    from .ai.summarize_image import summarize_image as summarize_important_image
+
     try:
         logger.info(
             "[AI DEBUG] _ai_summarize_important_image_for_task: calling summarize_important_image"
@@ -32,6 +179,7 @@ def _ai_summarize_important_image_for_task(
         summary = summarize_important_image(
             image_path=image_path,
             subject_name=subject_name,
+            subject_info=subject_info,
             temperature=0.3,
         )
         summary = summary.strip()
@@ -48,6 +196,15 @@ def _ai_summarize_important_image_for_task(
         return None
 
 
+def _combine_note(raw_note: str, auto_summary: Optional[str]) -> str:
+    """note와 자동 요약 결합 로직"""
+    if raw_note and auto_summary:
+        return f"{raw_note} | {auto_summary}"
+    if auto_summary:
+        return auto_summary
+    return raw_note
+
+
 @shared_task
 def generate_important_summary_task(
     moment_id: int,
@@ -56,8 +213,21 @@ def generate_important_summary_task(
 ) -> None:
     """
     Celery 작업: 중요한 구간 이미지에 대해 LLM 요약을 생성하고,
-    DB의 note를 업데이트한다. (브로드캐스트는 view에서 즉시 수행)
+    DB의 note를 업데이트한다. (브로드캐스트는 호출 측에서 수행)
+
+    - moment_id별 Redis 락(SET NX)으로 중복 실행을 막고
+    - note가 이미 raw_note와 달라졌으면(이전 실행에서 요약 반영) LLM을 다시 호출하지 않음
     """
+    lock_key = f"summary-lock:{moment_id}"
+    try:
+        locked = cache.add(lock_key, 1, timeout=SUMMARY_LOCK_TTL)
+    except Exception as e:
+        logger.warning("summary lock failed, running without lock: %s", e)
+        locked = None
+    if locked is False:
+        logger.info("skip duplicate summary task for moment %s", moment_id)
+        return
+
     try:
         # 워커 내에서 안전하게 DB 연결 사용
         close_old_connections()
@@ -67,6 +237,11 @@ def generate_important_summary_task(
         )
         session_obj = moment_obj.session
 
+        # 생성 시 note는 raw_note이므로 다르면 이미 요약이 반영된 상태
+        if moment_obj.note != raw_note:
+            logger.info("summary already applied for moment %s, skipping LLM", moment_id)
+            return
+
         auto_summary: Optional[str] = None
         if getattr(moment_obj, "screenshot_image", None):
             image_url = getattr(moment_obj.screenshot_image, "url", None)
@@ -74,22 +249,21 @@ def generate_important_summary_task(
                 "[AI DEBUG] generate_important_summary_task before summarize image_url=%s",
                 image_url,
             )
+            from .ai.prompt_templates import get_subject_info
+
+            subject_name = session_obj.course.code[:7]
             auto_summary = _ai_summarize_important_image_for_task(
                 image_path=image_url,
-                subject_name=session_obj.course.code[:7],
+                subject_name=subject_name,
+                # 과목 정보는 프로세스 내 LRU 캐시에서 조회 (워커에서는 대부분 DB 왕복 없음)
+                subject_info=get_subject_info(subject_name),
             )
         else:
             logger.info(
                 "[AI DEBUG] generate_important_summary_task: no screenshot_image, skipping LLM"
             )
 
-        # note와 자동 요약 결합 로직
-        if raw_note and auto_summary:
-            final_note_local = f"{raw_note} | {auto_summary}"
-        elif auto_summary:
-            final_note_local = auto_summary
-        else:
-            final_note_local = raw_note
+        final_note_local = _combine_note(raw_note, auto_summary)
 
         logger.info(
             "[AI DEBUG] generate_important_summary_task final_note decided auto_summary_present=%s final_note=%r",
@@ -98,9 +272,253 @@ def generate_important_summary_task(
         )
 
         if final_note_local != moment_obj.note:
-            moment_obj.note = final_note_local
-            moment_obj.save(update_fields=["note"])
+            # 단일 컬럼 갱신이므로 save() 대신 UPDATE 한 번 (시그널/인스턴스 저장 경로 생략)
+            ImportantMoment.objects.filter(pk=moment_id).update(note=final_note_local)
+            # 세션 종료 후에 요약이 끝난 경우 summary 캐시에 raw_note가 남지 않도록
+            invalidate_session_summary_cache(moment_obj.session_id)
     except Exception as e:  # pragma: no cover - 백그라운드 예외 로깅용
         logger.error("[AI DEBUG] generate_important_summary_task ERROR: %s", e)
+    finally:
+        if locked:
+            try:
+                cache.delete(lock_key)
+            except Exception as e:
+                logger.warning("summary lock release failed: %s", e)
+
+
+def _pop_summary_batch(session_id_str: str) -> list[dict]:
+    """세션 요약 대기 목록을 원자적으로 모두 꺼냄"""
+    key = f"summary-batch:{session_id_str}"
+    pipe = _get_redis().pipeline()
+    pipe.lrange(key, 0, -1)
+    pipe.delete(key)
+    raw_items, _ = pipe.execute()
+    return [json.loads(item) for item in raw_items]
+
+
+async def _summarize_images(jobs: list[tuple[str, str]]) -> list:
+    """(image_url, subject_name) 목록을 ImageSummaryBatcher로 함께 요약 (항목별 결과 또는 예외)"""
+    from .ai.summarize_image import asummarize_image
+
+    return await asyncio.gather(
+        *(asummarize_image(image_url, subject_name) for image_url, subject_name in jobs),
+        return_exceptions=True,
+    )
 
 
+@shared_task
+def generate_important_summaries_task(session_id_str: str) -> None:
+    """
+    Celery 작업: 세션에 쌓인 '중요해요' 요약 요청을 한 번에 처리한다.
+
+    - enqueue_important_summary가 쌓은 (moment_id, raw_note)를 모두 꺼내고
+    - moment별 락/중복 확인은 generate_important_summary_task와 동일
+    - 이미지들은 ImageSummaryBatcher가 번호를 붙여 한 번의 Gemini 호출로 요약
+      (배치 응답에서 빠진 항목은 개별 호출로 처리)
+    """
+    try:
+        items = _pop_summary_batch(session_id_str)
+    except Exception as e:
+        logger.error("summary batch pop failed for session %s: %s", session_id_str, e)
+        return
+    if not items:
+        return
+
+    close_old_connections()
+
+    locked_ids: list[int] = []
+    try:
+        raw_notes: dict[int, str] = {}
+        for item in items:
+            moment_id = item["moment_id"]
+            try:
+                locked = cache.add(f"summary-lock:{moment_id}", 1, timeout=SUMMARY_LOCK_TTL)
+            except Exception as e:
+                logger.warning("summary lock failed, running without lock: %s", e)
+                locked = None
+            if locked is False:
+                logger.info("skip duplicate summary task for moment %s", moment_id)
+                continue
+            if locked:
+                locked_ids.append(moment_id)
+            raw_notes[moment_id] = item["raw_note"]
+
+        moments = [
+            moment
+            for moment in ImportantMoment.objects.select_related("session__course")
+            .filter(id__in=raw_notes)
+            .order_by("id")
+            # 생성 시 note는 raw_note이므로 다르면 이미 요약이 반영된 상태
+            if moment.note == raw_notes[moment.id] and moment.screenshot_image
+        ]
+        if not moments:
+            return
+
+        subject_name = moments[0].session.course.code[:7]
+        results = async_to_sync(_summarize_images)(
+            [(moment.screenshot_image.url, subject_name) for moment in moments]
+        )
+
+        updated = False
+        for moment, result in zip(moments, results):
+            if isinstance(result, BaseException):
+                logger.error("[AI DEBUG] summary failed for moment %s: %s", moment.id, result)
+                continue
+            final_note = _combine_note(raw_notes[moment.id], result.strip() or None)
+            if final_note != moment.note:
+                ImportantMoment.objects.filter(pk=moment.id).update(note=final_note)
+                updated = True
+        if updated:
+            invalidate_session_summary_cache(session_id_str)
+    except Exception as e:  # pragma: no cover - 백그라운드 예외 로깅용
+        logger.error("[AI DEBUG] generate_important_summaries_task ERROR: %s", e)
+    finally:
+        for moment_id in locked_ids:
+            try:
+                cache.delete(f"summary-lock:{moment_id}")
+            except Exception as e:
+                logger.warning("summary lock release failed: %s", e)
+
+
+def stash_screenshot_upload(uploaded_file) -> Optional[str]:
+    """
+    업로드된 스크린샷 바이트를 Redis에 잠시 보관하고 키를 반환.
+    (캐시 장애 시 None -> 호출 측에서 요청 스레드에서 바로 저장)
+    """
+    key = f"screenshot-upload:{uuid.uuid4().hex}"
+    try:
+        uploaded_file.seek(0)
+        cache.set(key, uploaded_file.read(), timeout=SCREENSHOT_UPLOAD_TTL)
+    except Exception as e:
+        logger.warning("screenshot stash failed, saving in request: %s", e)
+        return None
+    return key
+
+
+@shared_task
+def store_screenshot_task(
+    moment_id: int,
+    upload_key: str,
+    broadcasts: list[tuple[str, dict]],
+    summarize: bool = False,
+    raw_note: str = "",
+) -> None:
+    """
+    Celery 작업: Redis에 보관된 스크린샷을 스토리지(GCS)에 저장한 뒤
+    WebSocket 브로드캐스트와 요약 작업 enqueue를 이어서 수행한다.
+
+    - 요청 스레드는 스토리지 업로드를 기다리지 않고 바로 응답
+    - 브로드캐스트는 업로드가 끝난 뒤 보내므로 클라이언트가 받은 capture_url은 항상 유효
+    """
+    close_old_connections()
+
+    data = cache.get(upload_key)
+    if data is None:
+        logger.error("screenshot upload %s expired before storing (moment=%s)", upload_key, moment_id)
+        return
+
+    moment_obj = ImportantMoment.objects.get(id=moment_id)
+    field_file = moment_obj.screenshot_image
+    saved_name = field_file.storage.save(field_file.name, ContentFile(data))
+    if saved_name != field_file.name:
+        moment_obj.screenshot_image.name = saved_name
+        moment_obj.save(update_fields=["screenshot_image"])
+    cache.delete(upload_key)
+
+    # 프로세스 공유 Broadcaster 루프에서 전송 (작업마다 이벤트 루프/Redis 연결을 새로 만들지 않음)
+    get_broadcaster().send(broadcasts).result(timeout=BROADCAST_TIMEOUT)
+
+    if summarize:
+        enqueue_important_summary(moment_id, moment_obj.session_id, raw_note)
+
+
+def _notify_question_processed(groups: list[str], question_id: int, stage: str) -> None:
+    """
+    질문 LLM 처리 완료 알림 (question_id/stage만 보내고, 내용은 클라이언트가 GET으로 조회)
+    """
+    message = {"type": "question_processed", "question_id": question_id, "stage": stage}
+    try:
+        get_broadcaster().send([(group, message) for group in groups]).result(
+            timeout=BROADCAST_TIMEOUT
+        )
+    except Exception as e:
+        logger.error("question_processed broadcast failed: %s", e)
+
+
+@shared_task
+def clean_question_task(
+    question_id: int,
+    original_text: str,
+    screenshot_url: Optional[str],
+    subject_name: Optional[str],
+    notify_groups: list[str],
+) -> None:
+    """
+    Celery 작업: 질문 텍스트 정제(submit_question_text의 비동기 처리).
+    결과를 DB에 반영한 뒤 notify_groups에 question_processed(stage="text")를 보내고
+    뷰에서 잡은 질문별 LLM 락을 해제한다.
+    """
+    try:
+        close_old_connections()
+
+        from .ai.clean import clean_question
+
+        try:
+            cleaned = clean_question(
+                question=original_text,
+                image_path=screenshot_url,
+                subject_name=subject_name,
+                temperature=0.3,
+            )
+        except Exception as e:
+            logger.error("Error in clean_question_task: %s", e)
+            cleaned = original_text.strip()
+
+        Question.objects.filter(pk=question_id).update(
+            original_text=original_text,
+            cleaned_text=cleaned,
+            status=Question.Status.TEXT_SUBMITTED,
+        )
+        _notify_question_processed(notify_groups, question_id, "text")
+    finally:
+        release_question_llm_lock(question_id)
+
+
+@shared_task
+def answer_question_task(
+    question_id: int,
+    cleaned_text: str,
+    screenshot_url: Optional[str],
+    subject_name: Optional[str],
+    notify_groups: list[str],
+) -> None:
+    """
+    Celery 작업: AI 답변 생성(request_ai_answer의 비동기 처리).
+    결과를 DB에 반영한 뒤 notify_groups에 question_processed(stage="ai_answer")를 보내고
+    뷰에서 잡은 질문별 LLM 락을 해제한다.
+    """
+    try:
+        close_old_connections()
+
+        from .ai.answer import answer_question
+
+        try:
+            answer = answer_question(
+                question=cleaned_text,
+                lecture_context=None,
+                image_path=screenshot_url,
+                subject_name=subject_name,
+                temperature=0.7,
+            )
+        except Exception as e:
+            logger.error("Error in answer_question_task: %s", e)
+            answer = "AI 조교가 현재 답변을 생성할 수 없습니다. 잠시 후 다시 시도해 주세요."
+
+        Question.objects.filter(pk=question_id).update(
+            cleaned_text=cleaned_text,
+            ai_answer=answer,
+            status=Question.Status.AI_ANSWERED,
+        )
+        _notify_question_processed(notify_groups, question_id, "ai_answer")
+    finally:
+        release_question_llm_lock(question_id)
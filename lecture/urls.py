@@ -63,11 +63,12 @@ urlpatterns = [
         views.list_session_questions,
         name="list_session_questions",
     ),
-    # path(
-    #     "questions/<int:question_id>/",
-    #     views.get_question,
-    #     name="get_question",
-    # ),
+    # Prefer: respond-async로 요청한 text/ai-answer 결과 조회용
+    path(
+        "questions/<int:question_id>/",
+        views.get_question,
+        name="get_question",
+    ),
 
     # '중요해요' + HARD capture
     path(
@@ -80,6 +81,11 @@ urlpatterns = [
         views.hard_threshold_capture,
         name="hard_threshold_capture",
     ),
+    path(
+        "sessions/<uuid:session_id>/screenshot-upload-url/",
+        views.create_screenshot_upload_url,
+        name="create_screenshot_upload_url",
+    ),
 
     # Summary
     path(
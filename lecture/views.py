@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import mimetypes
+import time
 from datetime import timedelta
 from uuid import UUID
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
-from django.db.models import Case, Count, When
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, When
+from django.db.models.functions import Coalesce
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from drf_spectacular.utils import (
@@ -16,13 +26,24 @@ from drf_spectacular.utils import (
 )
 from rest_framework import status
 from rest_framework.decorators import api_view, parser_classes
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 
 from .ai.answer import answer_question
 from .ai.clean import clean_question
 from .ai.summarize_image import summarize_image as summarize_important_image
-from .tasks import generate_important_summary_task
+from .broadcast import get_broadcaster
+from .feedback_writer import get_feedback_writer
+from .tasks import (
+    acquire_question_llm_lock,
+    answer_question_task,
+    clean_question_task,
+    enqueue_important_summary,
+    release_question_llm_lock,
+    stash_screenshot_upload,
+    store_screenshot_task,
+)
 from .models import (
     Course,
     FeedbackEvent,
@@ -30,6 +51,7 @@ from .models import (
     Question,
     Session,
     QuestionLike,
+    important_moment_screenshot_upload_path,
 )
 from .serializers import (
     AIAnswerResponseSerializer,
@@ -45,6 +67,8 @@ from .serializers import (
     QuestionSerializer,
     QuestionTextResponseSerializer,
     QuestionTextSubmitSerializer,
+    ScreenshotUploadUrlRequestSerializer,
+    ScreenshotUploadUrlResponseSerializer,
     SessionSerializer,
     SessionSummarySerializer,
     SimpleStatusResponseSerializer,
@@ -52,9 +76,22 @@ from .serializers import (
 )
 
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
 logger = logging.getLogger(__name__)
 
 
+def _json_bytes(data) -> bytes:
+    """JSON 직렬화 (orjson이 있으면 사용, DRF 기본 렌더러와 같은 compact/UTF-8 출력)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
 # ------------------------
 # 공통 유틸
 # ------------------------
@@ -74,8 +111,18 @@ def get_or_create_today_session_by_course_code(course_code: str) -> Session:
     교수/학생이 접속할 때,
     - 과목 code + 오늘 날짜 기준으로 Session 자동 생성/조회.
     """
-    course = get_object_or_404(Course, code=course_code)
     today = timezone.localdate()
+
+    # 대부분은 이미 생성된 세션이므로 course JOIN 한 번으로 조회 (SessionSerializer가 course도 사용)
+    session = (
+        Session.objects.select_related("course")
+        .filter(course__code=course_code, date=today)
+        .first()
+    )
+    if session is not None:
+        return session
+
+    course = get_object_or_404(Course, code=course_code)
     session, _ = Session.objects.get_or_create(
         course=course,
         date=today,
@@ -84,9 +131,96 @@ def get_or_create_today_session_by_course_code(course_code: str) -> Session:
     return session
 
 
+def group_send_many(messages: list[tuple[str, dict]]) -> None:
+    """
+    여러 그룹 메시지를 백그라운드 루프에서 동시에 group_send (요청 스레드는 기다리지 않음).
+    트랜잭션 안에서 호출되면 커밋 이후에 보냄 (클라이언트가 아직 커밋 안 된 데이터를 조회하지 않도록)
+    """
+    transaction.on_commit(lambda: get_broadcaster().send(messages))
+
+
+def get_direct_upload_key(request, session_id: UUID) -> str | None:
+    """
+    클라이언트가 서명 URL로 스토리지에 직접 올린 스크린샷의 객체 이름(screenshot_key) 확인.
+    (create_screenshot_upload_url에서 발급한 이 세션 폴더의 키이고, 업로드가 끝난 경우만 허용)
+    """
+    key = request.data.get("screenshot_key")
+    if not key:
+        return None
+
+    prefix = f"screenshots/{session_id.hex}/"
+    name = key[len(prefix):] if key.startswith(prefix) else ""
+    if not name or "/" in name or name.startswith("."):
+        raise ParseError("screenshot_key is invalid.")
+    if not default_storage.exists(key):
+        raise ParseError("screenshot_key is not uploaded.")
+    return key
+
+
+def save_moment_with_screenshot(
+    moment: ImportantMoment, screenshot, screenshot_key: str | None = None
+) -> str | None:
+    """
+    ImportantMoment를 저장하되, 스크린샷 스토리지 업로드는 가능하면 Celery로 넘긴다.
+
+    - 스토리지 경로(upload_to)는 요청 스레드에서 미리 정해두므로 capture_url은 바로 응답 가능
+      (GCS 공개 버킷 + GS_QUERYSTRING_AUTH=False라 URL이 경로로만 결정됨)
+    - 캐시(Redis) 장애 시에는 기존처럼 요청 스레드에서 바로 업로드
+    - screenshot_key가 있으면 이미 스토리지에 올라간 객체이므로 이름만 저장
+
+    Returns:
+        업로드를 Celery로 넘겼으면 Redis 보관 키, 바로 저장했거나 스크린샷이 없으면 None
+    """
+    if screenshot_key:
+        moment.screenshot_image.name = screenshot_key
+        moment.save()
+        return None
+
+    upload_key = stash_screenshot_upload(screenshot) if screenshot else None
+    if upload_key:
+        moment.screenshot_image.name = moment.screenshot_image.field.generate_filename(
+            moment, screenshot.name
+        )
+    else:
+        moment.screenshot_image = screenshot
+    moment.save()
+    return upload_key
+
+
+def dispatch_moment_events(
+    moment: ImportantMoment,
+    upload_key: str | None,
+    messages: list[tuple[str, dict]],
+    summarize: bool = False,
+    raw_note: str = "",
+) -> None:
+    """
+    ImportantMoment 저장 후 브로드캐스트/요약 enqueue.
+    업로드가 Celery로 넘어갔으면 업로드가 끝난 뒤 작업에서 수행 (학생이 404 URL을 받지 않도록)
+
+    트랜잭션 안에서 호출되면 브로드캐스트와 Celery enqueue 모두 커밋 이후에 수행
+    (워커/클라이언트가 아직 커밋 안 된 moment를 조회하거나, 롤백된 moment가 전송되지 않도록)
+    """
+
+    def dispatch() -> None:
+        if upload_key:
+            store_screenshot_task.delay(
+                moment.id, upload_key, messages, summarize=summarize, raw_note=raw_note
+            )
+            return
+
+        get_broadcaster().send(messages)
+        if summarize:
+            enqueue_important_summary(moment.id, moment.session_id, raw_note)
+
+    transaction.on_commit(dispatch)
+
+
+@functools.lru_cache(maxsize=4096)
 def get_session_group_name(session_id: UUID | str, role: str) -> str:
     """
     WebSocket 그룹 이름 (role: teacher or student)
+    (진행 중인 세션 수가 적으므로 결과 문자열을 재사용)
     """
     return f"session_{session_id}_{role}"
 
@@ -192,9 +326,62 @@ def list_courses(request):
     """
     과목 리스트 조회
     """
-    qs = Course.objects.all()
-    serializer = CourseSerializer(qs, many=True)
-    return Response(serializer.data)
+    return HttpResponse(get_course_list_json(), content_type="application/json")
+
+
+# 과목 목록은 import_courses로만 바뀌므로 직렬화 결과를 통째로 캐시
+_COURSE_LIST_CACHE_KEY = "courses:list"
+_COURSE_LIST_CACHE_TTL = 60 * 60
+
+# 프로세스 내 JSON 바이트 캐시 (expires_at, body)
+# - 다른 프로세스의 무효화는 전달되지 않으므로 TTL을 짧게 유지
+_COURSE_LIST_LOCAL_TTL = 30
+_course_list_local: tuple[float, bytes] | None = None
+
+
+def _load_course_list_data() -> list:
+    # CourseSerializer 필드가 모두 단순 컬럼이므로 모델 인스턴스/시리얼라이저 없이 dict로 바로 조회
+    return list(Course.objects.values(*CourseSerializer.Meta.fields))
+
+
+def get_course_list_data() -> list:
+    """
+    과목 리스트 직렬화 결과 (Redis 캐시, 캐시 장애 시 DB 직접 조회)
+    """
+    try:
+        return cache.get_or_set(
+            _COURSE_LIST_CACHE_KEY, _load_course_list_data, _COURSE_LIST_CACHE_TTL
+        )
+    except Exception as e:
+        logger.warning("course list cache unavailable: %s", e)
+        return _load_course_list_data()
+
+
+def get_course_list_json() -> bytes:
+    """
+    과목 리스트 JSON 응답 바이트 (프로세스 메모리 -> Redis -> DB 순으로 조회)
+    """
+    global _course_list_local
+    now = time.monotonic()
+    cached = _course_list_local
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    body = _json_bytes(get_course_list_data())
+    _course_list_local = (now + _COURSE_LIST_LOCAL_TTL, body)
+    return body
+
+
+def invalidate_course_list_cache() -> None:
+    """
+    과목 리스트 캐시 삭제 (Course 변경/import_courses 실행 후 호출)
+    """
+    global _course_list_local
+    _course_list_local = None
+    try:
+        cache.delete(_COURSE_LIST_CACHE_KEY)
+    except Exception as e:
+        logger.warning("course list cache invalidation failed: %s", e)
 
 
 @extend_schema(
@@ -208,9 +395,48 @@ def get_today_session(request, course_code: str):
     Path parameters:
     - `code` (string): 과목 코드-분반, 예: "COSE101-01"
     """
+    return Response(get_today_session_data(course_code))
+
+
+# 오늘 세션 직렬화 결과 캐시 (세션/과목 변경 시 signals에서 무효화)
+_TODAY_SESSION_CACHE_TTL = 60 * 60
+
+
+def _today_session_cache_key(course_code: str, date) -> str:
+    return f"today-session:{course_code}:{date}"
+
+
+def get_today_session_data(course_code: str) -> dict:
+    """
+    오늘 세션 직렬화 결과 (Redis 캐시, 캐시 장애 시 DB 직접 조회)
+    과목당 하루에 한 번 생성되고 is_active 외에는 바뀌지 않으므로 접속마다 DB를 조회하지 않음
+    """
+    key = _today_session_cache_key(course_code, timezone.localdate())
+    try:
+        data = cache.get(key)
+    except Exception as e:
+        logger.warning("today session cache unavailable: %s", e)
+        data = None
+    if data is not None:
+        return data
+
     session = get_or_create_today_session_by_course_code(course_code)
-    data = SessionSerializer(session).data
-    return Response(data)
+    data = dict(SessionSerializer(session).data)
+    try:
+        cache.set(key, data, _TODAY_SESSION_CACHE_TTL)
+    except Exception as e:
+        logger.warning("today session cache set failed: %s", e)
+    return data
+
+
+def invalidate_today_session_cache(course_code: str, date) -> None:
+    """
+    오늘 세션 캐시 삭제 (Session is_active 변경/삭제, Course 변경 시 호출)
+    """
+    try:
+        cache.delete(_today_session_cache_key(course_code, date))
+    except Exception as e:
+        logger.warning("today session cache invalidation failed: %s", e)
 
 
 @extend_schema(
@@ -246,16 +472,13 @@ def end_session(request, session_id: UUID):
     session.save(update_fields=["is_active"])
 
     # 웹소켓으로 세션 종료 알림
-    channel_layer = get_channel_layer()
     payload = {"type": "session_ended"}
 
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(session_id, "teacher"),
-        payload,
-    )
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(session_id, "student"),
-        payload,
+    group_send_many(
+        [
+            (get_session_group_name(session_id, "teacher"), payload),
+            (get_session_group_name(session_id, "student"), payload),
+        ],
     )
 
     return Response({"status": "ok"})
@@ -265,6 +488,43 @@ def end_session(request, session_id: UUID):
 # 피드백 (OK / HARD)
 # ------------------------
 
+# 같은 디바이스의 피드백 연타 방지 간격 (초)
+FEEDBACK_RATE_LIMIT_SECONDS = 3
+
+
+def _feedback_rate_limited(session_id, device_hash: str, now) -> bool:
+    """
+    간단 rate limit: FEEDBACK_RATE_LIMIT_SECONDS 이내 연타 방지.
+
+    - 기본: Redis SET NX EX (cache.add) 한 번으로 판단 (DB 조회 없음)
+    - 캐시 장애 시: 아직 DB에 쓰이지 않은 이벤트와 DB의 마지막 이벤트 시각으로 판단
+    """
+    try:
+        return not cache.add(
+            f"feedback-rate:{session_id}:{device_hash}",
+            1,
+            timeout=FEEDBACK_RATE_LIMIT_SECONDS,
+        )
+    except Exception as e:
+        logger.warning("feedback rate limit cache unavailable: %s", e)
+
+    last_created_at = get_feedback_writer().pending_created_at(session_id, device_hash)
+    if last_created_at is None:
+        last_created_at = (
+            FeedbackEvent.objects.filter(
+                session_id=session_id,
+                device_hash=device_hash,
+            )
+            .order_by("-created_at")
+            .values_list("created_at", flat=True)
+            .first()
+        )
+    return bool(
+        last_created_at
+        and (now - last_created_at).total_seconds() < FEEDBACK_RATE_LIMIT_SECONDS
+    )
+
+
 @extend_schema(
     request=FeedbackSubmitSerializer,
     responses={
@@ -294,30 +554,29 @@ def submit_feedback(request, session_id: UUID):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # 간단 rate limit: 3초 이내 연타 방지
-    last = FeedbackEvent.objects.filter(
-        session=session,
-        device_hash=device_hash,
-    ).order_by("-created_at").first()
+    feedback_writer = get_feedback_writer()
 
-    if last and (timezone.now() - last.created_at).total_seconds() < 3:
+    now = timezone.now()
+    if _feedback_rate_limited(session.id, device_hash, now):
         return Response(
             {"detail": "Too many requests."},
             status=status.HTTP_429_TOO_MANY_REQUESTS,
         )
 
-    event = FeedbackEvent.objects.create(
+    # INSERT는 FeedbackWriter가 짧은 구간 단위로 모아서 bulk_create
+    event = FeedbackEvent(
         session=session,
         device_hash=device_hash,
         feedback_type=feedback_type,
+        created_at=now,
     )
+    feedback_writer.submit(event)
 
     # WebSocket으로 교수(teacher 그룹)에 피드백 이벤트 쏘기
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
+    # - 몰려 들어오는 피드백은 100ms 단위로 묶어서 프레임 하나로 전송 (Broadcaster.send_feedback)
+    get_broadcaster().send_feedback(
         get_session_group_name(session_id, "teacher"),
         {
-            "type": "feedback_message",
             "feedback_type": feedback_type,
             "created_at": timezone.localtime(event.created_at).isoformat(),
         },
@@ -353,7 +612,8 @@ def start_question_intent(request, session_id: UUID):
     Request body:
     - 없음
     """
-    session = get_object_or_404(Session, id=session_id, is_active=True)
+    # 활성 여부 확인용이므로 id만 조회
+    session = get_object_or_404(Session.objects.only("id"), id=session_id, is_active=True)
     device_hash = get_device_hash(request)
 
     # original_text는 일단 빈 문자열로 placeholder
@@ -363,19 +623,24 @@ def start_question_intent(request, session_id: UUID):
         original_text="",
         status=Question.Status.INTENT,
     )
-
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(session_id, "teacher"),
-        {
-            "type": "question_intent",
-            "question_id": question.id,
-            "created_at": timezone.localtime(question.created_at).isoformat(),
-        },
+    # INSERT 시 정해진 created_at을 한 번만 변환해서 WebSocket/응답에 같이 사용
+    created_at = timezone.localtime(question.created_at).isoformat()
+
+    group_send_many(
+        [
+            (
+                get_session_group_name(session_id, "teacher"),
+                {
+                    "type": "question_intent",
+                    "question_id": question.id,
+                    "created_at": created_at,
+                },
+            )
+        ]
     )
 
     return Response(
-        {"question_id": question.id, "created_at": timezone.localtime(question.created_at).isoformat()},
+        {"question_id": question.id, "created_at": created_at},
         status=status.HTTP_201_CREATED,
     )
 
@@ -384,7 +649,7 @@ def start_question_intent(request, session_id: UUID):
     responses=QuestionCaptureResponseSerializer,
 )
 @api_view(["POST"])
-@parser_classes([MultiPartParser, FormParser])
+@parser_classes([MultiPartParser, FormParser, JSONParser])
 def upload_question_capture(request, question_id: int):
     """
     교수: question_intent를 받고 PPT 화면을 캡처해서 업로드.
@@ -397,44 +662,57 @@ def upload_question_capture(request, question_id: int):
 
     Request body (multipart/form-data):
     - `screenshot` (file, required): PPT 캡처 이미지
+      (또는 JSON/form `screenshot_key`: screenshot-upload-url로 직접 업로드한 객체 이름)
     """
     question = get_object_or_404(Question, id=question_id)
     session = question.session
 
     screenshot = request.FILES.get("screenshot")
-    if not screenshot:
+    screenshot_key = get_direct_upload_key(request, session.id)
+    if not screenshot and not screenshot_key:
         return Response(
             {"detail": "screenshot is required."},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    moment = ImportantMoment.objects.create(
+    moment = ImportantMoment(
         session=session,
         trigger="QUESTION",
         question=question,
-        screenshot_image=screenshot,
         note="",  # 원하면 "질문 시작 시점" 같은 문구 넣어도 됨
     )
 
-    capture_url = moment.screenshot_image.url
-    logger.info(
-        "[DEBUG] upload_question_capture saved: %s -> %s",
-        moment.screenshot_image.name,
-        capture_url,
-    )
+    # moment 생성과 질문의 캡처 URL 갱신을 한 트랜잭션으로 (브로드캐스트는 커밋 이후)
+    with transaction.atomic():
+        upload_key = save_moment_with_screenshot(moment, screenshot, screenshot_key)
 
+        capture_url = moment.screenshot_image.url
+        logger.info(
+            "[DEBUG] upload_question_capture saved: %s -> %s",
+            moment.screenshot_image.name,
+            capture_url,
+        )
 
-    # 학생 그룹 WebSocket으로도 브로드캐스트
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(session.id, "student"),
-        {
-            "type": "question_capture",
-            "question_id": question.id,
-            "capture_url": capture_url,
-            "created_at": timezone.localtime(moment.created_at).isoformat(),
-        },
-    )
+        # 이후 text/ai-answer/forward 단계에서 ImportantMoment를 다시 조회하지 않도록 질문에 저장
+        question.latest_capture_url = capture_url
+        question.save(update_fields=["latest_capture_url"])
+
+        # 학생 그룹 WebSocket으로도 브로드캐스트
+        dispatch_moment_events(
+            moment,
+            upload_key,
+            [
+                (
+                    get_session_group_name(session.id, "student"),
+                    {
+                        "type": "question_capture",
+                        "question_id": question.id,
+                        "capture_url": capture_url,
+                        "created_at": timezone.localtime(moment.created_at).isoformat(),
+                    },
+                )
+            ],
+        )
 
     return Response(
         {"question_id": question.id, "capture_url": capture_url},
@@ -442,12 +720,59 @@ def upload_question_capture(request, question_id: int):
     )
 
 
+def _get_question_for_llm(question_id: int) -> Question:
+    """
+    text/ai-answer 단계에서 쓰는 질문 조회.
+    subject_name 계산에 session.course.code를 쓰므로 한 번의 JOIN으로 함께 조회하되,
+    ai_answer 등 이후에 덮어쓸 TEXT 컬럼과 session/course의 나머지 컬럼은 가져오지 않음
+    """
+    return get_object_or_404(
+        Question.objects.select_related("session__course").only(
+            "id",
+            "device_hash",
+            "original_text",
+            "cleaned_text",
+            "latest_capture_url",
+            "session__id",
+            "session__course__id",
+            "session__course__code",
+        ),
+        id=question_id,
+    )
+
+
+def _prefers_async(request) -> bool:
+    """Prefer: respond-async 헤더가 있으면 LLM 처리를 Celery로 넘기고 202로 바로 응답"""
+    return "respond-async" in request.headers.get("Prefer", "")
+
+
+def _enqueue_question_task(task, **kwargs) -> bool:
+    """질문 LLM 작업 enqueue (브로커 장애 시 False -> 요청 스레드에서 동기 처리)"""
+    try:
+        task.apply_async(kwargs=kwargs)
+    except Exception as e:
+        logger.warning("%s enqueue failed, processing in request: %s", task.name, e)
+        return False
+    return True
+
+
+def _question_accepted_response(question_id: int) -> Response:
+    response = Response(
+        {"id": question_id, "status": "processing"},
+        status=status.HTTP_202_ACCEPTED,
+    )
+    response["Preference-Applied"] = "respond-async"
+    return response
+
+
 @extend_schema(
     request=QuestionTextSubmitSerializer,
     responses={
         200: QuestionTextResponseSerializer,
         400: OpenApiResponse(description="original_text is required."),
         403: OpenApiResponse(description="Invalid device."),
+        202: OpenApiResponse(description="Accepted (Prefer: respond-async)."),
+        409: OpenApiResponse(description="Question is already being processed."),
     },
 )
 @api_view(["POST"])
@@ -463,9 +788,11 @@ def submit_question_text(request, question_id: int):
 
     Headers:
     - `X-Device-Hash` (string, optional)
+    - `Prefer: respond-async` (optional): 정제를 Celery에서 수행하고 202로 바로 응답.
+      완료되면 student 그룹에 question_processed(stage="text") 이벤트 → GET /questions/<id>/로 조회
 
     """
-    question = get_object_or_404(Question, id=question_id)
+    question = _get_question_for_llm(question_id)
     device_hash = get_device_hash(request)
 
     original_text = request.data.get("original_text")
@@ -481,27 +808,49 @@ def submit_question_text(request, question_id: int):
     question.original_text = original_text
 
     # 캡처 URL 찾기
-    moment = (
-        ImportantMoment.objects.filter(question=question, trigger="QUESTION")
-        .order_by("-created_at")
-        .first()
-    )
-    screenshot_url = (
-        moment.screenshot_image.url if moment and moment.screenshot_image else None
-    )
+    screenshot_url = question.latest_capture_url or None
 
     no_capture = request.data.get("no_capture") is True
     final_screenshot_url = None if no_capture else screenshot_url
 
-    # clean만 수행 (이미지까지 같이 줌)
-    cleaned = ai_clean_question(
-        original_text,
-        final_screenshot_url,
-        subject_name=question.session.course.code[:7],
-    )
-    question.cleaned_text = cleaned
-    question.status = Question.Status.TEXT_SUBMITTED
-    question.save(update_fields=["original_text", "cleaned_text", "status"])
+    subject_name = question.session.course.code[:7]
+
+    # text/ai-answer가 겹치면 나중 요청이 앞선 결과를 덮어쓰므로 질문별로 하나만 처리
+    # (LLM 호출이 수 초씩 걸리므로 DB 행 잠금 대신 Redis 락, 비동기 처리 시에는 작업이 해제)
+    locked = acquire_question_llm_lock(question.id)
+    if locked is False:
+        return Response(
+            {"detail": "Question is already being processed."},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    if _prefers_async(request) and _enqueue_question_task(
+        clean_question_task,
+        question_id=question.id,
+        original_text=original_text,
+        screenshot_url=final_screenshot_url,
+        subject_name=subject_name,
+        notify_groups=[get_session_group_name(question.session_id, "student")],
+    ):
+        return _question_accepted_response(question.id)
+
+    try:
+        # clean만 수행 (이미지까지 같이 줌)
+        cleaned = ai_clean_question(
+            original_text,
+            final_screenshot_url,
+            subject_name=subject_name,
+        )
+        question.cleaned_text = cleaned
+        question.status = Question.Status.TEXT_SUBMITTED
+        Question.objects.filter(pk=question.pk).update(
+            original_text=question.original_text,
+            cleaned_text=cleaned,
+            status=question.status,
+        )
+    finally:
+        if locked:
+            release_question_llm_lock(question.id)
 
     return Response(
         {
@@ -518,6 +867,8 @@ def submit_question_text(request, question_id: int):
     responses={
         200: AIAnswerResponseSerializer,
         403: OpenApiResponse(description="Invalid device."),
+        202: OpenApiResponse(description="Accepted (Prefer: respond-async)."),
+        409: OpenApiResponse(description="Question is already being processed."),
     },
 )
 @api_view(["POST"])
@@ -533,9 +884,11 @@ def request_ai_answer(request, question_id: int):
 
     Headers:
     - `X-Device-Hash` (string, optional)
+    - `Prefer: respond-async` (optional): 답변 생성을 Celery에서 수행하고 202로 바로 응답.
+      완료되면 student 그룹에 question_processed(stage="ai_answer") 이벤트 → GET /questions/<id>/로 조회
 
     """
-    question = get_object_or_404(Question, id=question_id)
+    question = _get_question_for_llm(question_id)
     device_hash = get_device_hash(request)
 
     if question.device_hash != device_hash:
@@ -553,30 +906,50 @@ def request_ai_answer(request, question_id: int):
         cleaned_for_answer = question.original_text
 
     # 캡처 URL 찾기
-    moment = (
-        ImportantMoment.objects.filter(question=question, trigger="QUESTION")
-        .order_by("-created_at")
-        .first()
-    )
-    screenshot_url = (
-        moment.screenshot_image.url if moment and moment.screenshot_image else None
-    )
+    screenshot_url = question.latest_capture_url or None
 
     no_capture = request.data.get("no_capture") is True
     final_screenshot_url = None if no_capture else screenshot_url
 
-    # AI 답변 호출
-    answer = ai_answer_question(
-        cleaned_for_answer,
-        final_screenshot_url,
-        subject_name=question.session.course.code[:7],
-    )
+    subject_name = question.session.course.code[:7]
+
+    locked = acquire_question_llm_lock(question.id)
+    if locked is False:
+        return Response(
+            {"detail": "Question is already being processed."},
+            status=status.HTTP_409_CONFLICT,
+        )
 
-    # DB 업데이트: cleaned_text도 override_cleaned가 있으면 갱신
-    question.cleaned_text = cleaned_for_answer
-    question.ai_answer = answer
-    question.status = Question.Status.AI_ANSWERED
-    question.save(update_fields=["cleaned_text", "ai_answer", "status"])
+    if _prefers_async(request) and _enqueue_question_task(
+        answer_question_task,
+        question_id=question.id,
+        cleaned_text=cleaned_for_answer,
+        screenshot_url=final_screenshot_url,
+        subject_name=subject_name,
+        notify_groups=[get_session_group_name(question.session_id, "student")],
+    ):
+        return _question_accepted_response(question.id)
+
+    try:
+        # AI 답변 호출
+        answer = ai_answer_question(
+            cleaned_for_answer,
+            final_screenshot_url,
+            subject_name=subject_name,
+        )
+
+        # DB 업데이트: cleaned_text도 override_cleaned가 있으면 갱신
+        question.cleaned_text = cleaned_for_answer
+        question.ai_answer = answer
+        question.status = Question.Status.AI_ANSWERED
+        Question.objects.filter(pk=question.pk).update(
+            cleaned_text=cleaned_for_answer,
+            ai_answer=answer,
+            status=question.status,
+        )
+    finally:
+        if locked:
+            release_question_llm_lock(question.id)
 
     return Response(
         {
@@ -589,35 +962,22 @@ def request_ai_answer(request, question_id: int):
     )
 
 
-@extend_schema(
-    request=QuestionOverrideRequestSerializer,
-    responses=SimpleStatusResponseSerializer,
-)
-@api_view(["POST"])
-def forward_question_to_professor(request, question_id: int):
-    """
-    학생: 현재 상태의 질문(원문/정제/AI답변 + 캡처)을 교수에게 전달.
+def _json_response(data, status: int = 200) -> HttpResponse:
+    return HttpResponse(_json_bytes(data), status=status, content_type="application/json")
 
-    Path parameters:
-    - `id` (integer): Question ID
 
-    Request body:
-    - override_cleaned_text (string, optional): 교수에게 전달할 정제 텍스트를 덮어쓰고 싶을 때
+def _forward_question(question_id: int, override_cleaned: str | None) -> dict | None:
     """
-    question = get_object_or_404(Question, id=question_id)
-
-    # 학생이 수정한 clean 버전을 교수에게 바로 보내고 싶을 때 사용
-    override_cleaned = request.data.get("override_cleaned_text")
-
-    # 캡처 URL
-    moment = (
-        ImportantMoment.objects.filter(question=question, trigger="QUESTION")
-        .order_by("-created_at")
+    질문을 FORWARDED로 UPDATE 하고 WebSocket payload 반환 (질문이 없으면 None).
+    필요한 컬럼만 조회하고 저장은 UPDATE 한 번으로 처리
+    """
+    question = (
+        Question.objects.filter(id=question_id)
+        .only("id", "session_id", "original_text", "cleaned_text", "latest_capture_url")
         .first()
     )
-    screenshot_url = (
-        moment.screenshot_image.url if moment and moment.screenshot_image else None
-    )
+    if question is None:
+        return None
 
     # request_ai_answer와 동일한 로직으로 cleaned_for_answer 결정
     if override_cleaned:
@@ -627,33 +987,69 @@ def forward_question_to_professor(request, question_id: int):
     else:
         cleaned_for_answer = question.original_text
 
+    now = timezone.now()
+    updates = {
+        "forwarded_to_professor": True,
+        "status": Question.Status.FORWARDED,
+        "updated_at": now,
+    }
     # override가 있으면 DB의 cleaned_text도 함께 갱신
     if override_cleaned:
-        question.cleaned_text = cleaned_for_answer
+        updates["cleaned_text"] = cleaned_for_answer
+    Question.objects.filter(pk=question.pk).update(**updates)
 
-    question.forwarded_to_professor = True
-    question.status = Question.Status.FORWARDED
-    question.save()
-
-    # 교수 및 학생 그룹 WebSocket으로 알림
-    channel_layer = get_channel_layer()
-    payload = {
-        "type": "new_question",
-        "question_id": question.id,
-        "cleaned_text": cleaned_for_answer,
-        "capture_url": screenshot_url,
-        "created_at": timezone.localtime(question.updated_at).isoformat(),
+    return {
+        "session_id": question.session_id,
+        "payload": {
+            "type": "new_question",
+            "question_id": question.id,
+            "cleaned_text": cleaned_for_answer,
+            "capture_url": question.latest_capture_url or None,
+            "created_at": timezone.localtime(now).isoformat(),
+        },
     }
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(question.session_id, "teacher"),
-        payload,
-    )
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(question.session_id, "student"),
-        payload,
+
+
+@csrf_exempt
+@require_POST
+async def forward_question_to_professor(request, question_id: int):
+    """
+    학생: 현재 상태의 질문(원문/정제/AI답변 + 캡처)을 교수에게 전달.
+
+    Path parameters:
+    - `id` (integer): Question ID
+
+    Request body (JSON 또는 form):
+    - override_cleaned_text (string, optional): 교수에게 전달할 정제 텍스트를 덮어쓰고 싶을 때
+
+    본문 검증/직렬화가 필요 없는 브로드캐스트 전용 엔드포인트라
+    DRF(@api_view)를 거치지 않는 async Django view로 처리.
+    (DRF와 같이 CSRF 검사는 하지 않고, 응답 형식도 동일)
+    """
+    # 학생이 수정한 clean 버전을 교수에게 바로 보내고 싶을 때 사용
+    if request.content_type == "application/json":
+        try:
+            body = json.loads(request.body or b"{}")
+        except ValueError:
+            return _json_response({"detail": "JSON parse error"}, status=400)
+        override_cleaned = body.get("override_cleaned_text") if isinstance(body, dict) else None
+    else:
+        override_cleaned = request.POST.get("override_cleaned_text")
+
+    forwarded = await sync_to_async(_forward_question)(question_id, override_cleaned)
+    if forwarded is None:
+        return _json_response({"detail": "No Question matches the given query."}, status=404)
+
+    # 교수 및 학생 그룹 WebSocket으로 알림 (autocommit이므로 바로 백그라운드 전송)
+    session_id, payload = forwarded["session_id"], forwarded["payload"]
+    get_broadcaster().send(
+        [
+            (get_session_group_name(session_id, "teacher"), payload),
+            (get_session_group_name(session_id, "student"), payload),
+        ]
     )
 
-    return Response({"status": "ok"})
+    return _json_response({"status": "ok"})
 
 
 @extend_schema(
@@ -668,34 +1064,38 @@ def like_question(request, question_id: int):
     Path parameters:
     - `id` (integer): Question ID
     """
-    question = get_object_or_404(Question, id=question_id)
+    question = get_object_or_404(Question.objects.only("id", "session_id"), id=question_id)
     device_hash = get_device_hash(request)
 
-    # QuestionLike 생성 (이미 있으면 무시)
-    like, created = QuestionLike.objects.get_or_create(
-        question=question,
-        device_hash=device_hash,
-    )
+    # QuestionLike 생성 (이미 있으면 unique_together 위반으로 무시)
+    # get_or_create의 선행 SELECT/savepoint 없이 INSERT를 바로 시도
+    try:
+        with transaction.atomic():
+            QuestionLike.objects.create(question=question, device_hash=device_hash)
+            # 좋아요 전체 COUNT 대신 비정규화 카운터를 행 단위 UPDATE로 증가
+            Question.objects.filter(pk=question.pk).update(like_count=F("like_count") + 1)
+            like_count = Question.objects.values_list("like_count", flat=True).get(
+                pk=question.pk
+            )
+        created = True
+    except IntegrityError:
+        created = False
 
     if created:
         # "나도 궁금해요" 카운트 브로드캐스트
-        like_count = question.likes.count()
         session_id = question.session_id
 
-        channel_layer = get_channel_layer()
         payload = {
             "type": "question_like_update",
             "question_id": question.id,
             "like_count": like_count,
         }
         # 교수와 학생 모두에게 보낸다
-        async_to_sync(channel_layer.group_send)(
-            get_session_group_name(session_id, "teacher"),
-            payload,
-        )
-        async_to_sync(channel_layer.group_send)(
-            get_session_group_name(session_id, "student"),
-            payload,
+        group_send_many(
+            [
+                (get_session_group_name(session_id, "teacher"), payload),
+                (get_session_group_name(session_id, "student"), payload),
+            ],
         )
 
     return Response({"status": "ok"})
@@ -736,15 +1136,53 @@ def list_session_questions(request, session_id: UUID):
     Query parameters:
     - `forwarded_only` (string, optional): "true" 인 경우 교수에게 전달된 질문만
     """
-    session = get_object_or_404(Session, id=session_id)
     forwarded_only = request.query_params.get("forwarded_only") == "true"
 
-    qs = Question.objects.filter(session=session).order_by("created_at")
+    # session은 FK id만 직렬화하므로 JOIN/세션 조회 없이 session_id로 바로 필터,
+    # 목록은 행이 많으므로 모델 인스턴스/ModelSerializer 대신 dict 행으로 받아 직접 변환
+    qs = Question.objects.filter(session_id=session_id).order_by("created_at")
     if forwarded_only:
         qs = qs.filter(forwarded_to_professor=True)
 
-    serializer = QuestionSerializer(qs, many=True)
-    return Response(serializer.data)
+    questions = [_question_list_data(row) for row in qs.values(*_QUESTION_LIST_COLUMNS)]
+    # 질문이 없을 때만 세션 존재 여부 확인 (기존과 같이 없는 세션은 404)
+    if not questions and not Session.objects.filter(id=session_id).exists():
+        raise Http404("No Session matches the given query.")
+
+    return Response(questions)
+
+
+# QuestionSerializer.Meta.fields에 대응하는 컬럼 (session -> session_id)
+_QUESTION_LIST_COLUMNS = (
+    "id",
+    "session_id",
+    "device_hash",
+    "original_text",
+    "cleaned_text",
+    "ai_answer",
+    "forwarded_to_professor",
+    "status",
+    "like_count",
+    "created_at",
+    "updated_at",
+)
+
+
+def _question_list_data(row: dict) -> dict:
+    """values() 행 -> QuestionSerializer와 같은 응답 dict"""
+    return {
+        "id": row["id"],
+        "session": str(row["session_id"]),
+        "device_hash": row["device_hash"],
+        "original_text": row["original_text"],
+        "cleaned_text": row["cleaned_text"],
+        "ai_answer": row["ai_answer"],
+        "forwarded_to_professor": row["forwarded_to_professor"],
+        "status": Question.Status(row["status"]).name,
+        "like_count": row["like_count"],
+        "created_at": timezone.localtime(row["created_at"]).isoformat(),
+        "updated_at": timezone.localtime(row["updated_at"]).isoformat(),
+    }
 
 
 @extend_schema(
@@ -772,7 +1210,7 @@ def get_question(request, question_id: int):
     responses=ImportantMomentSimpleSerializer,
 )
 @api_view(["POST"])
-@parser_classes([MultiPartParser, FormParser])
+@parser_classes([MultiPartParser, FormParser, JSONParser])
 def mark_important(request, session_id: UUID):
     """
     교수: '중요해요' + PPT 캡쳐
@@ -787,50 +1225,52 @@ def mark_important(request, session_id: UUID):
     Request body (multipart/form-data):
     - `note` (string, optional): 메모, 예: "중요 개념"
     - `screenshot` (file, optional): PPT 캡처 이미지
+      (또는 JSON/form `screenshot_key`: screenshot-upload-url로 직접 업로드한 객체 이름)
     """
     session = get_object_or_404(Session, id=session_id, is_active=True)
 
     # 사용자가 직접 입력한 메모 (optional)
     raw_note = request.data.get("note", "") or ""
     screenshot = request.FILES.get("screenshot")
+    screenshot_key = get_direct_upload_key(request, session.id)
     logger.info(
         "[AI DEBUG] mark_important called session_id=%s has_screenshot=%s raw_note=%r",
         session_id,
-        bool(screenshot),
+        bool(screenshot or screenshot_key),
         raw_note,
     )
 
-    # 1차로 ImportantMoment를 생성해서 파일을 디스크에 저장
-    moment = ImportantMoment.objects.create(
+    # 1차로 ImportantMoment를 생성 (파일 업로드는 가능하면 Celery에서)
+    moment = ImportantMoment(
         session=session,
         trigger="MANUAL",
         note=raw_note,
-        screenshot_image=screenshot,
     )
+    upload_key = save_moment_with_screenshot(moment, screenshot, screenshot_key)
 
-    capture_url = moment.screenshot_image.url if screenshot else None
+    capture_url = moment.screenshot_image.url if moment.screenshot_image else None
     logger.info(
         "[AI DEBUG] mark_important saved ImportantMoment id=%s capture_url=%s",
         moment.id,
         capture_url,
     )
     
-    # 학생 그룹에  브로드캐스트
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(session_id, "student"),
-        {
-            "type": "important_message",
-            "note": raw_note,
-            "capture_url": capture_url,
-            "created_at": timezone.localtime(moment.created_at).isoformat(),
-        },
-    )
-
-    # Celery 비동기 작업으로 요약 생성 및 note 업데이트만 수행
-    generate_important_summary_task.delay(
-        moment_id=moment.id,
-        session_id_str=str(session_id),
+    # 학생 그룹에 브로드캐스트 + Celery 비동기 작업으로 요약 생성 및 note 업데이트
+    dispatch_moment_events(
+        moment,
+        upload_key,
+        [
+            (
+                get_session_group_name(session_id, "student"),
+                {
+                    "type": "important_message",
+                    "note": raw_note,
+                    "capture_url": capture_url,
+                    "created_at": timezone.localtime(moment.created_at).isoformat(),
+                },
+            )
+        ],
+        summarize=True,
         raw_note=raw_note,
     )
 
@@ -845,7 +1285,7 @@ def mark_important(request, session_id: UUID):
     responses=HardThresholdCaptureResponseSerializer,
 )
 @api_view(["POST"])
-@parser_classes([MultiPartParser, FormParser])
+@parser_classes([MultiPartParser, FormParser, JSONParser])
 def hard_threshold_capture(request, session_id: UUID):
     """
     교수(프론트): HARD가 threshold 넘었다고 판단했을 때
@@ -858,11 +1298,13 @@ def hard_threshold_capture(request, session_id: UUID):
 
     Request body (multipart/form-data):
     - `screenshot` (file, required): PPT 캡처 이미지
+      (또는 JSON/form `screenshot_key`: screenshot-upload-url로 직접 업로드한 객체 이름)
     """
     session = get_object_or_404(Session, id=session_id, is_active=True)
     screenshot = request.FILES.get("screenshot")
+    screenshot_key = get_direct_upload_key(request, session.id)
 
-    if not screenshot:
+    if not screenshot and not screenshot_key:
         return Response(
             {"detail": "screenshot is required."},
             status=status.HTTP_400_BAD_REQUEST,
@@ -871,12 +1313,12 @@ def hard_threshold_capture(request, session_id: UUID):
     # note는 현재 별도 입력 없이 빈 문자열로 저장
     note = ""
 
-    moment = ImportantMoment.objects.create(
+    moment = ImportantMoment(
         session=session,
         trigger="HARD",
-        screenshot_image=screenshot,
         note=note,
     )
+    upload_key = save_moment_with_screenshot(moment, screenshot, screenshot_key)
 
     capture_url = moment.screenshot_image.url
     logger.info(
@@ -884,7 +1326,6 @@ def hard_threshold_capture(request, session_id: UUID):
         moment.screenshot_image.name,
         capture_url,
     )
-    channel_layer = get_channel_layer()
     payload = {
         "type": "hard_alert",
         "capture_url": capture_url,
@@ -892,9 +1333,10 @@ def hard_threshold_capture(request, session_id: UUID):
     }
 
     # 학생에게만 알림
-    async_to_sync(channel_layer.group_send)(
-        get_session_group_name(session_id, "student"),
-        payload,
+    dispatch_moment_events(
+        moment,
+        upload_key,
+        [(get_session_group_name(session_id, "student"), payload)],
     )
 
     return Response(
@@ -903,10 +1345,93 @@ def hard_threshold_capture(request, session_id: UUID):
     )
 
 
+# 클라이언트 직접 업로드용 서명 PUT URL 유효 시간 (초)
+SCREENSHOT_UPLOAD_URL_TTL = 10 * 60
+
+
+@extend_schema(
+    request=ScreenshotUploadUrlRequestSerializer,
+    responses={
+        200: ScreenshotUploadUrlResponseSerializer,
+        400: OpenApiResponse(description="content_type must be an image type."),
+        501: OpenApiResponse(description="Direct upload is not supported."),
+    },
+)
+@api_view(["POST"])
+def create_screenshot_upload_url(request, session_id: UUID):
+    """
+    교수: 스크린샷을 스토리지(GCS)에 직접 올리기 위한 서명 PUT URL 발급.
+
+    클라이언트는 upload_url로 `Content-Type: <content_type>` PUT 업로드 후
+    capture / important / hard-threshold-capture 요청에 파일 대신 `screenshot_key`만 보낸다.
+    (이미지 바이트가 Django/Redis를 거치지 않음)
+
+    Path parameters:
+    - `id` (UUID): 세션 ID
+
+    Request body:
+    - content_type (string, optional): 업로드할 이미지 MIME 타입 (기본 image/png)
+    """
+    if not Session.objects.filter(id=session_id, is_active=True).exists():
+        raise Http404("No Session matches the given query.")
+
+    content_type = request.data.get("content_type") or "image/png"
+    extension = mimetypes.guess_extension(content_type)
+    if not content_type.startswith("image/") or not extension:
+        return Response(
+            {"detail": "content_type must be an image type."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # GoogleCloudStorage만 서명 업로드 URL을 지원 (로컬 FileSystemStorage 등은 multipart 업로드 사용)
+    bucket = getattr(default_storage, "bucket", None)
+    if bucket is None:
+        return Response(
+            {"detail": "Direct upload is not supported."},
+            status=status.HTTP_501_NOT_IMPLEMENTED,
+        )
+
+    # 업로드 경로 규칙은 ImageField(upload_to)와 동일
+    key = important_moment_screenshot_upload_path(
+        ImportantMoment(session_id=session_id), f"screenshot{extension}"
+    )
+    upload_url = bucket.blob(key).generate_signed_url(
+        version="v4",
+        expiration=timedelta(seconds=SCREENSHOT_UPLOAD_URL_TTL),
+        method="PUT",
+        content_type=content_type,
+    )
+    return Response(
+        {
+            "screenshot_key": key,
+            "upload_url": upload_url,
+            "content_type": content_type,
+            "expires_in": SCREENSHOT_UPLOAD_URL_TTL,
+        }
+    )
+
+
 # ------------------------
 # Summary
 # ------------------------
 
+def _count_subquery(queryset) -> Coalesce:
+    """OuterRef로 묶인 queryset의 행 수를 스칼라 서브쿼리로 (행이 없으면 0)"""
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values("session")
+            .annotate(n=Count("pk"))
+            .values("n")
+        ),
+        0,
+    )
+
+
+# 종료된 세션 summary 응답 캐시 TTL (초)
+SESSION_SUMMARY_CACHE_TTL = 60
+
+
 @extend_schema(
     responses=SessionSummarySerializer,
 )
@@ -917,27 +1442,57 @@ def session_summary(request, session_id: UUID):
 
     Path parameters:
     - `id` (UUID): 세션 ID
+
+    종료된 세션은 대시보드에서 반복 조회되므로 응답 JSON을 SESSION_SUMMARY_CACHE_TTL 동안 캐시
+    (세션 재활성화/요약 note 반영 시 삭제, 그 외 종료 후 변경(좋아요 등)은 TTL 안에서만 지연)
     """
-    session = get_object_or_404(Session, id=session_id)
+    cache_key = f"session-summary:{session_id}"
+    try:
+        cached = cache.get(cache_key)
+    except Exception as e:
+        logger.warning("session summary cache unavailable: %s", e)
+        cached = None
+    if cached is not None:
+        return HttpResponse(cached, content_type="application/json")
+
+    # 피드백/질문 개수는 세션 조회 쿼리에 서브쿼리로 함께 집계 (JOIN 곱셈 없이 1회 왕복)
+    forwarded_statuses = [Question.Status.FORWARDED, Question.Status.PROFESSOR_ANSWERED]
+    session = get_object_or_404(
+        Session.objects.select_related("course").annotate(
+            ok_count=_count_subquery(
+                FeedbackEvent.objects.filter(session=OuterRef("pk"), feedback_type="OK")
+            ),
+            hard_count=_count_subquery(
+                FeedbackEvent.objects.filter(session=OuterRef("pk"), feedback_type="HARD")
+            ),
+            question_count=_count_subquery(
+                Question.objects.filter(
+                    session=OuterRef("pk"), status__in=forwarded_statuses
+                )
+            ),
+        ),
+        id=session_id,
+    )
 
     if not session.is_active and not session.hardest_moments_calculated:
-        hard_moments = ImportantMoment.objects.filter(session=session, trigger="HARD")
-
-        moment_hard_counts = []
-        for moment in hard_moments:
-            start_time = moment.created_at - timedelta(minutes=1)
-            end_time = moment.created_at + timedelta(minutes=1)
-            hard_feedback_count = FeedbackEvent.objects.filter(
-                session=session,
-                feedback_type="HARD",
-                created_at__range=(start_time, end_time),
-            ).count()
-            moment_hard_counts.append((moment, hard_feedback_count))
-
-        moment_hard_counts.sort(key=lambda x: (x[1], x[0].created_at), reverse=True)
-
-        top_5_moments = [item[0] for item in moment_hard_counts[:5]]
-        top_5_moment_ids = [m.id for m in top_5_moments]
+        # HARD 캡처 전후 1분 동안의 HARD 피드백 수를 상관 서브쿼리로 한 번에 집계해서
+        # 상위 5개를 고름 (캡처마다 COUNT 쿼리를 보내지 않음)
+        window = timedelta(minutes=1)
+        top_5_moment_ids = list(
+            ImportantMoment.objects.filter(session=session, trigger="HARD")
+            .annotate(
+                hard_window_count=_count_subquery(
+                    FeedbackEvent.objects.filter(
+                        session=OuterRef("session"),
+                        feedback_type="HARD",
+                        created_at__gte=OuterRef("created_at") - window,
+                        created_at__lte=OuterRef("created_at") + window,
+                    )
+                )
+            )
+            .order_by("-hard_window_count", "-created_at")
+            .values_list("id", flat=True)[:5]
+        )
 
         if top_5_moment_ids:
             ImportantMoment.objects.filter(id__in=top_5_moment_ids).update(
@@ -947,85 +1502,109 @@ def session_summary(request, session_id: UUID):
         session.hardest_moments_calculated = True
         session.save(update_fields=["hardest_moments_calculated"])
 
+    # important moments
+    # 1. 교수님이 mark_import 한 ImportantMoment 전체
+    # 2. Question 나도 궁금해요 상위 5개 (동율이면 앞쪽걸로...) ImportantMoment
+    # 3. 5개의 Hardest ImportantMoment
+    # -> 세 조건을 OR로 묶어 한 번의 쿼리로 조회 후 시간 순 정렬
+    #    (상위 5개 질문 id도 별도 왕복 없이 IN (SELECT ... LIMIT 5) 서브쿼리로)
+
+    # id만 필요하므로 TEXT 컬럼(original_text, ai_answer 등)은 가져오지 않음
+    top_question_ids = (
+        Question.objects.filter(session=session, status__in=forwarded_statuses)
+        .order_by("-like_count", "created_at")
+        .values("id")[:5]
+    )
 
+    # question은 note로 쓸 cleaned_text만 필요하므로 LEFT JOIN으로 그 컬럼만 조회,
+    # 모델 인스턴스/FieldFile 없이 dict 행으로 받아 스토리지 파일 이름으로 바로 URL 생성
+    moments_qs = (
+        ImportantMoment.objects.filter(session=session)
+        .filter(
+            Q(trigger="MANUAL")
+            | Q(trigger="QUESTION", question_id__in=top_question_ids)
+            | Q(is_hardest=True)
+        )
+        .values(
+            "id",
+            "trigger",
+            "note",
+            "screenshot_image",
+            "created_at",
+            "question_id",
+            "is_hardest",
+            "question__cleaned_text",
+        )
+        .order_by("created_at")
+    )
 
+    summary = {
+        "date": session.date.isoformat(),
+        "course": {
+            "code": session.course.code,
+            "name": session.course.name,
+            "professor": session.course.professor,
+        },
+        "feedback": {"ok": session.ok_count, "hard": session.hard_count},
+        "question_count": session.question_count,
+    }
 
-    # feedback 집계
-    feedback_qs = FeedbackEvent.objects.filter(session=session)
-    total_ok = feedback_qs.filter(feedback_type="OK").count()
-    total_hard = feedback_qs.filter(feedback_type="HARD").count()
-
-    # 질문 집계
-    # 1. 전체 질문 개수
-    questions_qs = Question.objects.filter(
-        session=session,
-        status__in=[Question.Status.FORWARDED, Question.Status.PROFESSOR_ANSWERED],
-    )
-    question_count = questions_qs.count()
+    chunks = _stream_session_summary(summary, moments_qs)
+    if session.is_active:
+        # important_moments는 전체 리스트를 메모리에 쌓지 않고 행 단위로 직렬화해서 바로 전송
+        return StreamingHttpResponse(chunks, content_type="application/json")
 
+    body = b"".join(chunks)
+    try:
+        cache.set(cache_key, body, SESSION_SUMMARY_CACHE_TTL)
+    except Exception as e:
+        logger.warning("session summary cache set failed: %s", e)
+    return HttpResponse(body, content_type="application/json")
 
-    # important moments
-    # 1. 교수님이 mark_import 한 ImportantMoment 전체
-    manual_moments = ImportantMoment.objects.filter(session=session, trigger="MANUAL")
 
-    # 2. Question 나도 궁금해요 상위 5개 (동율이면 앞쪽걸로...) ImportantMoment
-    prioritized_statuses = [
-        Question.Status.FORWARDED,
-        Question.Status.PROFESSOR_ANSWERED,
-    ]
-    top_questions = (
-        Question.objects.filter(session=session, status__in=prioritized_statuses)
-        .annotate(
-            like_count=Count("likes"),
-        )
-        .order_by("-like_count", "created_at")[:5]
-    )
-    top_question_ids = [q.id for q in top_questions]
-    question_moments = ImportantMoment.objects.filter(
-        session=session, trigger="QUESTION", question_id__in=top_question_ids
-    )
+@functools.lru_cache(maxsize=4096)
+def _public_storage_url(name: str) -> str:
+    return default_storage.url(name)
 
-    # 3. 5개의 Hardest ImportantMoment
-    hardest_moments = ImportantMoment.objects.filter(session=session, is_hardest=True)
 
-    # 3가지 종류 조합 후 시간 순 정렬
-    moment_ids = set()
-    moment_ids.update(manual_moments.values_list("id", flat=True))
-    moment_ids.update(question_moments.values_list("id", flat=True))
-    moment_ids.update(hardest_moments.values_list("id", flat=True))
+def storage_file_url(name: str | None) -> str | None:
+    """
+    스토리지 파일 이름(FileField 컬럼 값)으로 URL 생성.
+    서명 URL을 쓰지 않는 설정(GS_QUERYSTRING_AUTH=False)에서는 파일 이름만으로 URL이 정해지므로
+    프로세스 내에 캐시해서 행마다 storage.url()(Blob 객체 생성)을 반복하지 않음.
+    """
+    if not name:
+        return None
+    if getattr(settings, "GS_QUERYSTRING_AUTH", True):
+        return default_storage.url(name)
+    return _public_storage_url(name)
+
+
+def _summary_moment_data(m: dict) -> dict:
+    return {
+        "id": m["id"],
+        "trigger": m["trigger"],
+        "note": (
+            m["question__cleaned_text"]
+            if m["trigger"] == "QUESTION" and m["question_id"] is not None
+            else m["note"]
+        ),
+        "capture_url": storage_file_url(m["screenshot_image"]),
+        "created_at": timezone.localtime(m["created_at"]).isoformat(),
+        "question_id": m["question_id"],
+        "is_hardest": m["is_hardest"],
+    }
 
-    moments_qs = (
-        ImportantMoment.objects.filter(id__in=list(moment_ids))
-        .select_related("question")
-        .order_by("created_at")
-    )
-    moments_data = [
-        {
-            "id": m.id,
-            "trigger": m.trigger,
-            "note": (
-                m.question.cleaned_text
-                if m.trigger == "QUESTION" and m.question
-                else m.note
-            ),
-            "capture_url": m.screenshot_image.url if m.screenshot_image else None,
-            "created_at": timezone.localtime(m.created_at).isoformat(),
-            "question_id": m.question_id,
-            "is_hardest": m.is_hardest,
-        }
-        for m in moments_qs
-    ]
 
-    return Response(
-        {
-            "date": session.date.isoformat(),
-            "course": {
-                "code": session.course.code,
-                "name": session.course.name,
-                "professor": session.course.professor,
-            },
-            "feedback": {"ok": total_ok, "hard": total_hard},
-            "question_count": question_count,
-            "important_moments": moments_data,
-        }
-    )
+def _stream_session_summary(summary: dict, moments_qs):
+    """
+    session_summary 응답 JSON을 조각 단위로 생성
+    {...summary 필드, "important_moments": [moment, ...]}
+    """
+    # summary 객체의 닫는 "}"를 떼고 important_moments 배열을 이어 붙임
+    yield _json_bytes(summary)[:-1] + b',"important_moments":['
+    separator = b""
+    for m in moments_qs.iterator(chunk_size=200):
+        yield separator + _json_bytes(_summary_moment_data(m))
+        separator = b","
+    yield b"]}"